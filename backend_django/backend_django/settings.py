@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import tempfile
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -45,6 +46,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # First, so its timings include the other middleware (see core/instrumentation.py)
+    'core.instrumentation.InstrumentationMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware', # Add WhiteNoise here
@@ -56,12 +59,41 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Proxies in front of the app whose X-Forwarded-For is trusted for the per-IP
+# bucket. Without it DRF keys the bucket on the whole header, which clients can
+# forge. Render (which sets RENDER) puts one load balancer in front of the app.
+if os.environ.get('NUM_PROXIES'):
+    NUM_PROXIES = int(os.environ['NUM_PROXIES'])
+else:
+    NUM_PROXIES = 1 if os.environ.get('RENDER') else None
+
+REST_FRAMEWORK = {
+    # Opt-in keyset pagination: only applied when ?cursor= or ?page_size= is passed
+    'DEFAULT_PAGINATION_CLASS': 'core.pagination.OptionalCursorPagination',
+    # Signed student tokens from /api/students/login/ (see core/auth.py)
+    'DEFAULT_AUTHENTICATION_CLASSES': [
+        'core.auth.StudentTokenAuthentication',
+        'rest_framework.authentication.SessionAuthentication',
+    ],
+    # Token buckets on registration creates (see core/throttling.py); set a rate to '' to turn it off
+    'DEFAULT_THROTTLE_RATES': {
+        'registration_student': os.environ.get('THROTTLE_STUDENT_RATE', '10/min') or None,
+        'registration_ip': os.environ.get('THROTTLE_IP_RATE', '300/min') or None,
+        'registration_endpoint': os.environ.get('THROTTLE_ENDPOINT_RATE', '100/s') or None,
+    },
+    'NUM_PROXIES': NUM_PROXIES,
+}
+# Lifetime of student tokens, in seconds
+AUTH_TOKEN_MAX_AGE = int(os.environ.get('AUTH_TOKEN_MAX_AGE', 7 * 24 * 60 * 60))
+
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",
     "http://127.0.0.1:5173",
     "https://campcon-52c5e.web.app",
     "https://campcon-52c5e.firebaseapp.com",
 ]
+# Lets the frontend read how long to back off after a 429
+CORS_EXPOSE_HEADERS = ['Retry-After']
 
 ROOT_URLCONF = 'backend_django.urls'
 
@@ -86,6 +118,9 @@ WSGI_APPLICATION = 'backend_django.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
 
+def env_flag(name, default):
+    return os.environ.get(name, str(default)).lower() in ('1', 'true', 'yes', 'on')
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
@@ -93,10 +128,82 @@ DATABASES = {
     }
 }
 
-# Render Database Config
-db_from_env = dj_database_url.config(conn_max_age=600)
+# Render Database Config (DATABASE_URL, e.g. Postgres)
+# Persistent connections with health checks by default; DB_POOL=true switches to
+# the native psycopg 3 connection pool instead (the two cannot be combined).
+db_from_env = dj_database_url.config(
+    conn_max_age=int(os.environ.get('DB_CONN_MAX_AGE', 600)),
+    conn_health_checks=True,
+)
+if db_from_env and env_flag('DB_POOL', False):
+    db_from_env['CONN_MAX_AGE'] = 0
+    db_from_env.setdefault('OPTIONS', {})['pool'] = {
+        'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 2)),
+        'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 20)),
+        'timeout': int(os.environ.get('DB_POOL_TIMEOUT', 10)),
+    }
 DATABASES['default'].update(db_from_env)
 
+# Single node SQLite tuning (SQLITE_TUNING=false restores the stock behaviour).
+# WAL lets readers run alongside the writer, IMMEDIATE transactions queue writers
+# on the busy timeout instead of failing with "database is locked" on lock upgrade.
+# Applied after the DATABASE_URL merge so these options never reach Postgres.
+# journal_mode=WAL is stored in the database file itself: the first connection
+# rewrites the header of db.sqlite3 (and adds -wal/-shm files next to it).
+if env_flag('SQLITE_TUNING', True) and DATABASES['default']['ENGINE'] == 'django.db.backends.sqlite3':
+    SQLITE_BUSY_TIMEOUT = int(os.environ.get('SQLITE_BUSY_TIMEOUT', 20))  # seconds
+    DATABASES['default']['OPTIONS'] = {
+        **DATABASES['default'].get('OPTIONS', {}),
+        'timeout': SQLITE_BUSY_TIMEOUT,
+        'transaction_mode': 'IMMEDIATE',
+        'init_command': (
+            'PRAGMA journal_mode=WAL;'
+            'PRAGMA synchronous=NORMAL;'
+            f"PRAGMA mmap_size={int(os.environ.get('SQLITE_MMAP_SIZE', 128 * 1024 * 1024))};"
+            'PRAGMA cache_size=-20000;'
+            'PRAGMA temp_store=MEMORY;'
+        ),
+    }
+
+
+# Cache
+# File based by default so every worker process on the node shares entries and
+# invalidations. Point CACHE_BACKEND/CACHE_LOCATION elsewhere (e.g. Redis) if needed.
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.filebased.FileBasedCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', os.path.join(tempfile.gettempdir(), 'campcon-cache')),
+    }
+}
+
+# Placement/event catalog responses are invalidated by signals, so this is only a safety net
+CATALOG_CACHE_TIMEOUT = int(os.environ.get('CATALOG_CACHE_TIMEOUT', 60 * 60))
+
+# Throttle buckets are touched on every registration, so they stay in memory
+# (per worker process) unless pointed at a shared cache such as Redis.
+CACHES['throttle'] = {
+    'BACKEND': os.environ.get('THROTTLE_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+    'LOCATION': os.environ.get('THROTTLE_CACHE_LOCATION', 'campcon-throttle'),
+}
+THROTTLE_CACHE = 'throttle'
+
+# Registration creates in flight per worker process before new ones get a 429
+# (0 = no limit), how long a request may wait for a slot, and the Retry-After
+# sent when it gets none.
+REGISTRATION_MAX_CONCURRENCY = int(os.environ.get('REGISTRATION_MAX_CONCURRENCY', 8))
+REGISTRATION_ADMISSION_TIMEOUT = float(os.environ.get('REGISTRATION_ADMISSION_TIMEOUT', 0.05))
+REGISTRATION_RETRY_AFTER = int(os.environ.get('REGISTRATION_RETRY_AFTER', 1))
+
+# Per request timings (core/instrumentation.py): sent back in a Server-Timing
+# header, and aggregated at /api/metrics/ for the addresses listed here.
+SERVER_TIMING = env_flag('SERVER_TIMING', True)
+# Behind a reverse proxy on the same host every request arrives from 127.0.0.1:
+# set NUM_PROXIES so the client's own address is checked (until then requests
+# with an X-Forwarded-For header are refused), or give the scraper a
+# METRICS_TOKEN to send as the X-Metrics-Token header.
+METRICS_ALLOWED_IPS = os.environ.get('METRICS_ALLOWED_IPS', '127.0.0.1,::1').split(',')
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -117,6 +224,19 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# PBKDF2 work factor for student (and admin) passwords. Each login costs about
+# this many SHA-256 rounds of CPU; lower it if login bursts at semester start
+# saturate the workers, raise it as hardware allows. Stored hashes follow the
+# setting at each user's next login.
+PASSWORD_HASH_ITERATIONS = int(os.environ.get('PASSWORD_HASH_ITERATIONS', 600000))
+PASSWORD_HASHERS = [
+    'core.hashers.TunablePBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
 # Internationalization
 # https://docs.djangoproject.com/en/6.0/topics/i18n/
 
@@ -140,6 +260,11 @@ STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Chunked resume uploads: partial files are assembled here, then moved into media storage
+RESUME_UPLOAD_DIR = os.environ.get('RESUME_UPLOAD_DIR', os.path.join(tempfile.gettempdir(), 'campcon-uploads'))
+RESUME_UPLOAD_MAX_SIZE = int(os.environ.get('RESUME_UPLOAD_MAX_SIZE', 10 * 1024 * 1024))
+RESUME_UPLOAD_MAX_CHUNK = int(os.environ.get('RESUME_UPLOAD_MAX_CHUNK', 1024 * 1024))
+
 
 # Email Configuration
 # Console backend disabled as per user request
@@ -0,0 +1,127 @@
+from django.conf import settings
+from django.core import signing
+from django.utils.crypto import constant_time_compare
+from rest_framework import authentication, exceptions, permissions
+from rest_framework.settings import api_settings
+
+# Tokens are signed with SECRET_KEY and carry the student id and issue time,
+# so verifying one is an HMAC check: no database or cache lookup per request.
+# They cannot be revoked one by one; AUTH_TOKEN_MAX_AGE bounds their life and
+# rotating SECRET_KEY revokes them all.
+TOKEN_SALT = 'core.auth.student-token'
+# Calendar apps keep a subscription URL for good and cannot send headers, so
+# feed tokens go in the URL and never expire; they only open the .ics feed.
+FEED_TOKEN_SALT = 'core.auth.calendar-feed'
+
+
+class StudentPrincipal:
+    """request.user for a token-authenticated student; the Student row is only loaded when asked for."""
+
+    is_authenticated = True
+    is_anonymous = False
+    is_staff = False
+
+    def __init__(self, student_id):
+        self.student_id = student_id
+        self.pk = student_id
+
+    def __str__(self):
+        return f'student {self.student_id}'
+
+
+def issue_token(student):
+    return signing.dumps({'student': student.pk}, salt=TOKEN_SALT, compress=False)
+
+
+def read_token(token):
+    """Returns the student id in a valid, unexpired token, else None."""
+    try:
+        payload = signing.loads(token, salt=TOKEN_SALT, max_age=settings.AUTH_TOKEN_MAX_AGE)
+    except signing.BadSignature:
+        return None
+    return payload.get('student')
+
+
+def issue_feed_token(student):
+    return signing.dumps({'student': student.pk}, salt=FEED_TOKEN_SALT, compress=False)
+
+
+def read_feed_token(token):
+    """Returns the student id in a valid feed token, else None."""
+    try:
+        payload = signing.loads(token, salt=FEED_TOKEN_SALT)
+    except signing.BadSignature:
+        return None
+    return payload.get('student')
+
+
+class StudentTokenAuthentication(authentication.BaseAuthentication):
+    """`Authorization: Bearer <token>` as returned by POST /api/students/login/."""
+
+    keyword = 'Bearer'
+
+    def authenticate(self, request):
+        parts = authentication.get_authorization_header(request).split()
+        if not parts or parts[0].decode().lower() != self.keyword.lower():
+            return None
+        if len(parts) != 2:
+            raise exceptions.AuthenticationFailed('Invalid token header.')
+        student_id = read_token(parts[1].decode())
+        if student_id is None:
+            raise exceptions.AuthenticationFailed('Invalid or expired token.')
+        return StudentPrincipal(student_id), parts[1].decode()
+
+    def authenticate_header(self, request):
+        return self.keyword
+
+
+class IsOwnStudent(permissions.BasePermission):
+    """
+    Writes on a student's behalf need that student's token.
+
+    The student is the object itself on a Student, or the `student` of the
+    request body on a create. Admin screens have no backend sign-in yet, so
+    the admin-only routes stay open.
+    """
+
+    message = 'Sign in as this student to do this.'
+
+    def has_permission(self, request, view):
+        student_id = getattr(request.user, 'student_id', None)
+        if student_id is None:
+            return False
+        if view.action == 'create':
+            student = request.data.get('student') if isinstance(request.data, dict) else None
+            return str(student) == str(student_id)
+        return True
+
+    def has_object_permission(self, request, view, obj):
+        return obj.pk == request.user.student_id
+
+
+def client_ip(request):
+    """REMOTE_ADDR, or with NUM_PROXIES trusted proxies, the address they saw in X-Forwarded-For."""
+    num_proxies = api_settings.NUM_PROXIES
+    forwarded = request.META.get('HTTP_X_FORWARDED_FOR')
+    if num_proxies and forwarded:
+        addresses = [address.strip() for address in forwarded.split(',')]
+        return addresses[-min(num_proxies, len(addresses))]
+    return request.META.get('REMOTE_ADDR')
+
+
+class LocalOnly(permissions.BasePermission):
+    """
+    Requests from settings.METRICS_ALLOWED_IPS only (the host itself by
+    default), or with the settings.METRICS_TOKEN as X-Metrics-Token.
+
+    A request forwarded by a proxy that is not trusted (NUM_PROXIES unset) is
+    refused: its REMOTE_ADDR is the proxy's, often 127.0.0.1 on the same host.
+    """
+
+    def has_permission(self, request, view):
+        token = settings.METRICS_TOKEN
+        if token and constant_time_compare(request.headers.get('X-Metrics-Token', ''), token):
+            return True
+        if not api_settings.NUM_PROXIES and 'HTTP_X_FORWARDED_FOR' in request.META:
+            return False
+        return client_ip(request) in settings.METRICS_ALLOWED_IPS
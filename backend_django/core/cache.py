@@ -0,0 +1,97 @@
+import hashlib
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.cache import patch_cache_control
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+
+def _state_key(catalog):
+    return f'catalog:{catalog}:state'
+
+
+def get_catalog_state(catalog):
+    """Returns (version, last_modified_timestamp) for a catalog, initialising it if needed."""
+    state = cache.get(_state_key(catalog))
+    if state is None:
+        state = (uuid.uuid4().hex, int(time.time()))
+        # add() so concurrent first readers agree on one version
+        if not cache.add(_state_key(catalog), state, timeout=None):
+            state = cache.get(_state_key(catalog), state)
+    return state
+
+
+def invalidate_catalog(*catalogs):
+    """
+    Starts a new version for each catalog once the current transaction
+    commits; responses cached under older versions are never read again.
+
+    Bumping any earlier would let a concurrent reader, still seeing the old
+    rows, cache them under the new version.
+    """
+    transaction.on_commit(lambda: _bump(catalogs))
+
+
+def _bump(catalogs):
+    now = int(time.time())
+    for catalog in catalogs:
+        previous = cache.get(_state_key(catalog))
+        # Last-Modified has one second resolution: never reuse a second an
+        # older version was served with, or If-Modified-Since would get a 304
+        last_modified = max(now, previous[1] + 1) if previous else now
+        cache.set(_state_key(catalog), (uuid.uuid4().hex, last_modified), timeout=None)
+
+
+class CachedCatalogMixin:
+    """
+    Caches list/retrieve responses of read-heavy viewsets.
+
+    Entries are keyed by the catalog version and the full request path, so
+    query params (fields, expand, cursor...) get their own entries. Every
+    response carries an ETag and Last-Modified and conditional requests are
+    answered with 304 without touching the database. Model signals
+    (core/signals.py) bump the version once a write commits.
+    """
+    cache_catalog = None
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(request, super().retrieve, *args, **kwargs)
+
+    def cached_response(self, request, view, *args, **kwargs):
+        version, last_modified = get_catalog_state(self.cache_catalog)
+        path_hash = hashlib.md5(f'{request.get_full_path()}|{request.accepted_media_type}'.encode()).hexdigest()
+        etag = quote_etag(f'{version[:12]}-{path_hash[:12]}')
+
+        if self.not_modified(request, etag, last_modified):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            key = f'catalog:{self.cache_catalog}:{version}:{path_hash}'
+            data = cache.get(key)
+            if data is not None:
+                response = Response(data)
+            else:
+                response = view(request, *args, **kwargs)
+                if response.status_code != status.HTTP_200_OK:
+                    return response
+                cache.set(key, response.data, timeout=settings.CATALOG_CACHE_TIMEOUT)
+
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        # Let browsers keep a copy but revalidate it (cheap 304s) on every use
+        patch_cache_control(response, no_cache=True)
+        return response
+
+    def not_modified(self, request, etag, last_modified):
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match:
+            return etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*'
+        if_modified_since = parse_http_date_safe(request.headers.get('If-Modified-Since') or '')
+        return if_modified_since is not None and last_modified <= if_modified_since
@@ -0,0 +1,68 @@
+from datetime import datetime, time
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+
+
+def parse_date_param(name, value, end_of_day=False):
+    """Parses an ISO date or datetime query param into an aware datetime."""
+    # Dates first: parse_datetime() also accepts a bare date, as midnight
+    try:
+        day = parse_date(value)
+    except ValueError:
+        day = None
+    if day is not None:
+        parsed = datetime.combine(day, time.max if end_of_day else time.min)
+    else:
+        try:
+            parsed = parse_datetime(value)
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise ValidationError({name: f"Invalid date '{value}'. Use YYYY-MM-DD or an ISO datetime."})
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+class RegistrationFilterMixin:
+    """
+    Server-side filtering for registration list endpoints.
+
+    `filter_fields` maps query params to model lookups, e.g. ?student=12&status=Applied.
+    ?registered_after= / ?registered_before= bound `registered_at` (inclusive).
+
+    An id or status filter is served by the composite index that leads with
+    it, and a date range alone by the (registered_at, id) index. role_name
+    has no index of its own: combine it with ?placement= (or filter by ?role=).
+    """
+    filter_fields = {}
+    id_filter_fields = ()
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        filters = self.registration_filters(self.request.query_params)
+        if filters:
+            queryset = queryset.filter(**filters)
+        return queryset
+
+    def registration_filters(self, params):
+        """Lookups for the given params (query params, or a JSON object for bulk actions)."""
+        filters = {}
+        for param, lookup in self.filter_fields.items():
+            value = params.get(param)
+            if value in (None, ''):
+                continue
+            value = str(value)
+            if param in self.id_filter_fields and not value.isdigit():
+                raise ValidationError({param: f"Expected a numeric id, got '{value}'."})
+            filters[lookup] = value
+
+        registered_after = params.get('registered_after')
+        if registered_after:
+            filters['registered_at__gte'] = parse_date_param('registered_after', registered_after)
+        registered_before = params.get('registered_before')
+        if registered_before:
+            filters['registered_at__lte'] = parse_date_param('registered_before', registered_before, end_of_day=True)
+        return filters
@@ -0,0 +1,98 @@
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+
+from . import metrics
+
+# Per request: wall time, DB queries and their time (counted by a
+# connection.execute_wrapper), serializer time and response size. Totals go
+# to core/metrics.py by route (the URL name, e.g. placementregistration-list),
+# so /api/metrics/prometheus/ shows which endpoint's query count is creeping
+# up. The request's own numbers are sent back in a Server-Timing header, which
+# browser devtools display under Timing.
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+current_request = ContextVar('current_request', default=None)
+
+
+class RequestStats:
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.serialize_time = 0.0
+        self.serializing = False
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_time += time.perf_counter() - start
+
+
+@contextmanager
+def serializing():
+    """Adds the enclosed time to the request's serializer time; nested serializers are not counted twice."""
+    stats = current_request.get()
+    if stats is None or stats.serializing:
+        yield
+        return
+    stats.serializing = True
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.serialize_time += time.perf_counter() - start
+        stats.serializing = False
+
+
+def server_timing(total, stats):
+    return (
+        f'total;dur={total * 1000:.1f}, '
+        f'db;dur={stats.db_time * 1000:.1f};desc="{stats.queries} queries", '
+        f'serialize;dur={stats.serialize_time * 1000:.1f}'
+    )
+
+
+class InstrumentationMiddleware:
+    """
+    Times every request; should come first in MIDDLEWARE so the others are included.
+
+    Streaming responses (exports, resume bundles) are timed up to their first
+    byte and their size is not known.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        stats = RequestStats()
+        token = current_request.set(stats)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(stats))
+                response = self.get_response(request)
+        finally:
+            current_request.reset(token)
+        total = time.perf_counter() - start
+
+        match = request.resolver_match
+        labels = {'route': match.view_name if match else '<unmatched>', 'method': request.method}
+        metrics.inc('http_requests', status=str(response.status_code), **labels)
+        metrics.observe('http_request_duration_seconds', total, LATENCY_BUCKETS, **labels)
+        metrics.observe('http_request_db_queries', stats.queries, QUERY_BUCKETS, **labels)
+        metrics.inc('http_request_db_seconds', stats.db_time, **labels)
+        metrics.inc('http_request_serializer_seconds', stats.serialize_time, **labels)
+        if not response.streaming:
+            metrics.inc('http_response_bytes', len(response.content), **labels)
+        if settings.SERVER_TIMING:
+            response['Server-Timing'] = server_timing(total, stats)
+        return response
@@ -0,0 +1,160 @@
+import http.client
+import json
+import logging
+import random
+import re
+import threading
+from collections import Counter
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+
+from core.auth import issue_token
+from core.management.commands.bench_db import describe_backend
+from core.models import Placement, PlacementRole, Student
+from core.utils import synthetic
+from core.utils.benchmarks import live_server, run_concurrently, summarize, throwaway_database, write_json
+
+SEARCH_WORDS = ['software', 'data', 'cloud', 'hackathon', 'tech', 'engineer', 'quiz', 'analyst']
+
+
+def endpoints(rng, placement_ids, tokens, roles):
+    """
+    Name -> function returning (method, path, body) for one request, plus
+    extra headers where needed. `tokens` maps student ids to their tokens.
+    """
+    student_ids = list(tokens)
+
+    def registration():
+        placement_id, role_name = rng.choice(roles)
+        student_id = rng.choice(student_ids)
+        return 'POST', '/api/registrations/placements/?expand=', {
+            'student': student_id, 'placement': placement_id, 'role_name': role_name,
+        }, {'Authorization': f'Bearer {tokens[student_id]}'}
+
+    return {
+        'placements': lambda: ('GET', '/api/placements/', None),
+        'placement': lambda: ('GET', f'/api/placements/{rng.choice(placement_ids)}/', None),
+        'placement_seats': lambda: ('GET', f'/api/placements/{rng.choice(placement_ids)}/seats/', None),
+        'events': lambda: ('GET', '/api/events/', None),
+        'student_registrations': lambda: ('GET', f'/api/registrations/placements/?student={rng.choice(student_ids)}', None),
+        'drive_registrations': lambda: ('GET', f'/api/registrations/placements/?placement={rng.choice(placement_ids)}&page_size=50', None),
+        'role_stats': lambda: ('GET', '/api/placement-roles/stats/', None),
+        'search': lambda: ('GET', f'/api/search/?q={rng.choice(SEARCH_WORDS)}', None),
+        'analytics': lambda: ('GET', '/api/analytics/', None),
+        'register': registration,
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        'Load-tests the main /api/ endpoints over HTTP on a throwaway database seeded with synthetic data: '
+        'requests/s, p50/p95/p99 latency and SQL queries per request for each endpoint'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, default=5000, help='Synthetic students (default: 5000)')
+        parser.add_argument('--placements', type=int, default=100, help='Synthetic placement drives (default: 100)')
+        parser.add_argument('--events', type=int, default=20, help='Synthetic events (default: 20)')
+        parser.add_argument('--registrations', type=int, default=50000, help='Synthetic registrations (default: 50000)')
+        parser.add_argument('--requests', type=int, default=200, help='Requests per endpoint (default: 200)')
+        parser.add_argument('--workers', type=int, default=8, help='Concurrent clients (default: 8)')
+        parser.add_argument('--endpoints', help='Comma separated endpoints to run (default: all)')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--json', dest='json_path', help='Also write the results to this JSON file')
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        # Server-Timing carries each response's query count; admission control would
+        # turn the register burst into 429s; a private cache keeps the real one out of it
+        bench_settings = override_settings(
+            SERVER_TIMING=True,
+            REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': {}},
+            REGISTRATION_MAX_CONCURRENCY=0,
+            CACHES={
+                'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'bench-api'},
+                'throttle': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'bench-api-throttle'},
+            },
+        )
+        # Duplicate registrations are expected 400s; keep them out of the log
+        logging.getLogger('django.request').setLevel(logging.ERROR)
+
+        with bench_settings, throwaway_database(), live_server() as base_url:
+            backend = describe_backend()
+            seeded = synthetic.generate(
+                students=options['students'], placements=options['placements'], events=options['events'],
+                registrations=options['registrations'], seed=options['seed'],
+            )
+            self.stdout.write(f"Backend: {backend}")
+            self.stdout.write(f"Seeded: {seeded}")
+
+            scenarios = endpoints(
+                rng,
+                list(Placement.objects.values_list('id', flat=True)),
+                {student.pk: issue_token(student) for student in Student.objects.only('id')},
+                list(PlacementRole.objects.values_list('placement_id', 'name')),
+            )
+            selected = options['endpoints'].split(',') if options['endpoints'] else list(scenarios)
+            unknown = set(selected) - set(scenarios)
+            if unknown:
+                raise CommandError(f"Unknown endpoints: {', '.join(sorted(unknown))} (choose from {', '.join(scenarios)})")
+
+            results = {}
+            for name in selected:
+                results[name] = self.run_endpoint(base_url, [scenarios[name]() for _ in range(options['requests'])], options['workers'])
+                result = results[name]
+                self.stdout.write(
+                    f"{name:24} {result['throughput_per_s']:>8}/s  p50 {result['p50_ms']:>8}ms  p95 {result['p95_ms']:>8}ms  "
+                    f"p99 {result['p99_ms']:>8}ms  queries {result['queries_mean']:>6} (max {result['queries_max']})  {result['statuses']}"
+                )
+
+        if options['json_path']:
+            write_json(options['json_path'], {
+                'backend': backend, 'seeded': seeded, 'workers': options['workers'], 'seed': options['seed'], 'endpoints': results,
+            })
+        failed = {name: result['errors'] for name, result in results.items() if result['errors']}
+        if failed:
+            raise CommandError(f'Requests failed: {failed}')
+
+    def run_endpoint(self, base_url, requests, workers):
+        host = urlsplit(base_url).netloc
+        local = threading.local()
+        lock = threading.Lock()
+        statuses = Counter()
+        queries = []
+
+        def send(request):
+            method, path, body, *extra = request
+            # One keep-alive connection per client thread
+            if not hasattr(local, 'connection'):
+                local.connection = http.client.HTTPConnection(host, timeout=60)
+            headers = dict(extra[0]) if extra else {}
+            if body is not None:
+                headers['Content-Type'] = 'application/json'
+            try:
+                local.connection.request(method, path, json.dumps(body) if body is not None else None, headers)
+                response = local.connection.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, OSError):
+                del local.connection
+                raise
+            match = re.search(r'desc="(\d+) queries"', response.getheader('Server-Timing') or '')
+            with lock:
+                statuses[response.status] += 1
+                if match:
+                    queries.append(int(match.group(1)))
+            # A repeated registration is an expected 400; any other 4xx (e.g. a 401) is a broken scenario
+            duplicate = response.status == 400 and b'Already registered' in data
+            if response.status >= 400 and not duplicate:
+                raise RuntimeError(f'HTTP {response.status} for {method} {path}')
+
+        latencies, errors, elapsed = run_concurrently(send, requests, workers)
+        return {
+            **summarize(latencies, len(errors), elapsed),
+            'queries_mean': round(sum(queries) / len(queries), 1) if queries else 0,
+            'queries_max': max(queries, default=0),
+            'statuses': dict(statuses),
+            'error_samples': errors[:3],
+        }
@@ -0,0 +1,94 @@
+import logging
+import random
+import time
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+from rest_framework.test import APIClient
+
+from core.auth import read_token
+from core.management.commands.bench_db import describe_backend
+from core.models import Student
+from core.utils.benchmarks import run_concurrently, summarize, throwaway_database, write_json
+
+PASSWORD = 'bench-password'
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures POST /api/students/login/ (PBKDF2 at PASSWORD_HASH_ITERATIONS) and token '
+        'verification on a throwaway database, to size the hashing cost for login bursts'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, default=200, help='Students to create (default: 200)')
+        parser.add_argument('--logins', type=int, default=400, help='Logins to time (default: 400)')
+        parser.add_argument('--verifications', type=int, default=20000, help='Token checks to time (default: 20000)')
+        parser.add_argument('--workers', type=int, default=8, help='Concurrent clients (default: 8)')
+        parser.add_argument('--iterations', type=int, help='PBKDF2 iterations to try (default: the PASSWORD_HASH_ITERATIONS setting)')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--json', dest='json_path', help='Also write the results to this JSON file')
+
+    def handle(self, *args, **options):
+        iterations = options['iterations'] or settings.PASSWORD_HASH_ITERATIONS
+        rng = random.Random(options['seed'])
+        # Wrong passwords are expected 400s; keep them out of the log
+        logging.getLogger('django.request').setLevel(logging.ERROR)
+
+        with override_settings(PASSWORD_HASH_ITERATIONS=iterations), throwaway_database():
+            backend = describe_backend()
+            # One hash shared by every student: creating the data should not take as long as the benchmark
+            password_hash = make_password(PASSWORD)
+            Student.objects.bulk_create([
+                Student(
+                    register_number=f'AUTH{n:06d}', name=f'Auth {n}', email=f'auth{n}@example.com', phone='0',
+                    student_class='B.Tech', department='CS', year='4', college='Bench College', password_hash=password_hash,
+                )
+                for n in range(options['students'])
+            ], batch_size=1000)
+
+            tokens = []
+
+            def login(n):
+                response = APIClient().post('/api/students/login/', {'register_number': f'AUTH{n:06d}', 'password': PASSWORD}, format='json')
+                if response.status_code != 200:
+                    raise RuntimeError(f'HTTP {response.status_code}')
+                tokens.append(response.json()['token'])
+
+            logins = [rng.randrange(options['students']) for _ in range(options['logins'])]
+            login_latencies, login_errors, login_elapsed = run_concurrently(login, logins, options['workers'])
+
+            def me(token):
+                response = APIClient().get('/api/students/me/', HTTP_AUTHORIZATION=f'Bearer {token}')
+                if response.status_code != 200:
+                    raise RuntimeError(f'HTTP {response.status_code}')
+
+            me_latencies, me_errors, me_elapsed = run_concurrently(me, tokens, options['workers'])
+
+        # Verification alone: an HMAC check, no database
+        checks = [tokens[n % len(tokens)] for n in range(options['verifications'])] if tokens else []
+        start = time.perf_counter()
+        invalid = sum(read_token(token) is None for token in checks)
+        verify_elapsed = time.perf_counter() - start
+
+        result = {
+            'backend': backend, 'iterations': iterations, 'workers': options['workers'],
+            'login': summarize(login_latencies, len(login_errors), login_elapsed),
+            'me': summarize(me_latencies, len(me_errors), me_elapsed),
+            'verify_per_s': round(len(checks) / verify_elapsed) if verify_elapsed else 0,
+            'verify_us': round(verify_elapsed / len(checks) * 1e6, 2) if checks else 0,
+        }
+        self.stdout.write(f"Backend: {backend}")
+        self.stdout.write(
+            f"Login at {iterations} iterations with {options['workers']} clients: {result['login']['throughput_per_s']}/s, "
+            f"p50 {result['login']['p50_ms']}ms, p95 {result['login']['p95_ms']}ms"
+        )
+        self.stdout.write(f"GET /api/students/me/ with a token: {result['me']['throughput_per_s']}/s, p95 {result['me']['p95_ms']}ms")
+        self.stdout.write(f"Token verification alone: {result['verify_per_s']}/s ({result['verify_us']}us each)")
+        if options['json_path']:
+            write_json(options['json_path'], result)
+        errors = login_errors + me_errors
+        if errors or invalid:
+            raise CommandError(f"{len(errors)} requests failed and {invalid} tokens did not verify, e.g. {errors[:1]}")
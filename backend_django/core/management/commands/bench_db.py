@@ -0,0 +1,69 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from core.models import Placement, PlacementRegistration, Student
+from core.utils.benchmarks import run_concurrently, summarize, throwaway_database, write_json
+from core.utils.outbox import queue_email
+
+
+def describe_backend():
+    info = {'vendor': connection.vendor}
+    options = connection.settings_dict.get('OPTIONS', {})
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA journal_mode')
+            info['journal_mode'] = cursor.fetchone()[0]
+        info['transaction_mode'] = options.get('transaction_mode', 'DEFERRED')
+        info['busy_timeout_s'] = options.get('timeout', 5)
+    else:
+        info['pool'] = bool(options.get('pool'))
+        info['conn_max_age'] = connection.settings_dict.get('CONN_MAX_AGE')
+    return info
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures concurrent registration throughput against a throwaway copy of the configured '
+        'database (SQLite tuning / Postgres pooling are taken from the environment)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, default=2000, help='Registrations to insert, one per student (default: 2000)')
+        parser.add_argument('--workers', type=int, default=16, help='Concurrent writer threads (default: 16)')
+        parser.add_argument('--json', dest='json_path', help='Also write the results to this JSON file')
+
+    def handle(self, *args, **options):
+        with throwaway_database():
+            backend = describe_backend()
+            placement = Placement.objects.create(
+                company_name='Benchmark Corp', description='Benchmark drive', date='2026-01-01', time='10:00',
+                venue='Hall', roles='Software Engineer', eligibility='Any', package='-',
+            )
+            Student.objects.bulk_create([
+                Student(
+                    register_number=f'BENCH{n:06d}', name=f'Bench {n}', email=f'bench{n}@example.com', phone='0',
+                    student_class='B.Tech', department='CS', year='4', college='Bench College',
+                )
+                for n in range(options['students'])
+            ], batch_size=1000)
+            student_ids = list(Student.objects.values_list('id', flat=True))
+
+            def register(student_id):
+                # Same writes as a real registration: the row plus its queued email
+                with transaction.atomic():
+                    PlacementRegistration.objects.create(student_id=student_id, placement=placement, role_name='Software Engineer')
+                    queue_email('Benchmark', 'Benchmark', ['bench@example.com'])
+
+            latencies, errors, elapsed = run_concurrently(register, student_ids, options['workers'])
+            inserted = PlacementRegistration.objects.count()
+
+        result = {'backend': backend, 'workers': options['workers'], 'inserted': inserted, **summarize(latencies, len(errors), elapsed)}
+        self.stdout.write(f"Backend: {backend}")
+        self.stdout.write(
+            f"{result['inserted']} registrations in {result['elapsed_s']}s with {options['workers']} workers: "
+            f"{result['throughput_per_s']}/s, p50 {result['p50_ms']}ms, p95 {result['p95_ms']}ms, p99 {result['p99_ms']}ms"
+        )
+        if errors:
+            self.stdout.write(self.style.ERROR(f"{len(errors)} failed, e.g. {errors[0]}"))
+        if options['json_path']:
+            write_json(options['json_path'], result)
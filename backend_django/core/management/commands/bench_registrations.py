@@ -0,0 +1,134 @@
+import logging
+import random
+import threading
+from collections import Counter
+from contextlib import nullcontext
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+from rest_framework.test import APIClient
+
+from core.management.commands.bench_db import describe_backend
+from core import metrics
+from core.auth import issue_token
+from core.models import OutboundEmail, Placement, PlacementRegistration, PlacementRole, Student
+from core.utils.benchmarks import run_concurrently, summarize, throwaway_database, write_json
+
+# Burst target for a drive opening, per WSGI worker process on single-node
+# SQLite (WAL, see settings): at least 70 registrations/s with 16 concurrent
+# clients, p95 under 1.5s, seats never oversold and every duplicate answered
+# with a 400 rather than a 500. A process is CPU bound well before SQLite's
+# write lock is, so throughput scales with the number of worker processes.
+TARGET_THROUGHPUT = 70
+TARGET_P95_MS = 1500
+
+
+class Command(BaseCommand):
+    help = (
+        'Load-tests POST /api/registrations/placements/ on a throwaway database: every student '
+        f'registers twice at once. Passes when no request fails with a 5xx, exactly one registration '
+        f'per student is stored, throughput reaches {TARGET_THROUGHPUT}/s and p95 stays under {TARGET_P95_MS}ms'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, default=1000, help='Students registering (default: 1000)')
+        parser.add_argument('--workers', type=int, default=16, help='Concurrent clients (default: 16)')
+        parser.add_argument('--capacity', type=int, help='Cap the role at this many seats; the rest must be waitlisted, never oversold')
+        parser.add_argument('--target', type=float, default=TARGET_THROUGHPUT, help=f'Required requests/s (default: {TARGET_THROUGHPUT})')
+        parser.add_argument('--target-p95', type=float, default=TARGET_P95_MS, help=f'Allowed p95 latency in ms (default: {TARGET_P95_MS})')
+        parser.add_argument('--seed', type=int, default=0, help='Shuffle seed for the request order')
+        parser.add_argument(
+            '--admission', action='store_true',
+            help='Keep the registration throttles and concurrency limit on (by default they are off so every request '
+                 'reaches the database); refused requests are then expected 429s',
+        )
+        parser.add_argument('--json', dest='json_path', help='Also write the results to this JSON file')
+
+    def handle(self, *args, **options):
+        if options['admission']:
+            admission = nullcontext()
+            caches[settings.THROTTLE_CACHE].clear()
+        else:
+            admission = override_settings(
+                REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': {}}, REGISTRATION_MAX_CONCURRENCY=0,
+            )
+        with admission, throwaway_database():
+            backend = describe_backend()
+            placement = Placement.objects.create(
+                company_name='Benchmark Corp', description='Benchmark drive', date='2026-01-01', time='10:00',
+                venue='Hall', roles='Software Engineer', eligibility='Any', package='-',
+            )
+            if options['capacity'] is not None:
+                placement.role_pools.filter(name='Software Engineer').update(capacity=options['capacity'])
+            Student.objects.bulk_create([
+                Student(
+                    register_number=f'BENCH{n:06d}', name=f'Bench {n}', email=f'bench{n}@example.com', phone='0',
+                    student_class='B.Tech', department='CS', year='4', college='Bench College',
+                )
+                for n in range(options['students'])
+            ], batch_size=1000)
+
+            # Each student twice, shuffled, so duplicates race each other
+            # Creates need the registering student's token
+            tokens = {student.pk: issue_token(student) for student in Student.objects.only('id')}
+            student_ids = list(tokens) * 2
+            random.Random(options['seed']).shuffle(student_ids)
+            statuses = Counter()
+            # Half the requests are expected 400s; keep them out of the log
+            logging.getLogger('django.request').setLevel(logging.ERROR)
+            lock = threading.Lock()
+
+            def register(student_id):
+                response = APIClient().post('/api/registrations/placements/?expand=', {
+                    'student': student_id, 'placement': placement.id, 'role_name': 'Software Engineer',
+                }, format='json', HTTP_AUTHORIZATION=f'Bearer {tokens[student_id]}')
+                with lock:
+                    statuses[response.status_code] += 1
+                if response.status_code >= 500:
+                    raise RuntimeError(f'HTTP {response.status_code}')
+
+            latencies, errors, elapsed = run_concurrently(register, student_ids, options['workers'])
+            stored = PlacementRegistration.objects.count()
+            queued = OutboundEmail.objects.count()
+            seated = PlacementRegistration.objects.filter(waitlisted=False).count()
+            seats_taken, applicants = PlacementRole.objects.values_list('seats_taken', 'applicant_count').get()
+
+        result = {
+            'backend': backend, 'workers': options['workers'], 'students': options['students'],
+            'stored': stored, 'seated': seated, 'emails_queued': queued, 'applicant_count': applicants, 'statuses': dict(statuses), 'target_per_s': options['target'], 'target_p95_ms': options['target_p95'],
+            **summarize(latencies, len(errors), elapsed),
+        }
+        failures = []
+        if errors:
+            failures.append(f"{len(errors)} requests failed, e.g. {errors[0]}")
+        # With admission control on, students whose both attempts got a 429 are not registered
+        registered = statuses[201] if options['admission'] else options['students']
+        if stored != registered or queued != registered or applicants != registered:
+            failures.append(f"expected {registered} registrations, emails and counted applicants, got {stored}, {queued} and {applicants}")
+        if options['capacity'] is not None:
+            expected = min(options['capacity'], registered)
+            if seated != expected or seats_taken != expected:
+                failures.append(f"expected {expected} seats taken, got {seated} seated registrations and a counter of {seats_taken}")
+        if result['throughput_per_s'] < options['target']:
+            failures.append(f"throughput {result['throughput_per_s']}/s is below the {options['target']}/s target")
+        if result['p95_ms'] > options['target_p95']:
+            failures.append(f"p95 {result['p95_ms']}ms is above the {options['target_p95']}ms target")
+        result['passed'] = not failures
+
+        self.stdout.write(f"Backend: {backend}")
+        self.stdout.write(
+            f"{result['requests']} requests in {result['elapsed_s']}s with {options['workers']} clients: "
+            f"{result['throughput_per_s']}/s, p50 {result['p50_ms']}ms, p95 {result['p95_ms']}ms, p99 {result['p99_ms']}ms, "
+            f"statuses {dict(statuses)}"
+        )
+        if options['admission']:
+            result['admission'] = [counter for counter in metrics.counters() if counter['name'] == 'registration_admission']
+            for counter in result['admission']:
+                self.stdout.write(f"  {counter['labels']}: {counter['value']}")
+        if options['json_path']:
+            write_json(options['json_path'], result)
+        if failures:
+            raise CommandError('Load test failed: ' + '; '.join(failures))
+        self.stdout.write(self.style.SUCCESS('Load test passed'))
@@ -0,0 +1,71 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.management.commands.bench_db import describe_backend
+from core.models import SearchDocument
+from core.utils import search
+from core.utils.benchmarks import summarize, throwaway_database, write_json
+
+
+def make_vocabulary(rng, size):
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    return [''.join(rng.choice(letters) for _ in range(rng.randint(4, 10))) for _ in range(size)]
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures /api/search/ query latency on a throwaway database filled with synthetic '
+        'documents (Zipf-distributed vocabulary, like real drive descriptions)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--documents', type=int, default=50000, help='Documents to index (default: 50000)')
+        parser.add_argument('--queries', type=int, default=500, help='Queries to time (default: 500)')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--json', dest='json_path', help='Also write the results to this JSON file')
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        vocabulary = make_vocabulary(rng, 20000)
+        weights = [1 / rank for rank in range(1, len(vocabulary) + 1)]
+        kinds = [kind for kind, _ in SearchDocument.KIND_CHOICES]
+
+        with throwaway_database():
+            backend = describe_backend()
+            batch = []
+            for n in range(options['documents']):
+                words = rng.choices(vocabulary, weights, k=80)
+                batch.append(SearchDocument(
+                    kind=rng.choice(kinds), object_id=n, title=' '.join(words[:3]).title(), body=' '.join(words[3:]),
+                    date=f'{rng.randint(2015, 2026)}-{rng.randint(1, 12):02d}-01',
+                ))
+                if len(batch) >= 2000:
+                    SearchDocument.objects.bulk_create(batch)
+                    batch = []
+            SearchDocument.objects.bulk_create(batch)
+
+            # Queries mix one and two words, full words and 3+ letter prefixes
+            queries = []
+            for _ in range(options['queries']):
+                words = rng.choices(vocabulary[50:5000], k=rng.randint(1, 2))
+                queries.append(' '.join(word[:rng.randint(3, len(word))] for word in words))
+
+            latencies = []
+            matches = 0
+            start = time.perf_counter()
+            for query in queries:
+                began = time.perf_counter()
+                matches += bool(search.search(query))
+                latencies.append(time.perf_counter() - began)
+            elapsed = time.perf_counter() - start
+
+        result = {'backend': backend, 'documents': options['documents'], 'queries_with_results': matches, **summarize(latencies, 0, elapsed)}
+        self.stdout.write(f"Backend: {backend}")
+        self.stdout.write(
+            f"{result['requests']} queries over {options['documents']} documents ({matches} with results): "
+            f"p50 {result['p50_ms']}ms, p95 {result['p95_ms']}ms, p99 {result['p99_ms']}ms"
+        )
+        if options['json_path']:
+            write_json(options['json_path'], result)
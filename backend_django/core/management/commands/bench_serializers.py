@@ -0,0 +1,95 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.management.commands.bench_db import describe_backend
+from core.models import Competition, Event, EventRegistration, Placement, PlacementRegistration, Student
+from core.serializers import (
+    CompetitionSerializer, CompetitionSummarySerializer, EventRegistrationSerializer, EventRegistrationSummarySerializer,
+    EventSerializer, EventSummarySerializer, PlacementRegistrationSerializer, PlacementRegistrationSummarySerializer,
+    PlacementSerializer, PlacementSummarySerializer, StudentSerializer, StudentSummarySerializer,
+)
+from core.utils import synthetic
+from core.utils.benchmarks import throwaway_database, write_json
+
+# Name -> (queryset as the full list view builds it, full serializer, summary serializer)
+LISTS = {
+    'students': (lambda: Student.objects.all(), StudentSerializer, StudentSummarySerializer),
+    'placements': (lambda: Placement.objects.all(), PlacementSerializer, PlacementSummarySerializer),
+    'events': (lambda: Event.objects.prefetch_related('competitions'), EventSerializer, EventSummarySerializer),
+    'competitions': (lambda: Competition.objects.all(), CompetitionSerializer, CompetitionSummarySerializer),
+    'placement_registrations': (
+        lambda: PlacementRegistration.objects.select_related('student', 'placement'),
+        PlacementRegistrationSerializer, PlacementRegistrationSummarySerializer,
+    ),
+    'event_registrations': (
+        lambda: EventRegistration.objects.select_related('student', 'event', 'competition').prefetch_related('event__competitions'),
+        EventRegistrationSerializer, EventRegistrationSummarySerializer,
+    ),
+}
+
+
+def timed(function, repeats):
+    """Median wall and CPU milliseconds of function() over `repeats` calls."""
+    wall, cpu = [], []
+    for _ in range(repeats):
+        started, cpu_started = time.perf_counter(), time.process_time()
+        function()
+        wall.append((time.perf_counter() - started) * 1000)
+        cpu.append((time.process_time() - cpu_started) * 1000)
+    return round(statistics.median(wall), 2), round(statistics.median(cpu), 2)
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares the full list serializers with the ?summary=true path (.values() rows, see SummarySerializer) '
+        'on a throwaway database with synthetic data: query and serialization time per list request'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=500, help='Rows per list request (default: 500)')
+        parser.add_argument('--repeats', type=int, default=20, help='Requests timed per list and path (default: 20)')
+        parser.add_argument('--lists', help=f"Comma separated lists to run (default: all of {', '.join(LISTS)})")
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--json', dest='json_path', help='Also write the results to this JSON file')
+
+    def handle(self, *args, **options):
+        selected = options['lists'].split(',') if options['lists'] else list(LISTS)
+        unknown = set(selected) - set(LISTS)
+        if unknown:
+            raise CommandError(f"Unknown lists: {', '.join(sorted(unknown))}")
+        rows, repeats = options['rows'], options['repeats']
+
+        with throwaway_database():
+            backend = describe_backend()
+            # Enough of everything for `rows` of each list
+            synthetic.generate(students=rows, placements=rows, events=max(rows // 4, 1), registrations=rows * 4, seed=options['seed'])
+            self.stdout.write(f"Backend: {backend}; {rows} rows per request, median of {repeats}")
+
+            results = {}
+            for name in selected:
+                make_queryset, full, summary = LISTS[name]
+                objects = list(make_queryset().order_by('id')[:rows])
+                values = list(summary.project(make_queryset().order_by('id'))[:rows])
+                result = {
+                    'rows': len(objects),
+                    'full_query': timed(lambda: list(make_queryset().order_by('id')[:rows]), repeats),
+                    'full_serialize': timed(lambda: full(objects, many=True).data, repeats),
+                    'summary_query': timed(lambda: list(summary.project(make_queryset().order_by('id'))[:rows]), repeats),
+                    # represent() converts in place; give it fresh dicts each time
+                    'summary_serialize': timed(lambda: summary.represent([dict(row) for row in values]), repeats),
+                }
+                full_total = result['full_query'][1] + result['full_serialize'][1]
+                summary_total = result['summary_query'][1] + result['summary_serialize'][1]
+                result['serialize_speedup'] = round(result['full_serialize'][1] / max(result['summary_serialize'][1], 0.01), 1)
+                result['request_speedup'] = round(full_total / max(summary_total, 0.01), 1)
+                results[name] = result
+                self.stdout.write(
+                    f"{name:24} full: query {result['full_query'][0]:>7}ms serialize {result['full_serialize'][1]:>7}ms cpu  "
+                    f"summary: query {result['summary_query'][0]:>7}ms serialize {result['summary_serialize'][1]:>7}ms cpu  "
+                    f"serialization {result['serialize_speedup']}x, query+serialization {result['request_speedup']}x"
+                )
+
+        if options['json_path']:
+            write_json(options['json_path'], {'backend': backend, 'rows': rows, 'repeats': repeats, 'lists': results})
@@ -0,0 +1,24 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.models import ResumeUpload
+from core.utils.resume_uploads import remove_partial
+
+
+class Command(BaseCommand):
+    help = 'Deletes chunked resume uploads abandoned before completion, with their partial files'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hours', type=float, default=24, help='Idle time after which an upload is abandoned (default: 24)')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(hours=options['hours'])
+        stale = ResumeUpload.objects.filter(status=ResumeUpload.STATUS_UPLOADING, updated_at__lt=cutoff)
+        removed = 0
+        for upload in stale.iterator():
+            remove_partial(upload)
+            removed += 1
+        stale.delete()
+        self.stdout.write(self.style.SUCCESS(f'Removed {removed} abandoned uploads'))
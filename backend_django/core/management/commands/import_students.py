@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.utils.student_import import DEFAULT_CHUNK_SIZE, detect_format, import_students
+
+
+class Command(BaseCommand):
+    help = 'Bulk imports students from a CSV or JSONL file, upserting on register_number'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV (with a header row) or JSONL file')
+        parser.add_argument('--format', choices=['csv', 'jsonl'], help='Defaults to the file extension')
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help=f'Rows per INSERT (default: {DEFAULT_CHUNK_SIZE})')
+        parser.add_argument('--no-welcome-email', action='store_true', help='Do not queue welcome emails for new students')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        fmt = options['format'] or detect_format(path)
+        try:
+            with open(path, 'rb') as stream:
+                result = import_students(stream, fmt=fmt, chunk_size=options['chunk_size'], send_welcome=not options['no_welcome_email'])
+        except OSError as e:
+            raise CommandError(f"Cannot read {path}: {e}")
+
+        for error in result['errors']:
+            self.stdout.write(self.style.ERROR(f"Line {error['line']}: {error['errors']}"))
+        if result['errors_truncated']:
+            self.stdout.write(self.style.WARNING(f"Only the first {len(result['errors'])} of {result['failed']} errors shown"))
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported students: {result['created']} created, {result['updated']} updated, {result['failed']} failed"
+        ))
+        if result['created'] and not options['no_welcome_email']:
+            self.stdout.write("Welcome emails queued; run `manage.py send_queued_emails` to deliver them.")
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from core.utils.analytics import rebuild
+
+
+class Command(BaseCommand):
+    help = (
+        'Recomputes the registration stats behind /api/analytics/ with GROUP BY queries '
+        '(signals keep them current; use this after bulk updates or restores)'
+    )
+
+    def handle(self, *args, **options):
+        rows = rebuild()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {rows} stat rows'))
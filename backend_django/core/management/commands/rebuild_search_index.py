@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from core.utils.search import rebuild_index
+
+
+class Command(BaseCommand):
+    help = (
+        'Rebuilds the search documents from placements, events and competitions '
+        '(signals keep them current; use this after bulk updates or restores)'
+    )
+
+    def handle(self, *args, **options):
+        total = rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f'Indexed {total} documents'))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from core.utils.seats import recount
+
+
+class Command(BaseCommand):
+    help = (
+        'Recomputes the seat and applicant counters of competitions and placement roles '
+        '(registrations keep them current; use this after bulk inserts, raw deletes or restores)'
+    )
+
+    def handle(self, *args, **options):
+        recount()
+        self.stdout.write(self.style.SUCCESS('Recounted seats'))
@@ -1,12 +1,40 @@
-from django.core.management.base import BaseCommand
+import time
+
+from django.core.management.base import BaseCommand, CommandError
 from core.models import Placement, Event, Competition, Student
+from core.utils import synthetic
 from django.contrib.auth.hashers import make_password
 
 class Command(BaseCommand):
-    help = 'Seeds the database with initial data for Placements and Events'
+    help = (
+        'Seeds the database with initial data for Placements and Events, '
+        'plus synthetic students, drives and registrations for load tests if asked for'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, default=0, help='Synthetic students to add (e.g. 50000)')
+        parser.add_argument('--placements', type=int, default=0, help='Synthetic placement drives to add (e.g. 500)')
+        parser.add_argument('--events', type=int, default=0, help='Synthetic events to add, with 3-6 competitions each')
+        parser.add_argument('--registrations', type=int, default=0, help='Synthetic registrations to add (e.g. 500000)')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed; the same seed gives the same data')
+        parser.add_argument(
+            '--scale', choices=list(synthetic.SCALES),
+            help='Preset synthetic counts, from small (10k registrations) to xlarge (1M); the options above override it',
+        )
+        parser.add_argument('--processes', type=int, default=1, help='Processes generating synthetic rows (default: 1)')
 
     def handle(self, *args, **options):
+        counts = {name: options[name] for name in ('students', 'placements', 'events', 'registrations')}
+        if options['scale']:
+            counts = {name: options[name] or n for name, n in synthetic.SCALES[options['scale']].items()}
+        if options['processes'] < 1:
+            raise CommandError('--processes must be at least 1')
+
         self.stdout.write("Seeding data...")
+        if any(counts.values()):
+            # Before the drives and events go, so their registrations are removed in bulk
+            self.stdout.write("Clearing old synthetic data...")
+            synthetic.clear()
 
         # Clear existing data to avoid duplicates
         self.stdout.write("Clearing old data...")
@@ -26,7 +54,7 @@ class Command(BaseCommand):
             department='CS',
             year='4',
             college='Engineering College',
-            password_hash='password123'
+            password_hash=make_password('password123')
         )
         self.stdout.write("Created test student: 12345")
 
@@ -202,4 +230,12 @@ class Command(BaseCommand):
                     Competition.objects.create(event=event, **c_data)
                     self.stdout.write(f"  Created competition: {c_data.get('name')}")
 
+        if any(counts.values()):
+            self.stdout.write("Generating synthetic data...")
+            started = time.perf_counter()
+            synthetic.generate(
+                **counts, seed=options['seed'], processes=options['processes'],
+                log=lambda message: self.stdout.write(f"  [{time.perf_counter() - started:7.1f}s] {message}"),
+            )
+
         self.stdout.write(self.style.SUCCESS("Seeding completed!"))
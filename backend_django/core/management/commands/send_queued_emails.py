@@ -0,0 +1,55 @@
+import smtplib
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from core.models import OutboundEmail
+from core.utils.outbox import drain_outbox
+
+
+def _worker(batch_size, max_attempts):
+    try:
+        return drain_outbox(batch_size=batch_size, max_attempts=max_attempts)
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = 'Delivers queued outbound emails over pooled SMTP connections'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=1, help='Concurrent SMTP connections (default: 1)')
+        parser.add_argument('--batch-size', type=int, default=100, help='Emails claimed per batch (default: 100)')
+        parser.add_argument('--max-attempts', type=int, default=5, help='Attempts before an email is marked failed (default: 5)')
+        parser.add_argument('--loop', action='store_true', help='Keep polling the queue instead of exiting when it is empty')
+        parser.add_argument('--interval', type=float, default=5.0, help='Seconds between polls with --loop (default: 5)')
+
+    def handle(self, *args, **options):
+        workers = max(1, options['workers'])
+        while True:
+            try:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(
+                        lambda _: _worker(options['batch_size'], options['max_attempts']),
+                        range(workers),
+                    ))
+            except (smtplib.SMTPException, OSError) as e:
+                if not options['loop']:
+                    raise
+                # SMTP is down: the claimed emails are back in the queue, try again next poll
+                self.stderr.write(f"SMTP connection failed: {e}")
+                results = []
+            sent = sum(r[0] for r in results)
+            failed = sum(r[1] for r in results)
+            if sent or failed:
+                self.stdout.write(self.style.SUCCESS(f"Sent {sent} emails, {failed} failed"))
+
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
+
+        pending = OutboundEmail.objects.filter(status=OutboundEmail.STATUS_PENDING).count()
+        dead = OutboundEmail.objects.filter(status=OutboundEmail.STATUS_FAILED).count()
+        self.stdout.write(f"{pending} emails pending retry, {dead} permanently failed")
@@ -1,79 +1,142 @@
-from django.core.management.base import BaseCommand
-from django.utils import timezone
+import smtplib
 from datetime import timedelta
-from django.core.mail import send_mail
-from django.conf import settings
-from core.models import Event, Placement, EventRegistration, PlacementRegistration
 
-class Command(BaseCommand):
-    help = 'Sends reminder emails for events and placements happening tomorrow'
+from django.core.mail import EmailMessage, get_connection
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from core.models import EventRegistration, PlacementRegistration, SentReminder
+from core.utils.outbox import default_from_email
+
+EVENT_MESSAGE = """Hi {name},
 
-    def handle(self, *args, **kwargs):
-        tomorrow = timezone.now().date() + timedelta(days=1)
-        self.stdout.write(f"Checking for events on {tomorrow}...")
-
-        # 1. Events
-        events = Event.objects.filter(date=tomorrow)
-        for event in events:
-            registrations = EventRegistration.objects.filter(competition__event=event)
-            # Distinct students in case they registered for multiple competitions in same event
-            student_emails = set()
-            for reg in registrations:
-                if reg.student.email:
-                    student_emails.add(reg.student.email)
-            
-            if student_emails:
-                subject = f"Reminder: Upcoming Event - {event.event_name}"
-                message = f"""Hi there,
-
-This is a reminder that the event '{event.event_name}' is scheduled for tomorrow, {event.date}.
-Location: {event.venue}
+This is a reminder that the event '{title}' is scheduled for {when}.
+Location: {venue}
 
 Don't miss out!
 
 Best regards,
 Campus Connect Team
 """
-                try:
-                    send_mail(
-                        subject,
-                        message,
-                        settings.DEFAULT_FROM_EMAIL if hasattr(settings, 'DEFAULT_FROM_EMAIL') else 'noreply@campusconnect.com',
-                        list(student_emails),
-                        fail_silently=False,
-                    )
-                    self.stdout.write(self.style.SUCCESS(f"Sent event reminder to {len(student_emails)} students for '{event.event_name}'"))
-                except Exception as e:
-                    self.stdout.write(self.style.ERROR(f"Failed to send event reminder: {e}"))
-
-        # 2. Placements
-        placements = Placement.objects.filter(date=tomorrow)
-        for placement in placements:
-            registrations = PlacementRegistration.objects.filter(placement=placement)
-            student_emails = set()
-            for reg in registrations:
-                if reg.student.email:
-                    student_emails.add(reg.student.email)
-
-            if student_emails:
-                subject = f"Reminder: Placement Drive - {placement.company_name}"
-                message = f"""Hi there,
-
-This is a reminder for the Placement Drive by {placement.company_name} scheduled for tomorrow, {placement.date}.
+
+PLACEMENT_MESSAGE = """Hi {name},
+
+This is a reminder for the Placement Drive by {title} scheduled for {when}.
 
 Good luck!
 
 Best regards,
 Campus Connect Team
 """
-                try:
-                    send_mail(
-                        subject,
-                        message,
-                        settings.DEFAULT_FROM_EMAIL if hasattr(settings, 'DEFAULT_FROM_EMAIL') else 'noreply@campusconnect.com',
-                        list(student_emails),
-                        fail_silently=False,
-                    )
-                    self.stdout.write(self.style.SUCCESS(f"Sent placement reminder to {len(student_emails)} students for '{placement.company_name}'"))
-                except Exception as e:
-                    self.stdout.write(self.style.ERROR(f"Failed to send placement reminder: {e}"))
+
+
+def describe_day(day, today):
+    """'tomorrow, Sunday 15 March 2026' or just the date: --date may pick any day."""
+    label = f"{day:%A} {day.day} {day:%B %Y}"
+    if day == today:
+        return f"today, {label}"
+    if day == today + timedelta(days=1):
+        return f"tomorrow, {label}"
+    return label
+
+
+def send_message(connection, message):
+    """Sends over the run's connection, reconnecting once if the server dropped it."""
+    try:
+        connection.send_messages([message])
+    except smtplib.SMTPServerDisconnected:
+        connection.close()
+        connection.open()
+        connection.send_messages([message])
+
+
+def pending_recipients(registrations, kind, object_field, title_field, venue_field, day):
+    """
+    One query for every (student, event|placement) pair on `day` that has not
+    been reminded yet. A student registered for several competitions of the
+    same event only appears once.
+    """
+    already_sent = SentReminder.objects.filter(kind=kind, object_id=OuterRef(object_field), student_id=OuterRef('student_id'))
+    return (
+        registrations
+        .filter(**{f'{object_field.removesuffix("_id")}__date': day})
+        .exclude(student__email='')
+        .exclude(Exists(already_sent))
+        .values_list('student_id', 'student__name', 'student__email', object_field, title_field, venue_field)
+        .order_by(object_field, 'student_id')
+        .distinct()
+    )
+
+
+class Command(BaseCommand):
+    help = 'Sends reminder emails for events and placements happening tomorrow'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', help='Send reminders for this date (YYYY-MM-DD) instead of tomorrow')
+        parser.add_argument('--batch-size', type=int, default=500, help='Reminders recorded per batch (default: 500)')
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many reminders would be sent')
+
+    def handle(self, *args, **options):
+        if options['date']:
+            day = parse_date(options['date'])
+            if day is None:
+                raise CommandError(f"Invalid --date '{options['date']}', expected YYYY-MM-DD")
+        else:
+            day = timezone.localdate() + timedelta(days=1)
+        self.stdout.write(f"Checking for events on {day}...")
+
+        jobs = [
+            (SentReminder.KIND_EVENT, 'Event', pending_recipients(
+                EventRegistration.objects, SentReminder.KIND_EVENT, 'event_id', 'event__event_name', 'event__venue', day,
+            ), "Reminder: Upcoming Event - {title}", EVENT_MESSAGE),
+            (SentReminder.KIND_PLACEMENT, 'Placement', pending_recipients(
+                PlacementRegistration.objects, SentReminder.KIND_PLACEMENT, 'placement_id', 'placement__company_name', 'placement__venue', day,
+            ), "Reminder: Placement Drive - {title}", PLACEMENT_MESSAGE),
+        ]
+
+        if options['dry_run']:
+            for kind, label, recipients, _, _ in jobs:
+                self.stdout.write(f"{label} reminders to send: {recipients.count()}")
+            return
+
+        # One SMTP session for the whole run
+        connection = get_connection(fail_silently=False)
+        connection.open()
+        try:
+            for kind, label, recipients, subject, body in jobs:
+                sent, failed = self.send(connection, kind, recipients, subject, body, day, options['batch_size'])
+                if sent or failed:
+                    style = self.style.SUCCESS if not failed else self.style.WARNING
+                    self.stdout.write(style(f"Sent {sent} {label.lower()} reminders ({failed} failed)"))
+        finally:
+            connection.close()
+
+    def send(self, connection, kind, recipients, subject, body, day, batch_size):
+        from_email = default_from_email()
+        when = describe_day(day, timezone.localdate())
+        sent = failed = 0
+        delivered = []
+        for student_id, name, email, object_id, title, venue in recipients.iterator(chunk_size=batch_size):
+            message = EmailMessage(
+                subject.format(title=title),
+                body.format(name=name, title=title, when=when, venue=venue),
+                from_email,
+                [email],
+                connection=connection,
+            )
+            try:
+                send_message(connection, message)
+            except Exception as e:
+                failed += 1
+                self.stdout.write(self.style.ERROR(f"Failed to send {kind} reminder to {email}: {e}"))
+                continue
+            sent += 1
+            delivered.append(SentReminder(kind=kind, object_id=object_id, student_id=student_id))
+            if len(delivered) >= batch_size:
+                SentReminder.objects.bulk_create(delivered, ignore_conflicts=True)
+                delivered = []
+        if delivered:
+            SentReminder.objects.bulk_create(delivered, ignore_conflicts=True)
+        return sent, failed
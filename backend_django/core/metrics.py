@@ -0,0 +1,95 @@
+import bisect
+import os
+import threading
+import time
+
+# In-process counters and histograms, served by /api/metrics/ (JSON) and
+# /api/metrics/prometheus/ (text exposition format). Each worker process
+# keeps its own; the JSON carries the pid so scrapes of several workers can
+# be told apart and summed.
+_lock = threading.Lock()
+_counters = {}
+_histograms = {}
+STARTED_AT = time.time()
+PROMETHEUS_PREFIX = 'campcon_'
+
+
+def inc(name, amount=1, **labels):
+    key = (name, tuple(sorted(labels.items())))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + amount
+
+
+def observe(name, value, buckets, **labels):
+    """Records `value` in a histogram with the given (sorted) upper bounds."""
+    key = (name, tuple(sorted(labels.items())))
+    with _lock:
+        histogram = _histograms.get(key)
+        if histogram is None:
+            histogram = _histograms[key] = {'buckets': buckets, 'counts': [0] * len(buckets), 'count': 0, 'sum': 0}
+        index = bisect.bisect_left(buckets, value)
+        if index < len(buckets):
+            histogram['counts'][index] += 1
+        histogram['count'] += 1
+        histogram['sum'] += value
+
+
+def counters():
+    with _lock:
+        items = sorted(_counters.items())
+    return [{'name': name, 'labels': dict(labels), 'value': value} for (name, labels), value in items]
+
+
+def histograms():
+    """Histograms with cumulative bucket counts, as Prometheus has them."""
+    with _lock:
+        items = sorted((key, {**histogram, 'counts': list(histogram['counts'])}) for key, histogram in _histograms.items())
+    result = []
+    for (name, labels), histogram in items:
+        cumulative, buckets = 0, {}
+        for bound, n in zip(histogram['buckets'], histogram['counts']):
+            cumulative += n
+            buckets[bound] = cumulative
+        result.append({'name': name, 'labels': dict(labels), 'buckets': buckets, 'count': histogram['count'], 'sum': histogram['sum']})
+    return result
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+
+
+def snapshot():
+    return {'pid': os.getpid(), 'uptime_s': round(time.time() - STARTED_AT, 1), 'counters': counters(), 'histograms': histograms()}
+
+
+def format_labels(labels):
+    if not labels:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for value in labels.values())
+    return '{' + ','.join(f'{name}="{value}"' for name, value in zip(labels, escaped)) + '}'
+
+
+def render_prometheus():
+    lines = []
+    declared = set()
+
+    def declare(name, kind):
+        if name not in declared:
+            declared.add(name)
+            lines.append(f'# TYPE {name} {kind}')
+
+    for counter in counters():
+        name = f"{PROMETHEUS_PREFIX}{counter['name']}_total"
+        declare(name, 'counter')
+        lines.append(f"{name}{format_labels(counter['labels'])} {counter['value']}")
+    for histogram in histograms():
+        name = PROMETHEUS_PREFIX + histogram['name']
+        declare(name, 'histogram')
+        for bound, n in histogram['buckets'].items():
+            lines.append(f"{name}_bucket{format_labels({**histogram['labels'], 'le': bound})} {n}")
+        lines.append(f"{name}_bucket{format_labels({**histogram['labels'], 'le': '+Inf'})} {histogram['count']}")
+        lines.append(f"{name}_sum{format_labels(histogram['labels'])} {histogram['sum']}")
+        lines.append(f"{name}_count{format_labels(histogram['labels'])} {histogram['count']}")
+    return '\n'.join(lines) + '\n'
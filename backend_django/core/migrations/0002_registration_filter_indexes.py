@@ -0,0 +1,37 @@
+# Generated by Django 6.0.2 on 2026-10-17 22:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='eventregistration',
+            index=models.Index(fields=['student', 'registered_at'], name='ereg_student_registered_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventregistration',
+            index=models.Index(fields=['event', 'registered_at'], name='ereg_event_registered_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventregistration',
+            index=models.Index(fields=['competition', 'registered_at'], name='ereg_competition_reg_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='placementregistration',
+            index=models.Index(fields=['student', 'registered_at'], name='preg_student_registered_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='placementregistration',
+            index=models.Index(fields=['placement', 'status', 'registered_at'], name='preg_placement_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='placementregistration',
+            index=models.Index(fields=['status', 'registered_at'], name='preg_status_registered_idx'),
+        ),
+    ]
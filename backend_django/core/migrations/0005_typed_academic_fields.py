@@ -0,0 +1,144 @@
+# Generated by Django 6.0.2 on 2026-10-17 22:20
+
+from decimal import Decimal, InvalidOperation
+
+from django.db import migrations, models
+
+TYPED_FIELDS = ['cgpa', 'backlogs', 'history_of_arrears', 'tenth_marks', 'twelfth_marks']
+
+
+def parse_decimal(value, maximum):
+    if value is None:
+        return None
+    try:
+        number = Decimal(str(value).strip().rstrip('%').strip())
+        # Round before the range check: 99.996 rounds to 100.00, which numeric(4, 2) cannot hold
+        number = number.quantize(Decimal('0.01')) if number.is_finite() else None
+    except InvalidOperation:
+        return None
+    if number is None or number < 0 or number > maximum:
+        return None
+    return number
+
+
+def parse_count(value):
+    number = parse_decimal(value, Decimal('32767'))
+    return int(number) if number is not None else None
+
+
+def parse_bool(value):
+    value = (value or '').strip().lower()
+    if value in ('yes', 'y', 'true', '1'):
+        return True
+    if value in ('no', 'n', 'false', '0', 'none', 'nil'):
+        return False
+    return None
+
+
+def text_to_typed(apps, schema_editor):
+    Student = apps.get_model('core', 'Student')
+    batch = []
+    for student in Student.objects.only('id', *[f'{name}_text' for name in TYPED_FIELDS]).iterator(chunk_size=1000):
+        student.cgpa = parse_decimal(student.cgpa_text, Decimal('99.99'))
+        student.backlogs = parse_count(student.backlogs_text)
+        student.history_of_arrears = parse_bool(student.history_of_arrears_text)
+        student.tenth_marks = parse_decimal(student.tenth_marks_text, Decimal('999.99'))
+        student.twelfth_marks = parse_decimal(student.twelfth_marks_text, Decimal('999.99'))
+        batch.append(student)
+        if len(batch) >= 1000:
+            Student.objects.bulk_update(batch, TYPED_FIELDS)
+            batch = []
+    if batch:
+        Student.objects.bulk_update(batch, TYPED_FIELDS)
+
+
+def typed_to_text(apps, schema_editor):
+    Student = apps.get_model('core', 'Student')
+    batch = []
+    for student in Student.objects.only('id', *TYPED_FIELDS).iterator(chunk_size=1000):
+        for name in TYPED_FIELDS:
+            value = getattr(student, name)
+            if isinstance(value, bool):
+                value = 'Yes' if value else 'No'
+            setattr(student, f'{name}_text', None if value is None else str(value))
+        batch.append(student)
+        if len(batch) >= 1000:
+            Student.objects.bulk_update(batch, [f'{name}_text' for name in TYPED_FIELDS])
+            batch = []
+    if batch:
+        Student.objects.bulk_update(batch, [f'{name}_text' for name in TYPED_FIELDS])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_sent_reminder'),
+    ]
+
+    operations = [
+        # Keep the free text values around until they are converted
+        migrations.RenameField(model_name='student', old_name='cgpa', new_name='cgpa_text'),
+        migrations.RenameField(model_name='student', old_name='backlogs', new_name='backlogs_text'),
+        migrations.RenameField(model_name='student', old_name='history_of_arrears', new_name='history_of_arrears_text'),
+        migrations.RenameField(model_name='student', old_name='tenth_marks', new_name='tenth_marks_text'),
+        migrations.RenameField(model_name='student', old_name='twelfth_marks', new_name='twelfth_marks_text'),
+        migrations.AddField(
+            model_name='student',
+            name='cgpa',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=4, null=True),
+        ),
+        migrations.AddField(
+            model_name='student',
+            name='backlogs',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='student',
+            name='history_of_arrears',
+            field=models.BooleanField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='student',
+            name='tenth_marks',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=5, null=True),
+        ),
+        migrations.AddField(
+            model_name='student',
+            name='twelfth_marks',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=5, null=True),
+        ),
+        migrations.RunPython(text_to_typed, typed_to_text),
+        migrations.RemoveField(model_name='student', name='cgpa_text'),
+        migrations.RemoveField(model_name='student', name='backlogs_text'),
+        migrations.RemoveField(model_name='student', name='history_of_arrears_text'),
+        migrations.RemoveField(model_name='student', name='tenth_marks_text'),
+        migrations.RemoveField(model_name='student', name='twelfth_marks_text'),
+        migrations.AddField(
+            model_name='placement',
+            name='min_cgpa',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=4, null=True),
+        ),
+        migrations.AddField(
+            model_name='placement',
+            name='max_backlogs',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='placement',
+            name='allowed_departments',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='placement',
+            name='allowed_years',
+            field=models.CharField(blank=True, default='', max_length=50),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['department', 'year', 'cgpa'], name='student_dept_year_cgpa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['cgpa', 'backlogs'], name='student_cgpa_backlogs_idx'),
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 6.0.2 on 2026-10-17 22:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_typed_academic_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlacementRole',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('capacity', models.PositiveIntegerField(blank=True, null=True)),
+                ('seats_taken', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='competition',
+            name='capacity',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='competition',
+            name='seats_taken',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='eventregistration',
+            name='waitlisted',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='placementregistration',
+            name='waitlisted',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name='eventregistration',
+            index=models.Index(fields=['competition', 'waitlisted', 'registered_at'], name='ereg_waitlist_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='placementregistration',
+            index=models.Index(fields=['placement', 'role_name', 'waitlisted', 'registered_at'], name='preg_waitlist_idx'),
+        ),
+        migrations.AddField(
+            model_name='placementrole',
+            name='placement',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='role_pools', to='core.placement'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='placementrole',
+            unique_together={('placement', 'name')},
+        ),
+    ]
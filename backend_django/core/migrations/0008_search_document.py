@@ -0,0 +1,93 @@
+# Generated by Django 6.0.2 on 2026-10-17 22:35
+
+from django.db import migrations, models
+
+SQLITE_INDEX = [
+    # External-content FTS5 table: the text lives in core_searchdocument only
+    """CREATE VIRTUAL TABLE core_searchdocument_fts USING fts5(
+        title, body, content='core_searchdocument', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )""",
+    """CREATE TRIGGER core_searchdocument_ai AFTER INSERT ON core_searchdocument BEGIN
+        INSERT INTO core_searchdocument_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END""",
+    """CREATE TRIGGER core_searchdocument_ad AFTER DELETE ON core_searchdocument BEGIN
+        INSERT INTO core_searchdocument_fts(core_searchdocument_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+    END""",
+    """CREATE TRIGGER core_searchdocument_au AFTER UPDATE ON core_searchdocument BEGIN
+        INSERT INTO core_searchdocument_fts(core_searchdocument_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO core_searchdocument_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END""",
+]
+SQLITE_DROP = [
+    'DROP TRIGGER IF EXISTS core_searchdocument_au',
+    'DROP TRIGGER IF EXISTS core_searchdocument_ad',
+    'DROP TRIGGER IF EXISTS core_searchdocument_ai',
+    'DROP TABLE IF EXISTS core_searchdocument_fts',
+]
+# Must match DOCUMENT_VECTOR in core/utils/search.py
+POSTGRES_INDEX = [
+    """CREATE INDEX core_searchdocument_fts_idx ON core_searchdocument USING GIN (
+        (setweight(to_tsvector('english', title), 'A') || setweight(to_tsvector('english', body), 'B'))
+    )""",
+]
+POSTGRES_DROP = ['DROP INDEX IF EXISTS core_searchdocument_fts_idx']
+
+
+def run_for_vendor(sqlite, postgres):
+    def run(apps, schema_editor):
+        statements = {'sqlite': sqlite, 'postgresql': postgres}.get(schema_editor.connection.vendor, [])
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+def join_text(*parts):
+    return '\n'.join(str(part) for part in parts if part)
+
+
+def index_existing(apps, schema_editor):
+    Placement = apps.get_model('core', 'Placement')
+    Event = apps.get_model('core', 'Event')
+    Competition = apps.get_model('core', 'Competition')
+    SearchDocument = apps.get_model('core', 'SearchDocument')
+    documents = [
+        SearchDocument(kind='placement', object_id=p.pk, title=p.company_name, date=p.date,
+                       body=join_text(p.roles, p.description, p.eligibility, p.venue, p.package))
+        for p in Placement.objects.iterator()
+    ] + [
+        SearchDocument(kind='event', object_id=e.pk, title=e.event_name, date=e.date,
+                       body=join_text(e.description, e.venue, e.rules, e.contact_person))
+        for e in Event.objects.iterator()
+    ] + [
+        SearchDocument(kind='competition', object_id=c.pk, title=c.name, date=c.event.date,
+                       body=join_text(c.event.event_name, c.description, c.prize, c.type))
+        for c in Competition.objects.select_related('event').iterator()
+    ]
+    SearchDocument.objects.bulk_create(documents, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_resume_uploads'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('placement', 'Placement'), ('event', 'Event'), ('competition', 'Competition')], max_length=20)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('title', models.CharField(max_length=255)),
+                ('body', models.TextField(blank=True, default='')),
+                ('date', models.DateField(blank=True, null=True)),
+            ],
+            options={
+                'unique_together': {('kind', 'object_id')},
+            },
+        ),
+        migrations.RunPython(run_for_vendor(SQLITE_INDEX, POSTGRES_INDEX), run_for_vendor(SQLITE_DROP, POSTGRES_DROP)),
+        migrations.RunPython(index_existing, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 6.0.2 on 2026-10-17 23:10
+
+from collections import defaultdict
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def split_roles(apps, schema_editor):
+    """One PlacementRole per comma separated role, plus any role name only registrations use."""
+    Placement = apps.get_model('core', 'Placement')
+    PlacementRole = apps.get_model('core', 'PlacementRole')
+    PlacementRegistration = apps.get_model('core', 'PlacementRegistration')
+
+    registered = defaultdict(set)
+    for placement_id, role_name in PlacementRegistration.objects.values_list('placement_id', 'role_name').distinct().iterator():
+        registered[placement_id].add(role_name)
+    roles = []
+    for placement in Placement.objects.only('id', 'roles').iterator():
+        names = list(dict.fromkeys(r.strip() for r in placement.roles.split(',') if r.strip()))
+        names += sorted(registered[placement.pk] - set(names))
+        roles += [PlacementRole(placement_id=placement.pk, name=name) for name in names]
+    # Capped roles from 0006 already exist
+    PlacementRole.objects.bulk_create(roles, batch_size=1000, ignore_conflicts=True)
+
+    PlacementRegistration.objects.update(role_id=Subquery(
+        PlacementRole.objects.filter(placement_id=OuterRef('placement_id'), name=OuterRef('role_name')).values('pk')[:1]
+    ))
+
+    def count(**filters):
+        registrations = PlacementRegistration.objects.filter(role_id=OuterRef('pk'), **filters).order_by()
+        return Coalesce(Subquery(registrations.values('role_id').annotate(n=Count('id')).values('n')), 0)
+    PlacementRole.objects.update(applicant_count=count(), seats_taken=count(waitlisted=False))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_search_document'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='placementregistration',
+            name='preg_waitlist_idx',
+        ),
+        migrations.AddField(
+            model_name='placementrole',
+            name='applicant_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='placementregistration',
+            name='role',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.RESTRICT, related_name='registrations', to='core.placementrole'),
+        ),
+        migrations.RunPython(split_roles, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='placementregistration',
+            name='role',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.RESTRICT, related_name='registrations', to='core.placementrole'),
+        ),
+        migrations.AddIndex(
+            model_name='placementregistration',
+            index=models.Index(fields=['role', 'waitlisted', 'registered_at'], name='preg_role_waitlist_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='placementrole',
+            index=models.Index(fields=['-applicant_count'], name='prole_applicants_idx'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 6.0.2 on 2026-10-17 22:51
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def count_existing(apps, schema_editor):
+    PlacementRegistration = apps.get_model('core', 'PlacementRegistration')
+    EventRegistration = apps.get_model('core', 'EventRegistration')
+    RegistrationStat = apps.get_model('core', 'RegistrationStat')
+    placements = PlacementRegistration.objects.values_list('placement_id', 'student__department', 'status').annotate(n=Count('id')).order_by()
+    competitions = EventRegistration.objects.values_list('event_id', 'competition_id', 'student__department').annotate(n=Count('id')).order_by()
+    RegistrationStat.objects.bulk_create([
+        RegistrationStat(placement_id=placement_id, department=department, status=status, count=n)
+        for placement_id, department, status, n in placements
+    ] + [
+        RegistrationStat(event_id=event_id, competition_id=competition_id, department=department, count=n)
+        for event_id, competition_id, department, n in competitions
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_placement_role_normalization'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RegistrationStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('department', models.CharField(max_length=100)),
+                ('status', models.CharField(blank=True, default='', max_length=50)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('competition', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.competition')),
+                ('event', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.event')),
+                ('placement', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.placement')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(condition=models.Q(('placement__isnull', False)), fields=('placement', 'department', 'status'), name='regstat_placement_uniq'), models.UniqueConstraint(condition=models.Q(('competition__isnull', False)), fields=('competition', 'department'), name='regstat_competition_uniq')],
+            },
+        ),
+        migrations.RunPython(count_existing, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 6.0.2 on 2026-10-17 22:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_registration_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatusChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_status', models.CharField(max_length=50)),
+                ('to_status', models.CharField(max_length=50)),
+                ('batch', models.UUIDField(blank=True, null=True)),
+                ('note', models.CharField(blank=True, default='', max_length=255)),
+                ('changed_at', models.DateTimeField(auto_now_add=True)),
+                ('registration', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_changes', to='core.placementregistration')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['registration', 'changed_at'], name='statuschange_reg_idx'), models.Index(fields=['batch'], name='statuschange_batch_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 6.0.2 on 2026-10-17 23:40
+
+from django.db import migrations
+
+from core.hashers import hash_passwords, is_password_hash
+
+BATCH_SIZE = 500
+
+
+def hash_plaintext_passwords(apps, schema_editor):
+    """Replaces the plain text passwords stored so far with PBKDF2 hashes."""
+    Student = apps.get_model('core', 'Student')
+    stored = Student.objects.exclude(password_hash__isnull=True).exclude(password_hash='').values_list('id', 'password_hash')
+    plain = [(pk, password) for pk, password in stored if not is_password_hash(password)]
+    for start in range(0, len(plain), BATCH_SIZE):
+        batch = plain[start:start + BATCH_SIZE]
+        hashed = hash_passwords([password for _, password in batch])
+        Student.objects.bulk_update([Student(id=pk, password_hash=h) for (pk, _), h in zip(batch, hashed)], ['password_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_status_changes'),
+    ]
+
+    operations = [
+        migrations.RunPython(hash_plaintext_passwords, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0.2 on 2026-10-18 02:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_timeline_date_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='eventregistration',
+            index=models.Index(fields=['registered_at', 'id'], name='ereg_registered_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='placementregistration',
+            index=models.Index(fields=['registered_at', 'id'], name='preg_registered_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 6.0.2 on 2026-10-18 03:40
+
+from django.db import migrations
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_competition_seats(apps, schema_editor):
+    """0006 added Competition.seats_taken at 0; count the seats registrations already hold."""
+    Competition = apps.get_model('core', 'Competition')
+    EventRegistration = apps.get_model('core', 'EventRegistration')
+
+    registrations = EventRegistration.objects.filter(competition_id=OuterRef('pk'), waitlisted=False).order_by()
+    Competition.objects.update(seats_taken=Coalesce(
+        Subquery(registrations.values('competition_id').annotate(n=Count('id')).values('n')), 0,
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_registration_registered_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(count_competition_seats, migrations.RunPython.noop),
+    ]
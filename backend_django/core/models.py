@@ -1,4 +1,8 @@
-from django.db import models
+import uuid
+
+from django.db import models, transaction
+from django.utils import timezone
+from django.contrib.auth.hashers import check_password, make_password
 from django.contrib.auth.models import User
 
 # User/Student Model
@@ -12,16 +16,33 @@ class Student(models.Model):
     department = models.CharField(max_length=100)
     year = models.CharField(max_length=10)
     college = models.CharField(max_length=255)
-    cgpa = models.CharField(max_length=10, blank=True, null=True)
-    backlogs = models.CharField(max_length=10, blank=True, null=True)
-    history_of_arrears = models.CharField(max_length=10, blank=True, null=True)
-    tenth_marks = models.CharField(max_length=10, blank=True, null=True)
-    twelfth_marks = models.CharField(max_length=10, blank=True, null=True)
+    cgpa = models.DecimalField(max_digits=4, decimal_places=2, blank=True, null=True)
+    backlogs = models.PositiveSmallIntegerField(blank=True, null=True)
+    history_of_arrears = models.BooleanField(blank=True, null=True)
+    tenth_marks = models.DecimalField(max_digits=5, decimal_places=2, blank=True, null=True) # Percentage
+    twelfth_marks = models.DecimalField(max_digits=5, decimal_places=2, blank=True, null=True) # Percentage
     password_hash = models.CharField(max_length=255, blank=True, null=True) # For simple auth if not using User
 
+    class Meta:
+        indexes = [
+            # Eligibility lookups: department/year equality first, then the CGPA range
+            models.Index(fields=['department', 'year', 'cgpa'], name='student_dept_year_cgpa_idx'),
+            models.Index(fields=['cgpa', 'backlogs'], name='student_cgpa_backlogs_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
+    def set_password(self, raw_password):
+        self.password_hash = make_password(raw_password)
+
+    def check_password(self, raw_password):
+        """Verifies a login, rehashing the stored password when the configured cost changed."""
+        def upgrade(raw_password):
+            self.set_password(raw_password)
+            self.save(update_fields=['password_hash'])
+        return check_password(raw_password, self.password_hash, upgrade)
+
 # Placement Model
 class Placement(models.Model):
     company_name = models.CharField(max_length=255)
@@ -31,13 +52,43 @@ class Placement(models.Model):
     time = models.TimeField()
     venue = models.CharField(max_length=255)
     roles = models.TextField() # Comma separated
-    eligibility = models.CharField(max_length=255)
+    eligibility = models.CharField(max_length=255) # Human readable summary
+    # Structured eligibility criteria; empty means "no restriction"
+    min_cgpa = models.DecimalField(max_digits=4, decimal_places=2, blank=True, null=True)
+    max_backlogs = models.PositiveSmallIntegerField(blank=True, null=True)
+    allowed_departments = models.CharField(max_length=255, blank=True, default='') # Comma separated
+    allowed_years = models.CharField(max_length=50, blank=True, default='') # Comma separated
     package = models.CharField(max_length=255)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Date windows of the timeline (core/utils/timeline.py) and reminders
+            models.Index(fields=['date', 'time'], name='placement_date_time_idx'),
+        ]
+
     def __str__(self):
         return self.company_name
 
+    def eligible_students(self):
+        """Students meeting the structured criteria, as a single indexed query."""
+        students = Student.objects.all()
+        if self.min_cgpa is not None:
+            students = students.filter(cgpa__gte=self.min_cgpa)
+        if self.max_backlogs is not None:
+            students = students.filter(backlogs__lte=self.max_backlogs)
+        departments = [d.strip() for d in self.allowed_departments.split(',') if d.strip()]
+        if departments:
+            students = students.filter(department__in=departments)
+        years = [y.strip() for y in self.allowed_years.split(',') if y.strip()]
+        if years:
+            students = students.filter(year__in=years)
+        return students
+
+    def role_names(self):
+        names = [r.strip() for r in self.roles.split(',') if r.strip()]
+        return list(dict.fromkeys(names))
+
 # Event Model
 class Event(models.Model):
     event_name = models.CharField(max_length=255)
@@ -51,6 +102,11 @@ class Event(models.Model):
     contact_number = models.CharField(max_length=20, blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['date', 'time'], name='event_date_time_idx'),
+        ]
+
     def __str__(self):
         return self.event_name
 
@@ -63,28 +119,237 @@ class Competition(models.Model):
     prize = models.CharField(max_length=255)
     team_size = models.CharField(max_length=50, blank=True, null=True)
     type = models.CharField(max_length=50, blank=True, null=True) # Individual, Team
+    # Seats; no capacity means unlimited. seats_taken is maintained by core/utils/seats.py
+    capacity = models.PositiveIntegerField(blank=True, null=True)
+    seats_taken = models.PositiveIntegerField(default=0)
 
     def __str__(self):
         return f"{self.event.event_name} - {self.name}"
 
+# One role of a placement drive, created from Placement.roles (see signals).
+# Also the role's seat pool and its applicant counter, both kept up to date by
+# core/utils/seats.py so per-role stats never count registrations.
+class PlacementRole(models.Model):
+    placement = models.ForeignKey(Placement, related_name='role_pools', on_delete=models.CASCADE)
+    name = models.CharField(max_length=255) # Matches PlacementRegistration.role_name
+    capacity = models.PositiveIntegerField(blank=True, null=True) # No capacity means unlimited
+    seats_taken = models.PositiveIntegerField(default=0)
+    applicant_count = models.PositiveIntegerField(default=0) # Registrations, waitlisted included
+
+    class Meta:
+        unique_together = ('placement', 'name')
+        indexes = [
+            models.Index(fields=['-applicant_count'], name='prole_applicants_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.placement.company_name} - {self.name}"
+
 # Registrations
 class PlacementRegistration(models.Model):
+    STATUS_APPLIED = 'Applied'
+    STATUS_SHORTLISTED = 'Shortlisted'
+    STATUS_SELECTED = 'Selected'
+    STATUS_REJECTED = 'Rejected'
+    # Where each status may move next; Selected and Rejected are final
+    STATUS_TRANSITIONS = {
+        STATUS_APPLIED: {STATUS_SHORTLISTED, STATUS_REJECTED},
+        STATUS_SHORTLISTED: {STATUS_SELECTED, STATUS_REJECTED},
+        STATUS_SELECTED: set(),
+        STATUS_REJECTED: set(),
+    }
+
     student = models.ForeignKey(Student, on_delete=models.CASCADE)
     placement = models.ForeignKey(Placement, on_delete=models.CASCADE)
-    role_name = models.CharField(max_length=255)
+    role = models.ForeignKey(PlacementRole, related_name='registrations', on_delete=models.RESTRICT)
+    role_name = models.CharField(max_length=255) # Copy of role.name, kept for filters and older clients
     resume = models.FileField(upload_to='resumes/', blank=True, null=True)
     resume_name = models.CharField(max_length=255, blank=True, null=True)
     registered_at = models.DateTimeField(auto_now_add=True)
-    status = models.CharField(max_length=50, default='Applied')
+    status = models.CharField(max_length=50, default=STATUS_APPLIED)
+    waitlisted = models.BooleanField(default=False) # Role was full; promoted in order when a seat frees up
 
     class Meta:
         unique_together = ('student', 'placement', 'role_name')
+        indexes = [
+            models.Index(fields=['role', 'waitlisted', 'registered_at'], name='preg_role_waitlist_idx'),
+            models.Index(fields=['student', 'registered_at'], name='preg_student_registered_idx'),
+            models.Index(fields=['placement', 'status', 'registered_at'], name='preg_placement_status_idx'),
+            models.Index(fields=['status', 'registered_at'], name='preg_status_registered_idx'),
+            # Unfiltered cursor pages (see core/pagination.py)
+            models.Index(fields=['registered_at', 'id'], name='preg_registered_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        # Registrations made with just a role name get (or add) the placement's role
+        if self.role_id is None and self.placement_id is not None:
+            self.role, _ = PlacementRole.objects.get_or_create(placement_id=self.placement_id, name=self.role_name)
+        creating = self._state.adding
+        # The counter moves with the INSERT; no savepoint, so inside the registering transaction it costs one UPDATE
+        with transaction.atomic(savepoint=False):
+            super().save(*args, **kwargs)
+            if creating:
+                PlacementRole.objects.filter(pk=self.role_id).update(applicant_count=models.F('applicant_count') + 1)
+
+# Audit trail of PlacementRegistration.status; one `batch` per bulk transition
+class StatusChange(models.Model):
+    registration = models.ForeignKey(PlacementRegistration, related_name='status_changes', on_delete=models.CASCADE)
+    from_status = models.CharField(max_length=50)
+    to_status = models.CharField(max_length=50)
+    batch = models.UUIDField(blank=True, null=True)
+    note = models.CharField(max_length=255, blank=True, default='')
+    changed_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['registration', 'changed_at'], name='statuschange_reg_idx'),
+            models.Index(fields=['batch'], name='statuschange_batch_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.registration_id}: {self.from_status} -> {self.to_status}"
 
 class EventRegistration(models.Model):
     student = models.ForeignKey(Student, on_delete=models.CASCADE)
     event = models.ForeignKey(Event, on_delete=models.CASCADE)
     competition = models.ForeignKey(Competition, on_delete=models.CASCADE)
     registered_at = models.DateTimeField(auto_now_add=True)
+    waitlisted = models.BooleanField(default=False) # Competition was full; promoted in order when a seat frees up
 
     class Meta:
         unique_together = ('student', 'competition')
+        indexes = [
+            models.Index(fields=['competition', 'waitlisted', 'registered_at'], name='ereg_waitlist_idx'),
+            models.Index(fields=['student', 'registered_at'], name='ereg_student_registered_idx'),
+            models.Index(fields=['event', 'registered_at'], name='ereg_event_registered_idx'),
+            models.Index(fields=['competition', 'registered_at'], name='ereg_competition_reg_idx'),
+            # Unfiltered cursor pages (see core/pagination.py)
+            models.Index(fields=['registered_at', 'id'], name='ereg_registered_idx'),
+        ]
+
+# Registration counts per placement drive (and status) or competition, split by
+# student department. Kept up to date by core/utils/analytics.py so dashboards
+# add up a few hundred rows instead of every registration.
+class RegistrationStat(models.Model):
+    placement = models.ForeignKey(Placement, blank=True, null=True, related_name='+', on_delete=models.CASCADE)
+    event = models.ForeignKey(Event, blank=True, null=True, related_name='+', on_delete=models.CASCADE)
+    competition = models.ForeignKey(Competition, blank=True, null=True, related_name='+', on_delete=models.CASCADE)
+    department = models.CharField(max_length=100)
+    status = models.CharField(max_length=50, blank=True, default='') # Placement registrations only
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['placement', 'department', 'status'], condition=models.Q(placement__isnull=False), name='regstat_placement_uniq'),
+            models.UniqueConstraint(fields=['competition', 'department'], condition=models.Q(competition__isnull=False), name='regstat_competition_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.placement_id or self.competition_id} {self.department} {self.status}: {self.count}"
+
+# Resume files, stored once per distinct content
+class ResumeBlob(models.Model):
+    sha256 = models.CharField(max_length=64, unique=True)
+    file = models.FileField(upload_to='resumes/')
+    size = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.file.name
+
+# Chunked resume upload in progress (see core/utils/resume_uploads.py)
+class ResumeUpload(models.Model):
+    STATUS_UPLOADING = 'uploading'
+    STATUS_COMPLETE = 'complete'
+    STATUS_CHOICES = [
+        (STATUS_UPLOADING, 'Uploading'),
+        (STATUS_COMPLETE, 'Complete'),
+    ]
+
+    # Random id: knowing it is what allows appending to the upload
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    filename = models.CharField(max_length=255)
+    size = models.PositiveIntegerField() # Declared total size in bytes
+    received = models.PositiveIntegerField(default=0) # Bytes stored so far; the next chunk's offset
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_UPLOADING)
+    blob = models.ForeignKey(ResumeBlob, blank=True, null=True, on_delete=models.SET_NULL)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.filename} ({self.received}/{self.size})"
+
+# Searchable text of placements, events and competitions, kept current by
+# core/signals.py and indexed with FTS5 / a GIN index (see core/utils/search.py)
+class SearchDocument(models.Model):
+    KIND_PLACEMENT = 'placement'
+    KIND_EVENT = 'event'
+    KIND_COMPETITION = 'competition'
+    KIND_CHOICES = [
+        (KIND_PLACEMENT, 'Placement'),
+        (KIND_EVENT, 'Event'),
+        (KIND_COMPETITION, 'Competition'),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    title = models.CharField(max_length=255)
+    body = models.TextField(blank=True, default='')
+    date = models.DateField(blank=True, null=True)
+
+    class Meta:
+        unique_together = ('kind', 'object_id')
+
+    def __str__(self):
+        return f"{self.kind}: {self.title}"
+
+# Outbound email queue, drained by `manage.py send_queued_emails`
+class OutboundEmail(models.Model):
+    STATUS_PENDING = 'pending'
+    STATUS_SENDING = 'sending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_SENDING, 'Sending'),
+        (STATUS_SENT, 'Sent'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=255)
+    to = models.TextField() # Comma separated
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True, null=True)
+    # When pending: earliest retry time. When sending: lease expiry of the claiming worker.
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    claim_token = models.CharField(max_length=32, blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='outbox_status_due_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {self.to}"
+
+# Reminders already delivered, so send_reminders can be re-run safely
+class SentReminder(models.Model):
+    KIND_EVENT = 'event'
+    KIND_PLACEMENT = 'placement'
+    KIND_CHOICES = [
+        (KIND_EVENT, 'Event'),
+        (KIND_PLACEMENT, 'Placement'),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField() # Event or Placement id
+    student = models.ForeignKey(Student, on_delete=models.CASCADE)
+    sent_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ('kind', 'object_id', 'student')
@@ -0,0 +1,29 @@
+from rest_framework.pagination import CursorPagination
+
+
+class OptionalCursorPagination(CursorPagination):
+    """
+    Keyset pagination over an indexed column.
+
+    Opt-in so existing clients keep receiving plain lists: a request is only
+    paginated when it passes ?cursor= or ?page_size=. Seeking to a page is an
+    index range scan (WHERE id < x ORDER BY id DESC LIMIT n), so it stays O(1)
+    and stable while new rows are being inserted.
+    """
+    ordering = '-id'
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if self.cursor_query_param not in params and self.page_size_query_param not in params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+
+class RegistrationCursorPagination(OptionalCursorPagination):
+    # registered_at repeats (bulk loads, one second clicks): id breaks the ties
+    # so page boundaries are deterministic. Served by the (registered_at, id)
+    # indexes, or the (student|placement|..., registered_at) ones when filtered
+    ordering = ('-registered_at', '-id')
@@ -1,38 +1,185 @@
+from django.contrib.auth.hashers import make_password
+from django.db.models import Count, F
 from rest_framework import serializers
-from .models import Student, Placement, Event, Competition, PlacementRegistration, EventRegistration
+from rest_framework.validators import UniqueTogetherValidator
+from .instrumentation import serializing
+from .models import Student, Placement, Event, Competition, PlacementRole, PlacementRegistration, EventRegistration, ResumeUpload, SearchDocument
 
-class StudentSerializer(serializers.ModelSerializer):
+
+def parse_list_param(request, name):
+    """Returns the comma separated values of a query param as a set, or None if absent."""
+    if request is None or name not in request.query_params:
+        return None
+    return {value.strip() for value in request.query_params[name].split(',') if value.strip()}
+
+
+def expanded_fields(request, expandable):
+    """
+    Resolves which nested blocks a response should include.
+
+    Without ?expand= every block is included (the historical behaviour).
+    ?expand=student,event (or the full `student_details` names) keeps only those,
+    and an empty ?expand= drops them all.
+    """
+    requested = parse_list_param(request, 'expand')
+    if requested is None:
+        return set(expandable)
+    return {name for name in expandable if name in requested or name.removesuffix('_details') in requested}
+
+
+class TimedRepresentationMixin:
+    """Counts the time spent building response data as the request's serializer time (Server-Timing, /api/metrics/)."""
+
+    def to_representation(self, instance):
+        with serializing():
+            return super().to_representation(instance)
+
+
+class DynamicFieldsMixin:
+    """
+    Sparse fieldsets for top-level serializers.
+
+    ?fields=id,status limits the plain fields in the response, ?expand= picks
+    the nested blocks listed in Meta.expandable_fields (see expanded_fields).
+    The nested blocks are read-only, so ?expand= also trims write responses;
+    ?fields= only applies to reads.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        if request is None:
+            return
+
+        expandable = getattr(self.Meta, 'expandable_fields', ())
+        keep_nested = expanded_fields(request, expandable)
+        requested = parse_list_param(request, 'fields') if request.method == 'GET' else None
+
+        for name in list(self.fields):
+            if name in expandable:
+                drop = name not in keep_nested
+            else:
+                drop = requested is not None and name not in requested
+            if drop:
+                self.fields.pop(name)
+
+
+class BlankAsNullMixin:
+    """
+    Forms post '' for untouched optional inputs; treat it as null for the fields in Meta.blank_as_null.
+
+    Marks typed as '85%' lose the sign for the fields in Meta.percent_fields, as in the roster import.
+    """
+
+    def to_internal_value(self, data):
+        percent = [name for name in getattr(self.Meta, 'percent_fields', ()) if isinstance(data.get(name), str) and '%' in data.get(name)]
+        if percent:
+            data = data.copy()
+            for name in percent:
+                data[name] = data[name].strip().rstrip('%').strip()
+        blank = [name for name in getattr(self.Meta, 'blank_as_null', ()) if data.get(name) == '']
+        if blank:
+            data = data.copy()
+            for name in blank:
+                data[name] = None
+        return super().to_internal_value(data)
+
+
+class StudentSerializer(TimedRepresentationMixin, BlankAsNullMixin, DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Student
         fields = '__all__'
         extra_kwargs = {'password_hash': {'write_only': True}}
+        blank_as_null = ('cgpa', 'backlogs', 'history_of_arrears', 'tenth_marks', 'twelfth_marks')
+        percent_fields = ('cgpa', 'tenth_marks', 'twelfth_marks')
+
+    def validate_password_hash(self, value):
+        # Clients send the plain password under this name; only the hash is stored
+        return make_password(value) if value else value
 
-class PlacementSerializer(serializers.ModelSerializer):
+class PlacementSerializer(TimedRepresentationMixin, BlankAsNullMixin, DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Placement
         fields = '__all__'
+        blank_as_null = ('min_cgpa', 'max_backlogs')
 
-class CompetitionSerializer(serializers.ModelSerializer):
+class CompetitionSerializer(TimedRepresentationMixin, DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Competition
+        # Competitions are served from the catalog cache; live seat counts are at /api/events/<id>/seats/
+        exclude = ('seats_taken',)
+
+class PlacementRoleSerializer(TimedRepresentationMixin, serializers.ModelSerializer):
+    class Meta:
+        model = PlacementRole
         fields = '__all__'
+        read_only_fields = ('seats_taken', 'applicant_count')
 
-class EventSerializer(serializers.ModelSerializer):
+class EventSerializer(TimedRepresentationMixin, DynamicFieldsMixin, serializers.ModelSerializer):
     competitions = CompetitionSerializer(many=True, read_only=True)
 
     class Meta:
         model = Event
         fields = '__all__'
+        expandable_fields = ('competitions',)
+
+class DatabaseUniqueMixin:
+    """
+    Leaves unique_together to the database when creating.
+
+    The generated UniqueTogetherValidator costs an extra query and still races
+    with concurrent requests; the views insert and turn the IntegrityError
+    into a 400 instead. Updates keep the validator.
+    """
 
-class PlacementRegistrationSerializer(serializers.ModelSerializer):
+    def get_validators(self):
+        if self.instance is None:
+            return [validator for validator in super().get_validators() if not isinstance(validator, UniqueTogetherValidator)]
+        return super().get_validators()
+
+class PlacementRegistrationSerializer(TimedRepresentationMixin, DatabaseUniqueMixin, DynamicFieldsMixin, serializers.ModelSerializer):
+    # Both come from the placement id and role_name, looked up together in validate()
+    placement = serializers.PrimaryKeyRelatedField(read_only=True)
+    role = serializers.PrimaryKeyRelatedField(read_only=True)
     student_details = StudentSerializer(source='student', read_only=True)
     placement_details = PlacementSerializer(source='placement', read_only=True)
 
     class Meta:
         model = PlacementRegistration
         fields = '__all__'
+        read_only_fields = ('waitlisted',)
+        expandable_fields = ('student_details', 'placement_details')
+
+    def validate_status(self, value):
+        if self.instance is None:
+            if value != PlacementRegistration.STATUS_APPLIED:
+                raise serializers.ValidationError(f"New registrations start as {PlacementRegistration.STATUS_APPLIED}.")
+        elif value != self.instance.status and value not in PlacementRegistration.STATUS_TRANSITIONS.get(self.instance.status, ()):
+            raise serializers.ValidationError(f"Cannot move from {self.instance.status} to {value}.")
+        return value
+
+    def validate(self, attrs):
+        if self.instance is not None:
+            # Counters and seats belong to the role; switching means cancelling and registering again
+            if attrs.get('role_name', self.instance.role_name) != self.instance.role_name:
+                raise serializers.ValidationError({'role_name': ['Cannot change the role of a registration.']})
+            return attrs
+        placement_id = str(self.initial_data.get('placement', ''))
+        if not placement_id.isdigit():
+            raise serializers.ValidationError({'placement': ['An existing placement id is required.']})
+        role = PlacementRole.objects.select_related('placement').filter(placement_id=placement_id, name=attrs['role_name']).first()
+        if role is None:
+            if not Placement.objects.filter(pk=placement_id).exists():
+                raise serializers.ValidationError({'placement': ['An existing placement id is required.']})
+            raise serializers.ValidationError({'role_name': ['Not a role of this placement.']})
+        attrs['role'] = role
+        attrs['placement'] = role.placement
+        return attrs
 
-class EventRegistrationSerializer(serializers.ModelSerializer):
+class EventRegistrationSerializer(TimedRepresentationMixin, DatabaseUniqueMixin, DynamicFieldsMixin, serializers.ModelSerializer):
+    # The event always comes from the competition (joined in the same query)
+    event = serializers.PrimaryKeyRelatedField(read_only=True)
+    competition = serializers.PrimaryKeyRelatedField(queryset=Competition.objects.select_related('event'))
     student_details = StudentSerializer(source='student', read_only=True)
     event_details = EventSerializer(source='event', read_only=True)
     competition_details = CompetitionSerializer(source='competition', read_only=True)
@@ -40,3 +187,135 @@ class EventRegistrationSerializer(serializers.ModelSerializer):
     class Meta:
         model = EventRegistration
         fields = '__all__'
+        read_only_fields = ('waitlisted',)
+        expandable_fields = ('student_details', 'event_details', 'competition_details')
+
+    def validate(self, attrs):
+        competition = attrs.get('competition')
+        if competition is not None:
+            event_id = self.initial_data.get('event')
+            if event_id not in (None, '') and str(event_id) != str(competition.event_id):
+                raise serializers.ValidationError({'event': ['Competition does not belong to this event.']})
+            attrs['event'] = competition.event
+        if self.instance is not None and competition is not None and competition.pk != self.instance.competition_id:
+            # Seats belong to the competition; switching means cancelling and registering again
+            raise serializers.ValidationError({'competition': ['Cannot change the competition of a registration.']})
+        return attrs
+
+class ResumeUploadSerializer(TimedRepresentationMixin, serializers.ModelSerializer):
+    class Meta:
+        model = ResumeUpload
+        fields = ('id', 'filename', 'size', 'received', 'status', 'created_at')
+        read_only_fields = ('received', 'status', 'created_at')
+
+class SearchResultSerializer(TimedRepresentationMixin, serializers.ModelSerializer):
+    id = serializers.IntegerField(source='object_id')
+    excerpt = serializers.SerializerMethodField()
+    rank = serializers.SerializerMethodField()
+
+    class Meta:
+        model = SearchDocument
+        fields = ('kind', 'id', 'title', 'date', 'excerpt', 'rank')
+
+    def get_excerpt(self, obj):
+        return obj.body[:200]
+
+    def get_rank(self, obj):
+        rank = getattr(obj, 'rank', None)
+        return round(rank, 4) if rank is not None else None
+
+class SummarySerializer:
+    """
+    Read-only list rows straight from a .values() query (?summary=true on list actions).
+
+    A subclass names the columns in `fields`, with joined or computed ones as
+    query expressions in `annotations`. Rows skip DRF's per-field machinery:
+    only the columns whose JSON form differs from the database value (dates,
+    times, decimals) are converted, by the ModelSerializer fields that would
+    have rendered them, built once per class. ?fields= narrows the columns.
+    """
+    model = None
+    fields = ()
+    annotations = {}
+    CONVERTED = (serializers.DateField, serializers.DateTimeField, serializers.TimeField, serializers.DecimalField)
+
+    @classmethod
+    def converters(cls):
+        if '_converters' not in cls.__dict__:
+            model_fields = [name for name in cls.fields if name not in cls.annotations]
+            meta = type('Meta', (), {'model': cls.model, 'fields': model_fields})
+            fields = type(f'{cls.__name__}Fields', (serializers.ModelSerializer,), {'Meta': meta})().fields
+            cls._converters = [(name, field.to_representation) for name, field in fields.items() if isinstance(field, cls.CONVERTED)]
+        return cls._converters
+
+    @classmethod
+    def columns(cls, request=None):
+        requested = parse_list_param(request, 'fields')
+        return [name for name in cls.fields if requested is None or name in requested]
+
+    @classmethod
+    def project(cls, queryset, request=None, ordering=()):
+        """
+        The queryset as dicts of the summary columns.
+
+        `ordering` names columns the paginator reads its cursor from; they are
+        selected even when ?fields= leaves them out (represent() drops them).
+        """
+        names = cls.columns(request)
+        annotations = {name: expression for name, expression in cls.annotations.items() if name in names}
+        names += [name for name in ordering if name not in names]
+        # values() ignores select_related but would still run the prefetches
+        return queryset.prefetch_related(None).annotate(**annotations).values(*names)
+
+    @classmethod
+    def represent(cls, rows, request=None):
+        with serializing():
+            converters = cls.converters()
+            rows = list(rows)
+            # Ordering columns project() only added for the cursor; copies, as
+            # the paginator still reads them from its page for the next link
+            extra = set(rows[0]).difference(cls.columns(request)) if rows else ()
+            if extra:
+                rows = [{name: value for name, value in row.items() if name not in extra} for row in rows]
+            for row in rows:
+                for name, convert in converters:
+                    value = row.get(name)
+                    if value is not None:
+                        row[name] = convert(value)
+            return rows
+
+class StudentSummarySerializer(SummarySerializer):
+    model = Student
+    fields = ('id', 'register_number', 'name', 'email', 'department', 'year', 'cgpa')
+
+class PlacementSummarySerializer(SummarySerializer):
+    model = Placement
+    fields = ('id', 'company_name', 'logo', 'date', 'time', 'venue', 'roles', 'package', 'min_cgpa')
+
+class EventSummarySerializer(SummarySerializer):
+    model = Event
+    fields = ('id', 'event_name', 'image', 'date', 'time', 'venue', 'competition_count')
+    annotations = {'competition_count': Count('competitions')}
+
+class CompetitionSummarySerializer(SummarySerializer):
+    model = Competition
+    fields = ('id', 'event', 'name', 'type', 'team_size', 'prize', 'capacity')
+
+class PlacementRegistrationSummarySerializer(SummarySerializer):
+    model = PlacementRegistration
+    fields = (
+        'id', 'student', 'placement', 'role', 'role_name', 'status', 'waitlisted', 'registered_at',
+        'student_name', 'register_number', 'company_name',
+    )
+    annotations = {'student_name': F('student__name'), 'register_number': F('student__register_number'), 'company_name': F('placement__company_name')}
+
+class EventRegistrationSummarySerializer(SummarySerializer):
+    model = EventRegistration
+    fields = (
+        'id', 'student', 'event', 'competition', 'waitlisted', 'registered_at',
+        'student_name', 'register_number', 'event_name', 'competition_name',
+    )
+    annotations = {
+        'student_name': F('student__name'), 'register_number': F('student__register_number'),
+        'event_name': F('event__event_name'), 'competition_name': F('competition__name'),
+    }
@@ -0,0 +1,119 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .cache import invalidate_catalog
+from .models import Competition, Event, EventRegistration, Placement, PlacementRegistration, SearchDocument, StatusChange, Student
+from .utils import analytics, search, seats
+
+
+@receiver([post_save, post_delete], sender=Placement)
+def placement_changed(sender, **kwargs):
+    invalidate_catalog('placements')
+
+
+@receiver([post_save, post_delete], sender=Event)
+def event_changed(sender, **kwargs):
+    invalidate_catalog('events')
+
+
+@receiver([post_save, post_delete], sender=Competition)
+def competition_changed(sender, **kwargs):
+    # Events embed their competitions
+    invalidate_catalog('events', 'competitions')
+
+
+@receiver(post_save, sender=Placement)
+def index_placement(sender, instance, **kwargs):
+    search.index_object(SearchDocument.KIND_PLACEMENT, instance)
+
+
+@receiver(post_save, sender=Placement)
+def placement_roles_changed(sender, instance, **kwargs):
+    seats.sync_roles(instance)
+
+
+@receiver(post_save, sender=Event)
+def index_event(sender, instance, **kwargs):
+    search.index_object(SearchDocument.KIND_EVENT, instance)
+    # Competition documents include the event name
+    for competition in instance.competitions.all():
+        competition.event = instance
+        search.index_object(SearchDocument.KIND_COMPETITION, competition)
+
+
+@receiver(post_save, sender=Competition)
+def index_competition(sender, instance, **kwargs):
+    search.index_object(SearchDocument.KIND_COMPETITION, instance)
+
+
+@receiver(post_delete, sender=Placement)
+def unindex_placement(sender, instance, **kwargs):
+    search.remove_object(SearchDocument.KIND_PLACEMENT, instance.pk)
+
+
+@receiver(post_delete, sender=Event)
+def unindex_event(sender, instance, **kwargs):
+    search.remove_object(SearchDocument.KIND_EVENT, instance.pk)
+
+
+@receiver(post_delete, sender=Competition)
+def unindex_competition(sender, instance, **kwargs):
+    search.remove_object(SearchDocument.KIND_COMPETITION, instance.pk)
+
+
+def deleted_with_pool(origin):
+    """True when the registration goes because its event/placement/competition is deleted."""
+    model = getattr(origin, 'model', type(origin))
+    return model in (Placement, Event, Competition)
+
+
+@receiver(post_delete, sender=PlacementRegistration)
+def placement_registration_deleted(sender, instance, origin=None, **kwargs):
+    # Covers API cancellations, admin deletes and cascades from Student alike;
+    # runs inside the delete's transaction. Stats of a deleted pool cascade away.
+    if deleted_with_pool(origin):
+        return
+    analytics.registration_removed(instance)
+    seats.withdraw_applicant(instance.role_id)
+    if not instance.waitlisted:
+        seats.release(seats.role_pool(instance.role_id), seats.role_waitlist(instance.role_id))
+
+
+@receiver(post_delete, sender=EventRegistration)
+def event_registration_deleted(sender, instance, origin=None, **kwargs):
+    if deleted_with_pool(origin):
+        return
+    analytics.registration_removed(instance)
+    if not instance.waitlisted:
+        seats.release(seats.competition_pool(instance.competition_id), seats.competition_waitlist(instance.competition_id))
+
+
+@receiver(post_save, sender=PlacementRegistration)
+@receiver(post_save, sender=EventRegistration)
+def registration_saved(sender, instance, created, **kwargs):
+    if created:
+        analytics.registration_added(instance)
+        return
+    old_status = instance.__dict__.pop('_stored_status', None)
+    if old_status is not None and old_status != instance.status:
+        analytics.status_changed(instance, old_status)
+        StatusChange.objects.create(registration=instance, from_status=old_status, to_status=instance.status)
+
+
+@receiver(pre_save, sender=PlacementRegistration)
+def remember_status(sender, instance, update_fields=None, **kwargs):
+    if not instance._state.adding and (update_fields is None or 'status' in update_fields):
+        instance._stored_status = sender.objects.filter(pk=instance.pk).values_list('status', flat=True).first()
+
+
+@receiver(pre_save, sender=Student)
+def remember_department(sender, instance, update_fields=None, **kwargs):
+    if not instance._state.adding and (update_fields is None or 'department' in update_fields):
+        instance._stored_department = sender.objects.filter(pk=instance.pk).values_list('department', flat=True).first()
+
+
+@receiver(post_save, sender=Student)
+def student_saved(sender, instance, created, **kwargs):
+    old_department = instance.__dict__.pop('_stored_department', None)
+    if old_department is not None and old_department != instance.department:
+        analytics.department_changed(instance.pk, old_department, instance.department)
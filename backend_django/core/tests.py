@@ -1,3 +1,1132 @@
-from django.test import TestCase
+import datetime
+import io
+import os
+import smtplib
+import tempfile
+import zipfile
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.mail.backends import locmem
+from django.core.cache import cache, caches
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase as DjangoTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.parsers import JSONParser
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from .auth import StudentTokenAuthentication, issue_token
+from . import metrics
+from .models import Student, Placement, Event, Competition, PlacementRole, PlacementRegistration, EventRegistration, OutboundEmail, SentReminder, ResumeBlob, ResumeUpload, StatusChange, SearchDocument
+from .throttling import ClientIPRateThrottle, StudentRateThrottle, registration_limiter
+from .utils import analytics, resume_uploads, synthetic
+from .utils.outbox import drain_outbox
+from .utils.student_import import import_students
+
+
+class TestCase(DjangoTestCase):
+    """Starts every test with empty throttle buckets, as student ids repeat across tests."""
+
+    def run(self, result=None):
+        caches[settings.THROTTLE_CACHE].clear()
+        return super().run(result)
+
+
+def make_student(n):
+    return Student.objects.create(
+        register_number=f'REG{n:05d}',
+        name=f'Student {n}',
+        email=f'student{n}@test.com',
+        phone='9876543210',
+        student_class='B.Tech',
+        department='CS',
+        year='4',
+        college='Engineering College',
+        password_hash='password123',
+    )
+
+
+def signed_in(student):
+    """Request kwargs carrying the student's Bearer token."""
+    return {'HTTP_AUTHORIZATION': f'Bearer {issue_token(student)}'}
+
+
+def make_placement(n):
+    return Placement.objects.create(
+        company_name=f'Company {n}',
+        description='Hiring drive',
+        date='2026-03-15',
+        time='10:00:00',
+        venue='Main Auditorium',
+        roles='Software Engineer,Data Analyst',
+        eligibility='B.Tech with 7.0+ CGPA',
+        package='8 LPA',
+    )
+
+
+def make_event(n, competitions=3):
+    event = Event.objects.create(
+        event_name=f'Event {n}',
+        description='Annual fest',
+        date='2026-03-18',
+        time='18:00:00',
+        venue='College Ground',
+    )
+    for c in range(competitions):
+        Competition.objects.create(event=event, name=f'Competition {n}.{c}', description='Contest', prize='1000')
+    return event
+
+
+class QueryBudgetTests(TestCase):
+    """List endpoints must issue a constant number of queries regardless of row count."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.counter = 0
+
+    def add_rows(self, count):
+        for _ in range(count):
+            self.counter += 1
+            student = make_student(self.counter)
+            placement = make_placement(self.counter)
+            event = make_event(self.counter)
+            PlacementRegistration.objects.create(student=student, placement=placement, role_name='Software Engineer')
+            EventRegistration.objects.create(student=student, event=event, competition=event.competitions.first())
+
+    def count_queries(self, url):
+        # The uncached path: catalog versions only move when a transaction commits
+        cache.clear()
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def assert_budget(self, url, budget):
+        self.add_rows(1)
+        small = self.count_queries(url)
+        self.add_rows(20)
+        large = self.count_queries(url)
+        self.assertEqual(small, large, f'{url} query count grows with row count ({small} -> {large})')
+        self.assertLessEqual(large, budget, f'{url} issued {large} queries, budget is {budget}')
+
+    def test_placement_registrations_list(self):
+        self.assert_budget('/api/registrations/placements/', 1)
+
+    def test_event_registrations_list(self):
+        self.assert_budget('/api/registrations/events/', 2)
+
+    def test_events_list(self):
+        self.assert_budget('/api/events/', 2)
+
+    def test_placements_list(self):
+        self.assert_budget('/api/placements/', 1)
+
+    def test_students_list(self):
+        self.assert_budget('/api/students/', 1)
+
+    def test_analytics(self):
+        self.assert_budget('/api/analytics/', 7)
+
+    def test_summary_lists(self):
+        for url in ['/api/registrations/placements/', '/api/registrations/events/', '/api/events/', '/api/students/']:
+            self.assert_budget(f'{url}?summary=true', 1)
+
+
+class PaginationAndFieldsTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        for n in range(5):
+            student = make_student(n)
+            PlacementRegistration.objects.create(student=student, placement=make_placement(n), role_name='Software Engineer')
+
+    def test_unpaginated_by_default(self):
+        response = self.client.get('/api/registrations/placements/')
+        self.assertEqual(len(response.json()), 5)
+
+    def test_cursor_pages_cover_all_rows_once(self):
+        seen = []
+        url = '/api/registrations/placements/?page_size=2'
+        while url:
+            page = self.client.get(url).json()
+            seen.extend(row['id'] for row in page['results'])
+            url = page['next']
+        self.assertEqual(sorted(seen), sorted(PlacementRegistration.objects.values_list('id', flat=True)))
+        self.assertEqual(len(seen), len(set(seen)))
+
+    def test_sparse_fields_skip_nested_blocks_and_joins(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/registrations/placements/?fields=id,status&expand=')
+        self.assertEqual(set(response.json()[0]), {'id', 'status'})
+        self.assertNotIn('JOIN', ctx.captured_queries[0]['sql'])
+
+    def test_expand_keeps_requested_block(self):
+        response = self.client.get('/api/registrations/placements/?fields=id&expand=student')
+        self.assertEqual(set(response.json()[0]), {'id', 'student_details'})
+
+    def test_registered_date_range_is_inclusive(self):
+        for day, pk in enumerate(PlacementRegistration.objects.order_by('id').values_list('id', flat=True), start=1):
+            PlacementRegistration.objects.filter(pk=pk).update(registered_at=datetime.datetime(2026, 3, day, 18, tzinfo=datetime.timezone.utc))
+
+        def days(query):
+            response = self.client.get(f'/api/registrations/placements/?fields=registered_at&{query}')
+            return sorted(row['registered_at'][:10] for row in response.json())
+
+        self.assertEqual(days('registered_after=2026-03-02&registered_before=2026-03-04'), ['2026-03-02', '2026-03-03', '2026-03-04'])
+        self.assertEqual(days('registered_after=2026-03-04T20:00:00Z'), ['2026-03-05'])
+        self.assertEqual(days('registered_before=2026-03-01'), ['2026-03-01'])
+        response = self.client.get('/api/registrations/placements/?registered_after=March')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('registered_after', response.json())
+
+
+class SummaryListTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        student = make_student(1)
+        student.cgpa = '8.5'
+        student.save()
+        self.placement = make_placement(1)
+        PlacementRegistration.objects.create(student=student, placement=self.placement, role_name='Software Engineer')
+        event = make_event(1)
+        EventRegistration.objects.create(student=student, event=event, competition=event.competitions.first())
+
+    def assert_matches_full_list(self, url, joined=()):
+        full = self.client.get(url).json()[0]
+        summary = self.client.get(f'{url}?summary=true').json()[0]
+        self.assertEqual({name: full[name] for name in summary if name not in joined}, {name: summary[name] for name in summary if name not in joined})
+        return full, summary
+
+    def test_summary_columns_render_like_the_full_serializers(self):
+        self.assert_matches_full_list('/api/students/')
+        self.assert_matches_full_list('/api/placements/')
+        self.assert_matches_full_list('/api/competitions/')
+        full, summary = self.assert_matches_full_list('/api/events/', joined=('competition_count',))
+        self.assertEqual(summary['competition_count'], len(full['competitions']))
+        full, summary = self.assert_matches_full_list('/api/registrations/placements/', joined=('student_name', 'register_number', 'company_name'))
+        self.assertEqual((summary['register_number'], summary['company_name']), (full['student_details']['register_number'], 'Company 1'))
+        full, summary = self.assert_matches_full_list('/api/registrations/events/', joined=('student_name', 'register_number', 'event_name', 'competition_name'))
+        self.assertEqual(summary['competition_name'], full['competition_details']['name'])
+        self.assertNotIn('password_hash', self.client.get('/api/students/?summary=true').json()[0])
+
+    def test_summary_takes_filters_fields_and_cursors(self):
+        PlacementRegistration.objects.create(student=make_student(2), placement=self.placement, role_name='Data Analyst')
+        response = self.client.get(f'/api/registrations/placements/?summary=true&placement={self.placement.id}&role_name=Data Analyst&fields=id,register_number')
+        self.assertEqual(response.json(), [{'id': PlacementRegistration.objects.get(role_name='Data Analyst').id, 'register_number': 'REG00002'}])
+        page = self.client.get('/api/registrations/placements/?summary=true&page_size=1').json()
+        self.assertEqual(len(page['results']), 1)
+        self.assertEqual(len(self.client.get(page['next']).json()['results']), 1)
+
+    def test_cursor_pages_without_the_ordering_column(self):
+        PlacementRegistration.objects.create(student=make_student(2), placement=self.placement, role_name='Data Analyst')
+        page = self.client.get('/api/registrations/placements/?summary=true&fields=id,status&page_size=1').json()
+        self.assertEqual(list(page['results'][0]), ['id', 'status'])
+        rest = self.client.get(page['next']).json()['results']
+        self.assertEqual(list(rest[0]), ['id', 'status'])
+        self.assertEqual({page['results'][0]['id'], rest[0]['id']}, set(PlacementRegistration.objects.values_list('id', flat=True)))
+
+
+class RegistrationCreateTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.student = make_student(1)
+        self.placement = make_placement(1)
+        self.event = make_event(1, competitions=1)
+        self.competition = self.event.competitions.get()
+
+    def register_placement(self, student=None):
+        student = student or self.student
+        return self.client.post('/api/registrations/placements/?expand=', {
+            'student': student.id, 'placement': self.placement.id, 'role_name': 'Software Engineer',
+        }, **signed_in(student))
+
+    def test_duplicate_is_rejected_by_the_constraint_with_400(self):
+        # A classmate's registration creates the stats row this one increments
+        self.register_placement(make_student(2))
+        # student, role joined with its placement, seat claim, INSERT, applicant counter,
+        # stats row, queued email (+ the savepoint pair); no exists() pre-check or re-fetch
+        with self.assertNumQueries(9):
+            self.assertEqual(self.register_placement().status_code, 201)
+        response = self.register_placement()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': 'Already registered'})
+        self.assertEqual(PlacementRegistration.objects.count(), 2)
+        self.assertEqual(OutboundEmail.objects.count(), 2)
+
+    def test_event_comes_from_the_competition(self):
+        payload = {'student': self.student.id, 'event': self.event.id, 'competition': self.competition.id}
+        classmate = make_student(2)
+        self.client.post('/api/registrations/events/', {**payload, 'student': classmate.id}, **signed_in(classmate))
+        self.client.credentials(**signed_in(self.student))
+        # student, competition joined with its event, seat claim, INSERT, stats row, queued email (+ savepoint pair)
+        with self.assertNumQueries(8):
+            self.assertEqual(self.client.post('/api/registrations/events/?expand=', payload).status_code, 201)
+        self.assertEqual(self.client.post('/api/registrations/events/', payload).status_code, 400)
+
+        other = make_event(2, competitions=1)
+        response = self.client.post('/api/registrations/events/', {**payload, 'event': other.id})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('event', response.json())
+        self.assertEqual(EventRegistration.objects.count(), 2)
+
+
+class AdmissionTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        metrics.reset()
+        self.student = make_student(1)
+        self.placements = [make_placement(n) for n in range(3)]
+
+    def register(self, placement, student=None):
+        student = student or self.student
+        return self.client.post('/api/registrations/placements/', {
+            'student': student.id, 'placement': placement.id, 'role_name': 'Software Engineer',
+        }, **signed_in(student))
+
+    def admission_counts(self):
+        return {
+            (c['labels']['outcome'], c['labels'].get('scope')): c['value']
+            for c in self.client.get('/api/metrics/').json()['counters'] if c['name'] == 'registration_admission'
+        }
+
+    def test_student_bucket_refuses_with_retry_after(self):
+        rates = {**settings.REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'], 'registration_student': '2/min'}
+        with override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': rates}):
+            self.assertEqual(self.register(self.placements[0]).status_code, 201)
+            self.assertEqual(self.register(self.placements[1]).status_code, 201)
+            response = self.register(self.placements[2])
+            self.assertEqual(response.status_code, 429)
+            self.assertEqual(response['Retry-After'], '30')
+            # Other students have their own bucket
+            self.assertEqual(self.register(self.placements[2], make_student(2)).status_code, 201)
+        self.assertEqual(PlacementRegistration.objects.count(), 3)
+        self.assertEqual(self.admission_counts(), {('admitted', None): 3, ('throttled', 'registration_student'): 1})
+
+    @override_settings(REGISTRATION_MAX_CONCURRENCY=1, REGISTRATION_ADMISSION_TIMEOUT=0)
+    def test_full_concurrency_limit_answers_429_at_once(self):
+        self.assertTrue(registration_limiter.acquire())
+        try:
+            response = self.register(self.placements[0])
+        finally:
+            registration_limiter.release()
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], str(settings.REGISTRATION_RETRY_AFTER))
+        self.assertEqual(self.register(self.placements[0]).status_code, 201)
+        self.assertEqual(self.admission_counts(), {('admitted', None): 1, ('overloaded', None): 1})
+
+    def test_ip_bucket_keys_on_the_address_the_proxy_saw(self):
+        factory = APIRequestFactory()
+        with override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'NUM_PROXIES': 1}):
+            keys = [
+                ClientIPRateThrottle().get_cache_key(factory.post('/', HTTP_X_FORWARDED_FOR=forwarded), None)
+                for forwarded in ('10.0.0.1', 'forged, 10.0.0.1', '10.0.0.2')
+            ]
+        self.assertEqual(keys[0], keys[1])
+        self.assertNotEqual(keys[0], keys[2])
+
+    def test_student_bucket_ignores_list_bodies(self):
+        request = Request(APIRequestFactory().post('/', [{'student': 1}], format='json'), parsers=[JSONParser()])
+        self.assertIsNone(StudentRateThrottle().get_cache_key(request, None))
+
+
+class InstrumentationTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        cache.clear()
+        metrics.reset()
+        make_placement(1)
+
+    def test_requests_are_timed_per_route(self):
+        response = self.client.get('/api/placements/')
+        timing = dict(part.split(';', 1) for part in response['Server-Timing'].split(', '))
+        self.assertEqual(set(timing), {'total', 'db', 'serialize'})
+        self.assertIn('desc="1 queries"', timing['db'])
+
+        prometheus = self.client.get('/api/metrics/prometheus/').content.decode()
+        self.assertIn('campcon_http_requests_total{method="GET",route="placement-list",status="200"} 1', prometheus)
+        self.assertIn('campcon_http_request_db_queries_bucket{method="GET",route="placement-list",le="1"} 1', prometheus)
+        self.assertIn('campcon_http_request_duration_seconds_count{method="GET",route="placement-list"} 1', prometheus)
+        serializer_seconds = next(
+            c['value'] for c in metrics.counters()
+            if c['name'] == 'http_request_serializer_seconds' and c['labels']['route'] == 'placement-list'
+        )
+        self.assertGreater(serializer_seconds, 0)
+
+    def test_metrics_are_local_only(self):
+        self.assertEqual(self.client.get('/api/metrics/', REMOTE_ADDR='203.0.113.9').status_code, 403)
+        # Not fooled by a forwarded header unless proxies are trusted
+        self.assertEqual(self.client.get('/api/metrics/', REMOTE_ADDR='203.0.113.9', HTTP_X_FORWARDED_FOR='127.0.0.1').status_code, 403)
+        # A reverse proxy on the same host: the loopback address is not the client's
+        self.assertEqual(self.client.get('/api/metrics/', REMOTE_ADDR='127.0.0.1', HTTP_X_FORWARDED_FOR='203.0.113.9').status_code, 403)
+        with override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'NUM_PROXIES': 1}):
+            self.assertEqual(self.client.get('/api/metrics/', REMOTE_ADDR='127.0.0.1', HTTP_X_FORWARDED_FOR='203.0.113.9').status_code, 403)
+            self.assertEqual(self.client.get('/api/metrics/', REMOTE_ADDR='10.0.0.5', HTTP_X_FORWARDED_FOR='127.0.0.1').status_code, 200)
+
+    @override_settings(METRICS_TOKEN='scrape-secret')
+    def test_metrics_token_opens_metrics_from_anywhere(self):
+        self.assertEqual(self.client.get('/api/metrics/', REMOTE_ADDR='203.0.113.9', HTTP_X_METRICS_TOKEN='wrong').status_code, 403)
+        self.assertEqual(self.client.get('/api/metrics/', REMOTE_ADDR='203.0.113.9', HTTP_X_METRICS_TOKEN='scrape-secret').status_code, 200)
+
+
+class SeatTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.students = [make_student(n) for n in range(4)]
+        self.event = make_event(1, competitions=1)
+        self.competition = self.event.competitions.get()
+        self.competition.capacity = 2
+        self.competition.save()
+
+    def register(self, student):
+        return self.client.post('/api/registrations/events/', {'student': student.id, 'competition': self.competition.id}, **signed_in(student)).json()
+
+    def test_full_competition_waitlists_and_promotes_on_cancellation(self):
+        results = [self.register(student) for student in self.students[:3]]
+        self.assertEqual([r['waitlisted'] for r in results], [False, False, True])
+        self.competition.refresh_from_db()
+        self.assertEqual(self.competition.seats_taken, 2)
+
+        self.assertEqual(self.client.delete(f"/api/registrations/events/{results[0]['id']}/").status_code, 204)
+        self.assertFalse(EventRegistration.objects.get(pk=results[2]['id']).waitlisted)
+        self.competition.refresh_from_db()
+        self.assertEqual(self.competition.seats_taken, 2)
+        self.assertTrue(OutboundEmail.objects.filter(subject__startswith='You are off the waitlist').exists())
+
+        # Cancelling a waitlisted registration frees nothing
+        self.assertTrue(self.register(self.students[3])['waitlisted'])
+        EventRegistration.objects.get(student=self.students[3]).delete()
+        self.competition.refresh_from_db()
+        self.assertEqual(self.competition.seats_taken, 2)
+
+    def test_fill_levels_and_capacity_increase(self):
+        for student in self.students:
+            self.register(student)
+        levels = self.client.get(f'/api/events/{self.event.id}/seats/').json()
+        self.assertEqual(levels, [{'id': self.competition.id, 'name': self.competition.name, 'capacity': 2, 'seats_taken': 2, 'seats_left': 0, 'waitlisted': 2}])
+
+        self.client.patch(f'/api/competitions/{self.competition.id}/', {'capacity': 3})
+        self.assertEqual(EventRegistration.objects.filter(waitlisted=True).count(), 1)
+        self.assertEqual(self.client.get(f'/api/events/{self.event.id}/seats/').json()[0]['seats_taken'], 3)
+
+    def test_capped_role_waitlists_and_hands_seats_on(self):
+        placement = make_placement(1)
+        role = placement.role_pools.get(name='Data Analyst')
+        self.client.patch(f'/api/placement-roles/{role.id}/', {'capacity': 2})
+        for student in self.students:
+            self.client.post('/api/registrations/placements/', {'student': student.id, 'placement': placement.id, 'role_name': 'Data Analyst'}, **signed_in(student))
+        self.assertEqual(list(PlacementRegistration.objects.order_by('id').values_list('waitlisted', flat=True)), [False, False, True, True])
+        levels = {level['name']: level for level in self.client.get(f'/api/placements/{placement.id}/seats/').json()}
+        self.assertEqual((levels['Data Analyst']['waitlisted'], levels['Data Analyst']['applicants']), (2, 4))
+
+        # Deleting the student cascades to the registration and hands its seat on
+        self.students[0].delete()
+        self.assertEqual(PlacementRegistration.objects.filter(waitlisted=True).count(), 1)
+        role.refresh_from_db()
+        self.assertEqual((role.seats_taken, role.applicant_count), (2, 3))
+
+    def test_recount_repairs_drifted_counters(self):
+        for student in self.students[:3]:
+            self.register(student)
+        Competition.objects.filter(pk=self.competition.pk).update(seats_taken=0)
+        call_command('recount_seats', stdout=io.StringIO())
+        self.competition.refresh_from_db()
+        self.assertEqual(self.competition.seats_taken, 2)
+
+
+class PlacementRoleTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.placement = make_placement(1)
+        self.students = [make_student(n) for n in range(3)]
+
+    def register(self, student, role_name):
+        return self.client.post('/api/registrations/placements/', {'student': student.id, 'placement': self.placement.id, 'role_name': role_name}, **signed_in(student))
+
+    def test_roles_come_from_the_placement_and_count_applicants(self):
+        self.assertEqual(list(self.placement.role_pools.order_by('id').values_list('name', flat=True)), ['Software Engineer', 'Data Analyst'])
+        for student in self.students:
+            self.assertEqual(self.register(student, 'Data Analyst').status_code, 201)
+        self.register(self.students[0], 'Software Engineer')
+        self.assertIn('role_name', self.register(self.students[1], 'Astronaut').json())
+        PlacementRegistration.objects.filter(student=self.students[2]).delete()
+        self.assertEqual(PlacementRegistration.objects.get(student=self.students[0], role_name='Data Analyst').role.name, 'Data Analyst')
+
+        # Counters only: top roles, top names and the total
+        with self.assertNumQueries(3):
+            stats = self.client.get('/api/placement-roles/stats/').json()
+        self.assertEqual([(r['company_name'], r['name'], r['applicant_count']) for r in stats['roles']], [
+            ('Company 1', 'Data Analyst', 2), ('Company 1', 'Software Engineer', 1),
+        ])
+        self.assertEqual(stats['names'][0], {'name': 'Data Analyst', 'applicants': 2, 'drives': 1})
+        self.assertEqual(stats['total_applicants'], 3)
+
+    def test_edited_roles_are_added_and_roles_in_use_kept(self):
+        registration = self.register(self.students[0], 'Software Engineer').json()
+        self.placement.roles = 'Data Analyst, ML Engineer'
+        self.placement.save()
+        self.assertEqual(self.placement.role_pools.count(), 3)
+
+        response = self.client.patch(f"/api/registrations/placements/{registration['id']}/", {'role_name': 'ML Engineer'})
+        self.assertIn('role_name', response.json())
+        self.assertEqual(self.client.patch(f"/api/registrations/placements/{registration['id']}/", {'status': 'Shortlisted'}).status_code, 200)
+        role = self.placement.role_pools.get(name='Software Engineer')
+        self.assertEqual(self.client.delete(f'/api/placement-roles/{role.id}/').status_code, 400)
+
+        # Deleting the drive takes its roles and registrations together
+        self.placement.delete()
+        self.assertFalse(PlacementRole.objects.exists())
+
+
+class AnalyticsTests(TestCase):
+    def test_stats_follow_registrations_and_match_a_rebuild(self):
+        client = APIClient()
+        placement = make_placement(1)
+        event = make_event(1, competitions=2)
+        competition = event.competitions.order_by('id').first()
+        students = [make_student(n) for n in range(4)]
+        Student.objects.filter(pk=students[3].pk).update(department='ECE')
+        students[3].refresh_from_db()
+        registrations = [
+            client.post('/api/registrations/placements/', {'student': student.id, 'placement': placement.id, 'role_name': 'Software Engineer'}, **signed_in(student)).json()
+            for student in students
+        ]
+        for student in students[:2]:
+            client.post('/api/registrations/events/', {'student': student.id, 'competition': competition.id}, **signed_in(student))
+        client.patch(f"/api/registrations/placements/{registrations[0]['id']}/", {'status': 'Shortlisted'})
+        client.delete(f"/api/registrations/placements/{registrations[1]['id']}/")
+        students[2].department = 'ME'
+        students[2].save()
+
+        summary = client.get('/api/analytics/').json()
+        self.assertEqual(summary['totals'], {'students': 4, 'placements': 1, 'events': 1, 'placement_registrations': 3, 'event_registrations': 2})
+        self.assertEqual(summary['placements'][0]['by_status'], {'Applied': 2, 'Shortlisted': 1})
+        self.assertEqual([c['registrations'] for c in summary['events'][0]['competitions']], [2, 0])
+        self.assertEqual(summary['departments'], [
+            {'department': 'CS', 'placement_registrations': 1, 'event_registrations': 2},
+            {'department': 'ECE', 'placement_registrations': 1, 'event_registrations': 0},
+            {'department': 'ME', 'placement_registrations': 1, 'event_registrations': 0},
+        ])
+        self.assertEqual(summary['statuses'][0], {'status': 'Applied', 'count': 2, 'share': 0.6667})
+
+        # Imports that move a student to another department move the counts too
+        import_students(io.BytesIO(b'register_number,name,email,phone,class,department,year,college\nREG00003,Student 3,student3@test.com,1,B.Tech,CS,4,College\n'))
+        self.assertEqual(client.get('/api/analytics/').json()['departments'][0]['placement_registrations'], 2)
+
+        # Recounting from scratch agrees with the incremental updates
+        summary = client.get('/api/analytics/').json()
+        call_command('rebuild_registration_stats', stdout=io.StringIO())
+        self.assertEqual(client.get('/api/analytics/').json(), summary)
+
+        # Rows of a deleted drive go with it
+        placement.delete()
+        self.assertEqual(client.get('/api/analytics/').json()['totals']['placement_registrations'], 0)
+
+
+class BulkStatusTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.placement = make_placement(1)
+        self.ids = [
+            self.client.post('/api/registrations/placements/', {'student': student.id, 'placement': self.placement.id, 'role_name': 'Software Engineer'}, **signed_in(student)).json()['id']
+            for student in [make_student(n) for n in range(5)]
+        ]
+        OutboundEmail.objects.all().delete()
+
+    def bulk(self, payload):
+        return self.client.post('/api/registrations/placements/bulk-status/', payload, format='json')
+
+    def test_one_update_audit_and_emails_per_batch(self):
+        self.assertEqual(self.client.patch(f'/api/registrations/placements/{self.ids[0]}/', {'status': 'Rejected'}).status_code, 200)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.bulk({'status': 'Shortlisted', 'filters': {'placement': self.placement.id, 'status': 'Applied'}, 'note': 'Aptitude round'})
+        self.assertEqual(response.json()['updated'], 4)
+        updates = [q for q in ctx.captured_queries if q['sql'].startswith('UPDATE "core_placementregistration"')]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(StatusChange.objects.filter(note='Aptitude round').count(), 4)
+        self.assertEqual(OutboundEmail.objects.filter(subject__startswith='Application Shortlisted').count(), 4)
+
+        # Already there: nothing to do; a disallowed move rejects the whole batch
+        self.assertEqual(self.bulk({'status': 'Shortlisted', 'ids': self.ids[1:3]}).json()['updated'], 0)
+        response = self.bulk({'status': 'Selected', 'ids': self.ids[:3]})
+        self.assertEqual((response.status_code, response.json()['ids']), (400, [self.ids[0]]))
+        self.assertEqual(self.bulk({'status': 'Selected', 'ids': self.ids[1:3], 'notify': False}).json()['updated'], 2)
+        self.assertEqual(OutboundEmail.objects.count(), 4)
+
+        statuses = dict(PlacementRegistration.objects.values_list('id', 'status'))
+        self.assertEqual([statuses[pk] for pk in self.ids], ['Rejected', 'Selected', 'Selected', 'Shortlisted', 'Shortlisted'])
+        self.assertEqual(StatusChange.objects.count(), 7)
+        by_status = APIClient().get('/api/analytics/').json()['placements'][0]['by_status']
+        self.assertEqual(by_status, {'Rejected': 1, 'Selected': 2, 'Shortlisted': 2})
+
+    def test_large_batches_update_in_chunks(self):
+        with mock.patch('core.utils.status_changes.UPDATE_CHUNK', 2), CaptureQueriesContext(connection) as ctx:
+            response = self.bulk({'status': 'Shortlisted', 'filters': {'placement': self.placement.id}})
+        self.assertEqual(response.json()['updated'], 5)
+        updates = [q for q in ctx.captured_queries if q['sql'].startswith('UPDATE "core_placementregistration"')]
+        self.assertEqual(len(updates), 3)
+        self.assertEqual(set(PlacementRegistration.objects.values_list('status', flat=True)), {'Shortlisted'})
+
+    def test_rejects_bad_requests(self):
+        self.assertEqual(self.bulk({'status': 'Shortlisted'}).status_code, 400)
+        self.assertIn('Unknown status', self.bulk({'status': 'Hired', 'ids': self.ids}).json()['error'])
+        self.assertIn('ids', self.bulk({'status': 'Shortlisted', 'ids': 'all'}).json())
+        response = self.client.patch(f'/api/registrations/placements/{self.ids[0]}/', {'status': 'Selected'})
+        self.assertIn('status', response.json())
+        self.assertFalse(StatusChange.objects.exists())
+
+
+class OutboxTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.student = make_student(1)
+        self.placement = make_placement(1)
+
+    def register(self):
+        return self.client.post('/api/registrations/placements/', {
+            'student': self.student.id,
+            'placement': self.placement.id,
+            'role_name': 'Software Engineer',
+        }, **signed_in(self.student))
+
+    def test_registration_queues_instead_of_sending(self):
+        self.assertEqual(self.register().status_code, 201)
+        self.assertEqual(len(mail.outbox), 0)
+        queued = OutboundEmail.objects.get()
+        self.assertEqual(queued.status, OutboundEmail.STATUS_PENDING)
+        self.assertEqual(queued.to, self.student.email)
+
+    def test_drain_sends_and_marks_sent(self):
+        self.register()
+        self.assertEqual(drain_outbox(), (1, 0))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(OutboundEmail.objects.get().status, OutboundEmail.STATUS_SENT)
+        self.assertEqual(drain_outbox(), (0, 0))
+
+    def test_failure_backs_off_then_gives_up(self):
+        self.register()
+        with mock.patch('django.core.mail.backends.locmem.EmailBackend.send_messages', side_effect=OSError('boom')):
+            self.assertEqual(drain_outbox(max_attempts=2), (0, 1))
+            email = OutboundEmail.objects.get()
+            self.assertEqual((email.status, email.attempts), (OutboundEmail.STATUS_PENDING, 1))
+            # Not due yet because of the backoff
+            self.assertEqual(drain_outbox(max_attempts=2), (0, 0))
+            OutboundEmail.objects.update(next_attempt_at=email.created_at)
+            self.assertEqual(drain_outbox(max_attempts=2), (0, 1))
+        email.refresh_from_db()
+        self.assertEqual((email.status, email.attempts, email.last_error), (OutboundEmail.STATUS_FAILED, 2, 'boom'))
+
+    def test_smtp_outage_puts_the_batch_back(self):
+        with mock.patch('django.core.mail.backends.locmem.EmailBackend.open', side_effect=OSError('refused')) as smtp_open:
+            # Nothing due: no SMTP session at all
+            self.assertEqual(drain_outbox(), (0, 0))
+            self.assertEqual(smtp_open.call_count, 0)
+            self.register()
+            with self.assertRaises(OSError):
+                drain_outbox()
+        email = OutboundEmail.objects.get()
+        self.assertEqual((email.status, email.attempts, email.claim_token), (OutboundEmail.STATUS_PENDING, 0, None))
+
+    def test_reclaimed_lease_counts_as_an_attempt(self):
+        self.register()
+        OutboundEmail.objects.update(status=OutboundEmail.STATUS_SENDING, attempts=1, claim_token='crashed')
+        self.assertEqual(drain_outbox(max_attempts=3), (1, 0))
+        self.assertEqual(OutboundEmail.objects.get().attempts, 3)
+        OutboundEmail.objects.update(status=OutboundEmail.STATUS_SENDING, attempts=2, claim_token='crashed', next_attempt_at=OutboundEmail.objects.get().created_at)
+        self.assertEqual(drain_outbox(max_attempts=3), (0, 0))
+        self.assertEqual(OutboundEmail.objects.get().status, OutboundEmail.STATUS_FAILED)
+
+
+class SendRemindersTests(TestCase):
+    def test_one_message_per_recipient_and_idempotent_reruns(self):
+        event = make_event(1)
+        placement = make_placement(1)
+        for n in range(3):
+            student = make_student(n)
+            # Two competitions of the same event still mean one reminder
+            for competition in event.competitions.all()[:2]:
+                EventRegistration.objects.create(student=student, event=event, competition=competition)
+            PlacementRegistration.objects.create(student=student, placement=placement, role_name='Software Engineer')
+
+        call_command('send_reminders', date='2026-03-18', stdout=mock.MagicMock())
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertTrue(all(len(message.to) == 1 for message in mail.outbox))
+
+        call_command('send_reminders', date='2026-03-18', stdout=mock.MagicMock())
+        self.assertEqual(len(mail.outbox), 3)
+
+        call_command('send_reminders', date='2026-03-15', stdout=mock.MagicMock())
+        self.assertEqual(len(mail.outbox), 6)
+        self.assertEqual(SentReminder.objects.count(), 6)
+        # Worded from the date asked for, not always "tomorrow"
+        self.assertIn('scheduled for Sunday 15 March 2026.', mail.outbox[-1].body)
+
+    def test_reconnects_when_the_server_drops_the_session(self):
+        event = make_event(1)
+        EventRegistration.objects.create(student=make_student(1), event=event, competition=event.competitions.first())
+        send = locmem.EmailBackend.send_messages
+        attempts = []
+
+        def drop_first(backend, messages):
+            attempts.append(messages)
+            if len(attempts) == 1:
+                raise smtplib.SMTPServerDisconnected('Connection unexpectedly closed')
+            return send(backend, messages)
+
+        with mock.patch.object(locmem.EmailBackend, 'send_messages', autospec=True, side_effect=drop_first):
+            call_command('send_reminders', date='2026-03-18', stdout=mock.MagicMock())
+        self.assertEqual((len(attempts), len(mail.outbox), SentReminder.objects.count()), (2, 1, 1))
+
+
+class CatalogCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        make_placement(1)
+
+    def test_repeat_reads_skip_the_database(self):
+        first = self.client.get('/api/placements/')
+        with self.assertNumQueries(0):
+            second = self.client.get('/api/placements/')
+        self.assertEqual(first.json(), second.json())
+        self.assertEqual(first['ETag'], second['ETag'])
+
+    def test_conditional_requests_get_304(self):
+        etag = self.client.get('/api/placements/')['ETag']
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/placements/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_writes_invalidate_once_committed(self):
+        first = self.client.get('/api/placements/')
+        with self.captureOnCommitCallbacks(execute=True):
+            make_placement(2)
+            # Until the commit, readers keep the version the old rows were cached under
+            self.assertEqual(self.client.get('/api/placements/')['ETag'], first['ETag'])
+        response = self.client.get('/api/placements/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 2)
+
+    def test_last_modified_moves_on_within_the_same_second(self):
+        last_modified = self.client.get('/api/placements/')['Last-Modified']
+        with self.captureOnCommitCallbacks(execute=True):
+            make_placement(2)
+        response = self.client.get('/api/placements/', HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 2)
+
+    def test_competition_change_invalidates_events(self):
+        event = make_event(1, competitions=1)
+        self.assertEqual(len(self.client.get('/api/events/').json()[0]['competitions']), 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            Competition.objects.create(event=event, name='Late entry', description='Contest', prize='500')
+        self.assertEqual(len(self.client.get('/api/events/').json()[0]['competitions']), 2)
+
+
+class StudentImportTests(TestCase):
+    HEADER = 'register_number,name,email,phone,class,department,year,college\n'
+
+    def run_import(self, body, **kwargs):
+        return import_students(io.BytesIO((self.HEADER + body).encode()), chunk_size=2, **kwargs)
+
+    def test_upserts_and_reports_bad_rows_without_aborting(self):
+        make_student(1)
+        result = self.run_import(
+            'REG00001,Renamed,student1@test.com,1,B.Tech,CS,4,College\n'
+            'NEW1,New One,new1@test.com,1,B.Tech,CS,4,College\n'
+            'NEW2,Bad Email,not-an-email,1,B.Tech,CS,4,College\n'
+            'NEW3,Taken Email,student1@test.com,1,B.Tech,CS,4,College\n'
+            'NEW4,New Four,new4@test.com,1,B.Tech,CS,4,College\n'
+        )
+        self.assertEqual((result['created'], result['updated'], result['failed']), (2, 1, 2))
+        self.assertEqual(sorted(error['line'] for error in result['errors']), [4, 5])
+        self.assertEqual(Student.objects.get(register_number='REG00001').name, 'Renamed')
+        self.assertEqual(OutboundEmail.objects.count(), 2)
+
+    def test_reimport_leaves_omitted_columns_untouched(self):
+        student = make_student(1)
+        Student.objects.filter(pk=student.pk).update(cgpa='8.50', password_hash='hash-of-secret')
+        import_students(io.BytesIO(
+            b'register_number,name,email,phone,class,department,year,college,cgpa,password\n'
+            b'REG00001,Renamed,student1@test.com,1,B.Tech,CS,4,College,,\n'
+            b'NEW1,New One,new1@test.com,1,B.Tech,CS,4,College,7.5,secret\n'
+        ), send_welcome=False)
+        import_students(io.BytesIO(
+            b'{"register_number": "REG00001", "name": "Renamed", "email": "student1@test.com", "phone": "1", "class": "B.Tech", "department": "CS", "year": "3", "college": "College"}\n'
+            b'{"register_number": "NEW1", "name": "New One", "email": "new1@test.com", "phone": "1", "class": "B.Tech", "department": "CS", "year": "4", "college": "College", "cgpa": "7.5"}\n'
+        ), fmt='jsonl', send_welcome=False)
+        student.refresh_from_db()
+        self.assertEqual((student.name, student.year, str(student.cgpa), student.password_hash), ('Renamed', '3', '8.50', 'hash-of-secret'))
+        self.assertEqual(str(Student.objects.get(register_number='NEW1').cgpa), '7.50')
+
+    def test_failed_batch_counts_each_row_once(self):
+        def concurrent_insert(students):
+            # Takes NEW2's email after the chunk's email check
+            Student.objects.get_or_create(register_number='OTHER', defaults={
+                'name': 'Other', 'email': 'new2@test.com', 'phone': '1', 'student_class': 'B.Tech',
+                'department': 'CS', 'year': '4', 'college': 'College',
+            })
+
+        with mock.patch('core.utils.student_import.hash_student_passwords', side_effect=concurrent_insert):
+            result = import_students(io.BytesIO(
+                b'register_number,name,email,phone,class,department,year,college,cgpa\n'
+                b'NEW1,New One,new1@test.com,1,B.Tech,CS,4,College,\n'
+                b'NEW2,New Two,new2@test.com,1,B.Tech,CS,4,College,7.5\n'
+            ), chunk_size=2, send_welcome=False)
+        self.assertEqual((result['created'], result['updated'], result['failed']), (1, 0, 1))
+        self.assertEqual(result['errors'][0]['line'], 3)
+        self.assertTrue(Student.objects.filter(register_number='NEW1').exists())
+
+    @override_settings(PASSWORD_HASH_ITERATIONS=1000)
+    def test_bulk_import_is_staff_only_and_keeps_existing_passwords(self):
+        student = make_student(1)
+        student.set_password('secret')
+        student.save()
+        roster = (
+            b'register_number,name,email,phone,class,department,year,college,password\n'
+            b'REG00001,Student 1,student1@test.com,1,B.Tech,CS,4,College,reset\n'
+            b'NEW1,New One,new1@test.com,1,B.Tech,CS,4,College,hunter22\n'
+        )
+        client = APIClient()
+
+        def upload(**headers):
+            return client.post('/api/students/bulk-import/', {'file': SimpleUploadedFile('roster.csv', roster), 'send_welcome': 'false'}, **headers)
+
+        self.assertEqual(upload().status_code, 401)
+        self.assertEqual(upload(**signed_in(student)).status_code, 403)
+        client.force_authenticate(User.objects.create_user('staff', is_staff=True))
+        result = upload().json()
+        self.assertEqual((result['created'], result['updated']), (1, 1))
+        student.refresh_from_db()
+        self.assertTrue(student.check_password('secret'))
+        self.assertTrue(Student.objects.get(register_number='NEW1').check_password('hunter22'))
+
+
+@override_settings(PASSWORD_HASH_ITERATIONS=1000)
+class AuthTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.student = make_student(1)
+        self.student.set_password('secret')
+        self.student.save()
+
+    def login(self, password='secret'):
+        return self.client.post('/api/students/login/', {'register_number': 'REG00001', 'password': password}, format='json')
+
+    def test_registration_stores_a_hash(self):
+        response = self.client.post('/api/students/', {
+            'register_number': 'NEW1', 'name': 'New', 'email': 'new1@test.com', 'phone': '1', 'student_class': 'B.Tech',
+            'department': 'CS', 'year': '4', 'college': 'College', 'password_hash': 'hunter22',
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertNotIn('password_hash', response.json())
+        student = Student.objects.get(register_number='NEW1')
+        self.assertTrue(student.password_hash.startswith('pbkdf2_sha256$1000$'))
+        self.assertTrue(student.check_password('hunter22'))
+
+    def test_login_returns_a_token_checked_without_queries(self):
+        self.assertEqual(self.login('wrong').status_code, 400)
+        token = self.login().json()['token']
+        request = APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {token}')
+        with self.assertNumQueries(0):
+            user, _ = StudentTokenAuthentication().authenticate(request)
+        self.assertEqual(user.student_id, self.student.pk)
+
+        response = self.client.get('/api/students/me/', HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.assertEqual(response.json()['register_number'], 'REG00001')
+        self.assertEqual(self.client.get('/api/students/me/', HTTP_AUTHORIZATION=f'Bearer {token}x').status_code, 401)
+        self.assertEqual(self.client.get('/api/students/me/').status_code, 401)
+
+    def test_student_writes_need_that_students_token(self):
+        other = make_student(2)
+        placement = make_placement(1)
+        payload = {'student': self.student.id, 'placement': placement.id, 'role_name': 'Software Engineer'}
+        url = f'/api/students/{self.student.id}/'
+        self.assertEqual(self.client.post('/api/registrations/placements/', payload).status_code, 401)
+        self.assertEqual(self.client.post('/api/registrations/placements/', payload, **signed_in(other)).status_code, 403)
+        self.assertEqual(self.client.post('/api/registrations/placements/', [payload], format='json', **signed_in(other)).status_code, 403)
+        self.assertEqual(self.client.post('/api/registrations/placements/', payload, **signed_in(self.student)).status_code, 201)
+
+        self.assertEqual(self.client.patch(url, {'phone': '1'}).status_code, 401)
+        self.assertEqual(self.client.patch(url, {'phone': '1'}, **signed_in(other)).status_code, 403)
+        self.assertEqual(self.client.patch(url, {'phone': '1'}, **signed_in(self.student)).status_code, 200)
+
+    def test_login_rehashes_when_the_cost_changes(self):
+        with override_settings(PASSWORD_HASH_ITERATIONS=2000):
+            self.assertEqual(self.login().status_code, 200)
+        self.student.refresh_from_db()
+        self.assertTrue(self.student.password_hash.startswith('pbkdf2_sha256$2000$'))
+
+    def test_import_hashes_plain_passwords(self):
+        import_students(io.BytesIO(
+            b'register_number,name,email,phone,class,department,year,college,password\n'
+            b'NEW1,New One,new1@test.com,1,B.Tech,CS,4,College,hunter22\n'
+        ))
+        self.assertTrue(Student.objects.get(register_number='NEW1').check_password('hunter22'))
+
+
+@override_settings(PASSWORD_HASH_ITERATIONS=1000)
+class SyntheticDataTests(TestCase):
+    def generate(self, processes=1):
+        synthetic.generate(students=40, placements=4, events=2, registrations=150, seed=7, processes=processes)
+        return sorted(PlacementRegistration.objects.values_list('student__register_number', 'placement__company_name', 'role_name', 'status', 'registered_at'))
+
+    def test_counters_match_the_rows_and_the_seed_repeats(self):
+        registrations = self.generate()
+        self.assertEqual(len(registrations) + EventRegistration.objects.count(), 150)
+        for role in PlacementRole.objects.all():
+            self.assertEqual(role.applicant_count, role.registrations.count())
+        for competition in Competition.objects.all():
+            self.assertEqual(competition.seats_taken, EventRegistration.objects.filter(competition=competition).count())
+        self.assertEqual(analytics.summary()['totals']['placement_registrations'], len(registrations))
+        self.assertTrue(SearchDocument.objects.filter(kind=SearchDocument.KIND_PLACEMENT).exists())
+
+        synthetic.clear()
+        Placement.objects.all().delete()
+        Event.objects.all().delete()
+        self.assertEqual(self.generate(), registrations)
+
+    @mock.patch.object(synthetic, 'CHUNK_SIZE', 10)
+    def test_worker_processes_make_the_same_rows(self):
+        registrations = self.generate()
+        synthetic.clear()
+        Placement.objects.all().delete()
+        Event.objects.all().delete()
+        self.assertEqual(self.generate(processes=2), registrations)
+
+    def test_clear_leaves_the_counters_right(self):
+        student = make_student(1)
+        role = PlacementRegistration.objects.create(student=student, placement=make_placement(1), role_name='Software Engineer').role
+        self.generate()
+        synthetic.clear()
+        self.assertFalse(Student.objects.filter(register_number__startswith=synthetic.PREFIX).exists())
+        role.refresh_from_db()
+        self.assertEqual((role.applicant_count, role.seats_taken), (1, 1))
+        self.assertEqual(analytics.summary()['totals']['placement_registrations'], 1)
+
+
+class ResumeUploadTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        self.partial_dir = os.path.join(media.name, 'partial')
+        settings_override = override_settings(MEDIA_ROOT=media.name, RESUME_UPLOAD_DIR=self.partial_dir)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.registration = PlacementRegistration.objects.create(student=make_student(1), placement=make_placement(1), role_name='Software Engineer')
+
+    def upload(self, content, chunk_size=4):
+        upload = self.client.post('/api/resume-uploads/', {'filename': 'cv.pdf', 'size': len(content)}).json()
+        for offset in range(0, len(content), chunk_size):
+            response = self.client.put(
+                f"/api/resume-uploads/{upload['id']}/chunk/?offset={offset}",
+                content[offset:offset + chunk_size], content_type='application/octet-stream',
+            )
+            self.assertEqual(response.status_code, 200)
+        return upload['id']
+
+    def test_chunks_resume_from_the_server_offset(self):
+        upload = self.client.post('/api/resume-uploads/', {'filename': 'cv.pdf', 'size': 10}).json()
+        url = f"/api/resume-uploads/{upload['id']}/chunk/"
+        self.assertEqual(self.client.put(url + '?offset=0', b'%PDF-', content_type='application/octet-stream').json()['received'], 5)
+
+        # A retried (or out of order) chunk is refused with the offset to resume from
+        response = self.client.put(url + '?offset=0', b'%PDF-', content_type='application/octet-stream')
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()['received'], 5)
+        self.assertEqual(self.client.post(f"/api/resume-uploads/{upload['id']}/complete/").status_code, 409)
+
+        self.client.put(url + '?offset=5', b'1.7\n%', content_type='application/octet-stream')
+        self.assertEqual(self.client.post(f"/api/resume-uploads/{upload['id']}/complete/").json()['status'], 'complete')
+        response = self.client.post(f"/api/resume-uploads/{upload['id']}/attach/", {'registration': self.registration.id}, **signed_in(self.registration.student))
+        self.assertEqual(response.status_code, 200)
+        self.registration.refresh_from_db()
+        self.assertEqual(self.registration.resume.read(), b'%PDF-1.7\n%')
+        self.assertEqual(self.registration.resume_name, 'cv.pdf')
+        # The partial file is gone once stored
+        self.assertEqual(os.listdir(self.partial_dir), [])
+
+    def test_identical_resumes_share_one_blob(self):
+        for _ in range(2):
+            upload_id = self.upload(b'same resume bytes')
+            self.client.post(f'/api/resume-uploads/{upload_id}/complete/')
+        self.assertEqual(ResumeBlob.objects.count(), 1)
+        self.assertEqual(ResumeBlob.objects.get().size, len(b'same resume bytes'))
+
+    def test_racing_requests_see_the_locked_state(self):
+        upload_id = self.client.post('/api/resume-uploads/', {'filename': 'cv.pdf', 'size': 4}).json()['id']
+        first, second = ResumeUpload.objects.get(pk=upload_id), ResumeUpload.objects.get(pk=upload_id)
+        resume_uploads.write_chunk(first, io.BytesIO(b'%PDF'), 0, 4)
+        # The second request read the row before the first chunk landed
+        with self.assertRaises(resume_uploads.UploadError):
+            resume_uploads.write_chunk(second, io.BytesIO(b'XXXX'), 0, 4)
+        self.assertEqual(second.received, 4)
+
+        stale = ResumeUpload.objects.get(pk=upload_id)
+        resume_uploads.complete_upload(ResumeUpload.objects.get(pk=upload_id))
+        # A second complete of the same upload finds it done instead of a missing partial file
+        self.assertEqual(resume_uploads.complete_upload(stale).status, ResumeUpload.STATUS_COMPLETE)
+        self.assertEqual(ResumeBlob.objects.get().file.read(), b'%PDF')
+
+
+class ExportTests(TestCase):
+    def test_placement_export_streams_filtered_rows(self):
+        placement = make_placement(1)
+        for n in range(3):
+            PlacementRegistration.objects.create(student=make_student(n), placement=placement, role_name='Software Engineer')
+        PlacementRegistration.objects.filter(student__register_number='REG00002').update(status='Shortlisted')
+
+        response = APIClient().get('/api/registrations/placements/export/?status=Shortlisted', HTTP_ACCEPT='text/csv')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn('REG00002', lines[1])
+
+    def test_resume_bundle_streams_a_zip_named_by_register_number(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        client = APIClient()
+        placement = make_placement(1)
+        with override_settings(MEDIA_ROOT=media.name):
+            for n, role in [(1, 'Software Engineer'), (1, 'Data Analyst'), (2, 'Software Engineer'), (3, 'Data Analyst')]:
+                student = Student.objects.filter(register_number=f'REG{n:05d}').first() or make_student(n)
+                registration = PlacementRegistration.objects.create(student=student, placement=placement, role_name=role)
+                if n != 3:
+                    registration.resume.save('cv.pdf', ContentFile(f'resume {n} {role}'.encode()))
+            response = client.get(f'/api/registrations/placements/resumes/?placement={placement.id}')
+            self.assertTrue(response.streaming)
+            self.assertEqual(response['Content-Type'], 'application/zip')
+            archive = zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content)))
+
+        self.assertIsNone(archive.testzip())
+        self.assertEqual(archive.namelist(), [
+            'index.csv', 'resumes/REG00001.pdf', 'resumes/REG00001_software-engineer.pdf', 'resumes/REG00002.pdf',
+        ])
+        self.assertEqual(archive.read('resumes/REG00002.pdf'), b'resume 2 Software Engineer')
+        index = archive.read('index.csv').decode('utf-8-sig').splitlines()
+        self.assertEqual(len(index), 5)
+        self.assertTrue(index[4].startswith('REG00003,') and index[4].endswith(',Not uploaded'))
+
+        self.assertEqual(client.get('/api/registrations/placements/resumes/').status_code, 400)
+
+
+class SearchTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.placement = make_placement(1)
+        self.event = make_event(1, competitions=2)
+
+    def search(self, query, **params):
+        response = self.client.get('/api/search/', {'q': query, **params})
+        self.assertEqual(response.status_code, 200)
+        return [(result['kind'], result['id']) for result in response.json()]
+
+    def test_prefix_matching_ranking_and_kinds(self):
+        analytics = Placement.objects.create(
+            company_name='Analytica', description='Data Analyst hiring', date='2025-01-10', time='10:00',
+            venue='Hall', roles='Data Analyst', eligibility='Any', package='6 LPA',
+        )
+        self.assertEqual(self.search('softw eng'), [('placement', self.placement.id)])
+        # A title match outranks a match in the body
+        self.assertEqual(self.search('analy')[0], ('placement', analytics.id))
+        self.assertEqual(len(self.search('analy')), 2)
+        self.assertEqual(len(self.search('competition', kind='competition')), 2)
+        self.assertEqual(self.search('annual', kind='event'), [('event', self.event.id)])
+        self.assertEqual(self.search('   '), [])
+        self.assertEqual(self.client.get('/api/search/', {'q': 'x', 'kind': 'student'}).status_code, 400)
+
+    def test_signals_keep_the_index_current(self):
+        self.placement.company_name = 'Zephyr Systems'
+        self.placement.save()
+        self.assertEqual(self.search('zeph'), [('placement', self.placement.id)])
+        self.assertEqual(self.search('company 1'), [])
+
+        self.event.event_name = 'Technova'
+        self.event.save()
+        self.assertEqual(len(self.search('technova', kind='competition')), 2)
+
+        self.event.delete()
+        self.assertEqual(self.search('technova'), [])
+        call_command('rebuild_search_index', stdout=io.StringIO())
+        self.assertEqual(self.search('zeph'), [('placement', self.placement.id)])
+
+
+class TimelineTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.student = make_student(1)
+        self.placements = [make_placement(n) for n in range(3)]
+        self.events = [make_event(n, competitions=1) for n in range(2)]
+        # Placement 0 and event 0 on the same day, placement 2 long ago
+        for obj, day, at in [
+            (self.placements[0], '2026-03-10', '09:00'), (self.placements[1], '2026-03-12', '10:00'), (self.placements[2], '2019-01-01', '10:00'),
+            (self.events[0], '2026-03-10', '18:00'), (self.events[1], '2026-04-20', '18:00'),
+        ]:
+            type(obj).objects.filter(pk=obj.pk).update(date=day, time=at)
+        PlacementRegistration.objects.create(student=self.student, placement=self.placements[1], role_name='Data Analyst')
+        EventRegistration.objects.create(student=self.student, event=self.events[1], competition=self.events[1].competitions.first())
+
+    def timeline(self, **params):
+        response = self.client.get('/api/timeline/', params)
+        self.assertEqual(response.status_code, 200)
+        return [(entry['kind'], entry['id']) for entry in response.json()]
+
+    def test_window_merges_placements_and_events_in_one_query(self):
+        with self.assertNumQueries(1):
+            entries = self.timeline(**{'from': '2026-03-01', 'to': '2026-03-31'})
+        self.assertEqual(entries, [('placement', self.placements[0].id), ('event', self.events[0].id), ('placement', self.placements[1].id)])
+        self.assertEqual(self.timeline(**{'from': '2026-03-01', 'to': '2026-12-31', 'kind': 'event'}), [('event', self.events[0].id), ('event', self.events[1].id)])
+        self.assertEqual(self.timeline(**{'from': '2000-01-01', 'to': '2026-12-31', 'order': 'desc', 'limit': 2}), [('event', self.events[1].id), ('placement', self.placements[1].id)])
+        self.assertEqual(self.timeline(**{'from': '2000-01-01', 'to': '2030-01-01', 'student': self.student.id}), [('placement', self.placements[1].id), ('event', self.events[1].id)])
+        entry = self.client.get('/api/timeline/', {'from': '2019-01-01', 'to': '2019-01-01'}).json()[0]
+        self.assertEqual((entry['title'], entry['date'], entry['time'], entry['upcoming']), ('Company 2', '2019-01-01', '10:00:00', False))
+        self.assertEqual(self.client.get('/api/timeline/', {'from': 'March'}).status_code, 400)
+
+    def test_calendar_feed_of_a_students_registrations(self):
+        self.assertEqual(self.client.get('/api/students/me/calendar/').status_code, 401)
+        url = self.client.get('/api/students/me/calendar/', HTTP_AUTHORIZATION=f'Bearer {issue_token(self.student)}').json()['url']
+        with mock.patch('django.utils.timezone.localdate', return_value=datetime.date(2026, 3, 1)):
+            response = self.client.get(url)
+        self.assertEqual(response['Content-Type'], 'text/calendar; charset=utf-8')
+        feed = response.content.decode()
+        self.assertTrue(feed.startswith('BEGIN:VCALENDAR\r\n') and feed.endswith('END:VCALENDAR\r\n'))
+        self.assertEqual(feed.count('BEGIN:VEVENT'), 2)
+        self.assertIn('SUMMARY:Company 1 - Data Analyst\r\n', feed)
+        self.assertIn('DTSTART:20260312T100000\r\nDTEND:20260312T120000\r\n', feed)
+        self.assertIn('LOCATION:College Ground', feed)
+        self.assertTrue(all(len(line.encode()) <= 75 for line in feed.split('\r\n')))
+        self.assertEqual(self.client.get('/api/timeline/calendar/', {'token': 'forged'}).status_code, 403)
+
+
+class EligibilityTests(TestCase):
+    def test_structured_criteria_select_matching_students(self):
+        for n, (department, cgpa, backlogs) in enumerate([('CS', '8.20', 0), ('CS', '6.90', 0), ('IT', '9.10', 2), ('ME', '9.50', 0)]):
+            Student.objects.filter(pk=make_student(n).pk).update(department=department, cgpa=cgpa, backlogs=backlogs)
+        placement = make_placement(1)
+        Placement.objects.filter(pk=placement.pk).update(min_cgpa='7.00', max_backlogs=1, allowed_departments='CS, IT')
+
+        response = APIClient().get(f'/api/placements/{placement.pk}/eligible-students/')
+        self.assertEqual([row['register_number'] for row in response.json()], ['REG00000'])
+
+    def test_blank_numeric_inputs_are_stored_as_null(self):
+        response = APIClient().post('/api/students/', {
+            'register_number': 'NEW1', 'name': 'New', 'email': 'new@test.com', 'phone': '1', 'student_class': 'B.Tech',
+            'department': 'CS', 'year': '4', 'college': 'College', 'cgpa': '8.5', 'backlogs': '', 'history_of_arrears': 'No',
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual((response.json()['cgpa'], response.json()['backlogs'], response.json()['history_of_arrears']), ('8.50', None, False))
+
+    def test_percent_marks_are_accepted(self):
+        response = APIClient().post('/api/students/', {
+            'register_number': 'NEW1', 'name': 'New', 'email': 'new@test.com', 'phone': '1', 'student_class': 'B.Tech',
+            'department': 'CS', 'year': '4', 'college': 'College', 'tenth_marks': '85%', 'twelfth_marks': ' 91.5 % ',
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual((response.json()['tenth_marks'], response.json()['twelfth_marks']), ('85.00', '91.50'))
@@ -0,0 +1,123 @@
+import threading
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.settings import api_settings
+from rest_framework.throttling import SimpleRateThrottle
+
+# Registration creates are admitted in two steps (see UniqueRegistrationMixin):
+#
+# 1. Token buckets per student, per client IP and per endpoint. A rate of
+#    "10/min" is a bucket of 10 tokens refilled at 10 per minute, so a client
+#    can burst up to the rate and then goes at the refill speed. Buckets live in
+#    the 'throttle' cache (in-process by default).
+# 2. A cap on registrations in flight in this process. Requests over it are
+#    answered 429 straight away rather than queueing for a database that is
+#    already saturated.
+#
+# Both answer 429 with a Retry-After header.
+
+_bucket_lock = threading.Lock()
+
+
+class TokenBucketThrottle(SimpleRateThrottle):
+    """SimpleRateThrottle's rate format and cache keys, with a token bucket instead of a request log."""
+
+    @property
+    def cache(self):
+        return caches[settings.THROTTLE_CACHE]
+
+    def get_rate(self):
+        # Looked up per request so override_settings() applies; a missing scope is no limit
+        return api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        refill = self.num_requests / self.duration  # tokens per second
+        # Makes the read-modify-write atomic within the process; across processes
+        # sharing a cache a few extra requests may get through
+        with _bucket_lock:
+            now = self.timer()
+            tokens, updated = self.cache.get(self.key, (self.num_requests, now))
+            tokens = min(self.num_requests, tokens + (now - updated) * refill)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            # An untouched bucket is full again after `duration`; let it expire then
+            self.cache.set(self.key, (tokens, now), self.duration)
+        self.wait_s = 0 if allowed else (1 - tokens) / refill
+        return allowed
+
+    def wait(self):
+        return self.wait_s
+
+
+class StudentRateThrottle(TokenBucketThrottle):
+    """Per student: the token's student, else the `student` in the request body."""
+
+    scope = 'registration_student'
+
+    def get_cache_key(self, request, view):
+        student = getattr(request.user, 'student_id', None)
+        if student is None and isinstance(request.data, dict):
+            student = request.data.get('student')
+        if not student:
+            return None
+        return self.cache_format % {'scope': self.scope, 'ident': student}
+
+
+class ClientIPRateThrottle(TokenBucketThrottle):
+    """Per client IP (X-Forwarded-For is trusted per the NUM_PROXIES setting). Keep it loose: a campus may sit behind one NAT."""
+
+    scope = 'registration_ip'
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {'scope': self.scope, 'ident': self.get_ident(request)}
+
+
+class EndpointRateThrottle(TokenBucketThrottle):
+    """One bucket per endpoint shared by every client."""
+
+    scope = 'registration_endpoint'
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {'scope': self.scope, 'ident': view.basename}
+
+
+class ConcurrencyLimiter:
+    """
+    At most settings.<limit_setting> holders at once in this process (0 means
+    no limit); others wait up to settings.<timeout_setting> seconds for a slot.
+    """
+
+    def __init__(self, limit_setting, timeout_setting):
+        self.limit_setting = limit_setting
+        self.timeout_setting = timeout_setting
+        self.in_flight = 0
+        self._changed = threading.Condition()
+
+    @property
+    def limit(self):
+        return getattr(settings, self.limit_setting)
+
+    def acquire(self):
+        """Takes a slot; False if none freed up in time."""
+        limit = self.limit
+        with self._changed:
+            if limit and not self._changed.wait_for(lambda: self.in_flight < limit, getattr(settings, self.timeout_setting)):
+                return False
+            self.in_flight += 1
+        return True
+
+    def release(self):
+        with self._changed:
+            self.in_flight -= 1
+            self._changed.notify()
+
+
+registration_limiter = ConcurrencyLimiter('REGISTRATION_MAX_CONCURRENCY', 'REGISTRATION_ADMISSION_TIMEOUT')
@@ -1,14 +1,20 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import StudentViewSet, PlacementViewSet, EventViewSet, CompetitionViewSet, PlacementRegistrationViewSet, EventRegistrationViewSet
+from .views import StudentViewSet, PlacementViewSet, EventViewSet, CompetitionViewSet, PlacementRoleViewSet, PlacementRegistrationViewSet, EventRegistrationViewSet, ResumeUploadViewSet, SearchViewSet, TimelineViewSet, AnalyticsViewSet, MetricsViewSet
 
 router = DefaultRouter()
 router.register(r'students', StudentViewSet)
 router.register(r'placements', PlacementViewSet)
 router.register(r'events', EventViewSet)
 router.register(r'competitions', CompetitionViewSet)
+router.register(r'placement-roles', PlacementRoleViewSet)
 router.register(r'registrations/placements', PlacementRegistrationViewSet)
 router.register(r'registrations/events', EventRegistrationViewSet)
+router.register(r'resume-uploads', ResumeUploadViewSet)
+router.register(r'search', SearchViewSet, basename='search')
+router.register(r'timeline', TimelineViewSet, basename='timeline')
+router.register(r'analytics', AnalyticsViewSet, basename='analytics')
+router.register(r'metrics', MetricsViewSet, basename='metrics')
 
 urlpatterns = [
     path('', include(router.urls)),
@@ -0,0 +1,131 @@
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+
+from core.models import Competition, Event, EventRegistration, Placement, PlacementRegistration, RegistrationStat, Student
+
+# RegistrationStat rows are moved by core/signals.py on every registration
+# create, delete and status change, inside the transaction making the change.
+# Rows of a deleted placement/event/competition go with it (FK cascade).
+# rebuild() recomputes everything with two GROUP BY queries.
+
+
+def placement_key(placement_id, department, status):
+    return {'placement_id': placement_id, 'department': department, 'status': status}
+
+
+def competition_key(event_id, competition_id, department):
+    return {'event_id': event_id, 'competition_id': competition_id, 'department': department}
+
+
+def registration_key(registration, department=None):
+    if department is None:
+        department = registration.student.department
+    if isinstance(registration, PlacementRegistration):
+        return placement_key(registration.placement_id, department, registration.status)
+    return competition_key(registration.event_id, registration.competition_id, department)
+
+
+def bump(key, delta):
+    stats = RegistrationStat.objects.filter(**key)
+    if delta < 0:
+        stats.filter(count__gte=-delta).update(count=F('count') + delta)
+    elif not stats.update(count=F('count') + delta):
+        try:
+            with transaction.atomic():
+                RegistrationStat.objects.create(count=delta, **key)
+        except IntegrityError:
+            # Another transaction created the row first
+            stats.update(count=F('count') + delta)
+
+
+def registration_added(registration):
+    bump(registration_key(registration), 1)
+
+
+def registration_removed(registration):
+    bump(registration_key(registration), -1)
+
+
+def status_changed(registration, old_status):
+    department = registration.student.department
+    bump(placement_key(registration.placement_id, department, old_status), -1)
+    bump(placement_key(registration.placement_id, department, registration.status), 1)
+
+
+def department_changed(student_id, old_department, new_department):
+    """Moves the counts of every registration of a student to their new department."""
+    placements = PlacementRegistration.objects.filter(student_id=student_id).values_list('placement_id', 'status')
+    for placement_id, status, n in placements.annotate(n=Count('id')).order_by():
+        bump(placement_key(placement_id, old_department, status), -n)
+        bump(placement_key(placement_id, new_department, status), n)
+    competitions = EventRegistration.objects.filter(student_id=student_id).values_list('event_id', 'competition_id')
+    for event_id, competition_id, n in competitions.annotate(n=Count('id')).order_by():
+        bump(competition_key(event_id, competition_id, old_department), -n)
+        bump(competition_key(event_id, competition_id, new_department), n)
+
+
+def departments_changed(old_departments, new_departments):
+    """Same for students updated in bulk; both arguments map register numbers to departments."""
+    changed = {number for number, department in new_departments.items() if old_departments.get(number, department) != department}
+    for number, student_id in Student.objects.filter(register_number__in=changed).values_list('register_number', 'id'):
+        department_changed(student_id, old_departments[number], new_departments[number])
+
+
+def rebuild():
+    """Recomputes every row from the registrations; returns the number of rows."""
+    placements = PlacementRegistration.objects.values_list('placement_id', 'student__department', 'status').annotate(n=Count('id')).order_by()
+    competitions = EventRegistration.objects.values_list('event_id', 'competition_id', 'student__department').annotate(n=Count('id')).order_by()
+    with transaction.atomic():
+        RegistrationStat.objects.all().delete()
+        stats = [RegistrationStat(count=n, **placement_key(*row)) for *row, n in placements.iterator()]
+        stats += [RegistrationStat(count=n, **competition_key(*row)) for *row, n in competitions.iterator()]
+        RegistrationStat.objects.bulk_create(stats, batch_size=1000)
+    return len(stats)
+
+
+def summary():
+    """Dashboard totals in a handful of queries over the summary rows and the catalog."""
+    stats = RegistrationStat.objects.filter(count__gt=0).order_by()
+
+    placement_counts = {}
+    statuses = {}
+    for placement_id, status, n in stats.filter(placement__isnull=False).values_list('placement_id', 'status').annotate(n=Sum('count')):
+        placement_counts.setdefault(placement_id, {})[status] = n
+        statuses[status] = statuses.get(status, 0) + n
+    placements = [
+        {'id': pk, 'company_name': name, 'registrations': sum(placement_counts.get(pk, {}).values()), 'by_status': placement_counts.get(pk, {})}
+        for pk, name in Placement.objects.order_by('date', 'id').values_list('id', 'company_name')
+    ]
+
+    competition_counts = dict(stats.filter(competition__isnull=False).values_list('competition_id').annotate(n=Sum('count')))
+    competitions = {}
+    for pk, event_id, name in Competition.objects.order_by('id').values_list('id', 'event_id', 'name'):
+        competitions.setdefault(event_id, []).append({'id': pk, 'name': name, 'registrations': competition_counts.get(pk, 0)})
+    events = [
+        {'id': pk, 'event_name': name, 'registrations': sum(c['registrations'] for c in competitions.get(pk, [])), 'competitions': competitions.get(pk, [])}
+        for pk, name in Event.objects.order_by('date', 'id').values_list('id', 'event_name')
+    ]
+
+    departments = stats.values('department').annotate(
+        placement_registrations=Sum('count', filter=Q(placement__isnull=False), default=0),
+        event_registrations=Sum('count', filter=Q(competition__isnull=False), default=0),
+    ).order_by('department')
+
+    placement_total = sum(statuses.values())
+    return {
+        'totals': {
+            'students': Student.objects.count(),
+            'placements': len(placements),
+            'events': len(events),
+            'placement_registrations': placement_total,
+            'event_registrations': sum(competition_counts.values()),
+        },
+        'placements': placements,
+        'events': events,
+        'departments': list(departments),
+        # Share of placement registrations at each stage, e.g. Applied -> Shortlisted -> Selected
+        'statuses': [
+            {'status': status, 'count': n, 'share': round(n / placement_total, 4)}
+            for status, n in sorted(statuses.items(), key=lambda item: -item[1])
+        ],
+    }
@@ -0,0 +1,116 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.servers.basehttp import ThreadedWSGIServer
+from django.db import connection, connections
+from django.test.testcases import QuietWSGIRequestHandler
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of an unsorted list (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def summarize(latencies, errors, elapsed):
+    """Throughput and latency percentiles (milliseconds) for one benchmark run."""
+    completed = len(latencies)
+    return {
+        'requests': completed + errors,
+        'errors': errors,
+        'elapsed_s': round(elapsed, 3),
+        'throughput_per_s': round(completed / elapsed, 1) if elapsed else 0.0,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+def run_concurrently(task, items, workers):
+    """
+    Calls task(item) for every item from `workers` threads.
+
+    Each thread uses its own database connection, closed when it finishes.
+    Returns (latencies_in_seconds, error_messages, elapsed_seconds).
+    """
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+
+    def call(item):
+        start = time.perf_counter()
+        try:
+            task(item)
+        except Exception as e:
+            with lock:
+                errors.append(f'{type(e).__name__}: {e}')
+        else:
+            duration = time.perf_counter() - start
+            with lock:
+                latencies.append(duration)
+        finally:
+            if threading.current_thread() is not threading.main_thread():
+                connections.close_all()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(call, items))
+    return latencies, errors, time.perf_counter() - start
+
+
+@contextmanager
+def throwaway_database(verbosity=0):
+    """
+    Runs the block against a freshly migrated copy of the default database.
+
+    Same mechanism as the test runner, but SQLite gets an on-disk file so
+    WAL/locking behave as in production. Nothing touches the real data.
+    """
+    settings_dict = connection.settings_dict
+    temp_dir = None
+    if connection.vendor == 'sqlite':
+        temp_dir = tempfile.mkdtemp(prefix='campcon-bench-')
+        settings_dict.setdefault('TEST', {})['NAME'] = os.path.join(temp_dir, 'bench.sqlite3')
+    old_name = settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=verbosity, autoclobber=True, serialize=False)
+    try:
+        yield
+    finally:
+        connections.close_all()
+        connection.creation.destroy_test_db(old_name, verbosity=verbosity)
+        if temp_dir:
+            for name in os.listdir(temp_dir):
+                os.remove(os.path.join(temp_dir, name))
+            os.rmdir(temp_dir)
+
+
+@contextmanager
+def live_server():
+    """
+    Serves the app over HTTP on a free localhost port, one thread per
+    connection like `runserver`; yields the base URL.
+    """
+    server = ThreadedWSGIServer(('127.0.0.1', 0), QuietWSGIRequestHandler, allow_reuse_address=False)
+    server.set_app(WSGIHandler())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f'http://127.0.0.1:{server.server_address[1]}'
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def write_json(path, payload):
+    with open(path, 'w') as f:
+        json.dump(payload, f, indent=2, default=str)
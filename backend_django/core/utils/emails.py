@@ -1,8 +1,16 @@
-from django.core.mail import send_mail
-from django.conf import settings
+from .outbox import build_email, queue_email
+
+# These only queue the message (see core/utils/outbox.py); delivery happens in
+# `manage.py send_queued_emails`, so callers never wait on SMTP.
 
 def send_welcome_email(student_email, student_name):
-    """Sends a welcome email upon student registration."""
+    """Queues a welcome email upon student registration."""
+    email = build_welcome_email(student_email, student_name)
+    email.save()
+    return email
+
+def build_welcome_email(student_email, student_name):
+    """Builds an unsaved welcome email, for queueing many at once."""
     subject = 'Welcome to Campus Connect!'
     message = f"""Hi {student_name},
 
@@ -12,20 +20,10 @@ You can now log in to view upcoming placement drives and campus events.
 Best regards,
 Campus Connect Team
 """
-    try:
-        send_mail(
-            subject,
-            message,
-            settings.DEFAULT_FROM_EMAIL if hasattr(settings, 'DEFAULT_FROM_EMAIL') else 'noreply@campusconnect.com',
-            [student_email],
-            fail_silently=False,
-        )
-    except Exception as e:
-        # In production, use a logger instead of print
-        pass
+    return build_email(subject, message, [student_email])
 
 def send_event_registration_email(student_email, event_title, event_date):
-    """Sends confirmation for event registration."""
+    """Queues confirmation for event registration."""
     subject = f'Registration Confirmed: {event_title}'
     message = f"""You have successfully registered for the event: {event_title}.
 
@@ -36,19 +34,10 @@ We look forward to seeing you there!
 Best regards,
 Campus Connect Team
 """
-    try:
-        send_mail(
-            subject,
-            message,
-            settings.DEFAULT_FROM_EMAIL if hasattr(settings, 'DEFAULT_FROM_EMAIL') else 'noreply@campusconnect.com',
-            [student_email],
-            fail_silently=False,
-        )
-    except Exception as e:
-        pass
+    return queue_email(subject, message, [student_email])
 
 def send_placement_registration_email(student_email, company_name, date):
-    """Sends confirmation for placement drive registration."""
+    """Queues confirmation for placement drive registration."""
     subject = f'Placement Drive Registration: {company_name}'
     message = f"""You have successfully applied for the {company_name} placement drive.
 
@@ -59,13 +48,38 @@ Prepare well and good luck!
 Best regards,
 Campus Connect Team
 """
-    try:
-        send_mail(
-            subject,
-            message,
-            settings.DEFAULT_FROM_EMAIL if hasattr(settings, 'DEFAULT_FROM_EMAIL') else 'noreply@campusconnect.com',
-            [student_email],
-            fail_silently=False,
-        )
-    except Exception as e:
-        pass
+    return queue_email(subject, message, [student_email])
+
+def send_waitlisted_email(student_email, title):
+    """Queues the notice that a registration was put on the waitlist."""
+    subject = f'Waitlisted: {title}'
+    message = f"""All seats for {title} are currently taken, so your registration has been added to the waitlist.
+
+We will email you as soon as a seat opens up.
+
+Best regards,
+Campus Connect Team
+"""
+    return queue_email(subject, message, [student_email])
+
+def send_waitlist_promotion_email(student_email, title):
+    """Queues the notice that a waitlisted registration got a seat."""
+    subject = f'You are off the waitlist: {title}'
+    message = f"""Good news! A seat has opened up and your waitlisted registration for {title} is now confirmed.
+
+Best regards,
+Campus Connect Team
+"""
+    return queue_email(subject, message, [student_email])
+
+def build_status_email(student_email, title, status):
+    """Builds an unsaved notice of a new application status, for queueing many at once."""
+    subject = f'Application {status}: {title}'
+    message = f"""The status of your application for {title} is now: {status}.
+
+Log in to Campus Connect for details on the next steps.
+
+Best regards,
+Campus Connect Team
+"""
+    return build_email(subject, message, [student_email])
@@ -0,0 +1,107 @@
+import csv
+import time
+import zipfile
+
+from django.http import StreamingHttpResponse
+from rest_framework.negotiation import BaseContentNegotiation
+
+ROWS_PER_CHUNK = 500
+
+
+class Echo:
+    """File-like object for csv.writer that hands each line back instead of storing it."""
+
+    def write(self, value):
+        return value
+
+
+class IgnoreClientContentNegotiation(BaseContentNegotiation):
+    """Export actions always answer with CSV, whatever the Accept header says."""
+
+    def select_parser(self, request, parsers):
+        return parsers[0]
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return (renderers[0], renderers[0].media_type)
+
+
+class ZipSink:
+    """
+    Write-only sink for zipfile.ZipFile that the response generator drains.
+
+    It has no seek()/tell(), so zipfile writes each member with a trailing
+    data descriptor and never goes back: the archive is produced strictly
+    front to back and only the bytes of the current write are held.
+    """
+
+    def __init__(self):
+        self.pending = []
+
+    def write(self, data):
+        self.pending.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self.pending)
+        self.pending = []
+        return data
+
+
+def safe_cell(value):
+    """Stops spreadsheet apps from evaluating user supplied text as a formula."""
+    if isinstance(value, str) and value[:1] in ('=', '+', '-', '@'):
+        return "'" + value
+    return '' if value is None else value
+
+
+def iter_csv(header, rows):
+    """Yields CSV text in chunks of ROWS_PER_CHUNK lines; memory use does not depend on the row count."""
+    writer = csv.writer(Echo())
+    # UTF-8 BOM so Excel picks the right encoding
+    yield '\ufeff' + writer.writerow(header)
+    chunk = []
+    for row in rows:
+        chunk.append(writer.writerow([safe_cell(value) for value in row]))
+        if len(chunk) >= ROWS_PER_CHUNK:
+            yield ''.join(chunk)
+            chunk = []
+    if chunk:
+        yield ''.join(chunk)
+
+
+def csv_response(filename, header, rows):
+    response = StreamingHttpResponse(iter_csv(header, rows), content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+def iter_zip(entries):
+    """
+    Yields a ZIP archive piece by piece.
+
+    `entries` yields (arcname, chunks, compress) where chunks is an iterable
+    of bytes; entries are consumed lazily, so memory use does not depend on
+    the number or size of the files.
+    """
+    sink = ZipSink()
+    with zipfile.ZipFile(sink, 'w') as archive:
+        for arcname, chunks, compress in entries:
+            info = zipfile.ZipInfo(arcname, date_time=time.localtime()[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+            with archive.open(info, 'w') as member:
+                for chunk in chunks:
+                    member.write(chunk)
+                    data = sink.drain()
+                    if data:
+                        yield data
+            yield sink.drain()
+    yield sink.drain()
+
+
+def zip_response(filename, entries):
+    response = StreamingHttpResponse(iter_zip(entries), content_type='application/zip')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
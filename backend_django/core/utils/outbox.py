@@ -0,0 +1,181 @@
+import logging
+import smtplib
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db.models import Case, F, PositiveSmallIntegerField, Q, When
+from django.utils import timezone
+
+from core.models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+# Retry n waits RETRY_BASE_DELAY * 2**(n-1) seconds, capped at RETRY_MAX_DELAY
+RETRY_BASE_DELAY = 30
+RETRY_MAX_DELAY = 60 * 60
+# A claimed batch not finished within this window is picked up by another worker
+CLAIM_LEASE = timedelta(minutes=10)
+
+
+def default_from_email():
+    return settings.DEFAULT_FROM_EMAIL if hasattr(settings, 'DEFAULT_FROM_EMAIL') else 'noreply@campusconnect.com'
+
+
+def build_email(subject, message, recipients):
+    """Builds an unsaved OutboundEmail row (for bulk_create)."""
+    if isinstance(recipients, str):
+        recipients = [recipients]
+    return OutboundEmail(
+        subject=subject[:255],
+        body=message,
+        from_email=default_from_email(),
+        to=','.join(recipients),
+    )
+
+
+def queue_email(subject, message, recipients):
+    """
+    Queues an email for background delivery.
+
+    Runs inside the caller's transaction, so the email is only queued if the
+    surrounding write (e.g. a registration) commits.
+    """
+    email = build_email(subject, message, recipients)
+    email.save()
+    return email
+
+
+def queue_emails(emails):
+    """Queues many unsaved OutboundEmail rows with a single INSERT."""
+    return OutboundEmail.objects.bulk_create(emails, batch_size=500)
+
+
+def retry_delay(attempts):
+    return timedelta(seconds=min(RETRY_BASE_DELAY * 2 ** (attempts - 1), RETRY_MAX_DELAY))
+
+
+def claim_batch(batch_size, max_attempts=None):
+    """
+    Marks up to `batch_size` due emails as sending and returns them.
+
+    The conditional UPDATE on (id, status) plus a per-claim token makes this
+    safe with several workers on any backend: a row can only be claimed once.
+    Rows stuck in `sending` past their lease (crashed worker) are reclaimed,
+    which counts as an attempt: an email that keeps killing its worker ends
+    up failed after `max_attempts` like any other.
+    """
+    now = timezone.now()
+    due = (
+        Q(status=OutboundEmail.STATUS_PENDING, next_attempt_at__lte=now)
+        | Q(status=OutboundEmail.STATUS_SENDING, next_attempt_at__lte=now)
+    )
+    ids = list(OutboundEmail.objects.filter(due).order_by('next_attempt_at', 'id').values_list('id', flat=True)[:batch_size])
+    if not ids:
+        return []
+
+    token = uuid.uuid4().hex
+    OutboundEmail.objects.filter(due, id__in=ids).update(
+        attempts=Case(When(status=OutboundEmail.STATUS_SENDING, then=F('attempts') + 1), default=F('attempts'), output_field=PositiveSmallIntegerField()),
+        status=OutboundEmail.STATUS_SENDING,
+        claim_token=token,
+        next_attempt_at=now + CLAIM_LEASE,
+    )
+    if max_attempts is not None:
+        OutboundEmail.objects.filter(claim_token=token, attempts__gte=max_attempts).update(
+            status=OutboundEmail.STATUS_FAILED,
+            next_attempt_at=now,
+            last_error='Delivery did not finish within the claim lease',
+            claim_token=None,
+        )
+    return list(OutboundEmail.objects.filter(claim_token=token, status=OutboundEmail.STATUS_SENDING).order_by('id'))
+
+
+def mark_sent(email):
+    OutboundEmail.objects.filter(id=email.id).update(
+        status=OutboundEmail.STATUS_SENT,
+        attempts=email.attempts + 1,
+        sent_at=timezone.now(),
+        last_error=None,
+        claim_token=None,
+    )
+
+
+def mark_failed(email, error, max_attempts):
+    attempts = email.attempts + 1
+    if attempts >= max_attempts:
+        status, next_attempt_at = OutboundEmail.STATUS_FAILED, timezone.now()
+    else:
+        status, next_attempt_at = OutboundEmail.STATUS_PENDING, timezone.now() + retry_delay(attempts)
+    OutboundEmail.objects.filter(id=email.id).update(
+        status=status,
+        attempts=attempts,
+        next_attempt_at=next_attempt_at,
+        last_error=str(error)[:2000],
+        claim_token=None,
+    )
+
+
+def release_batch(emails):
+    """Puts the claimed emails that were not sent or failed yet back in the queue, without counting an attempt."""
+    OutboundEmail.objects.filter(id__in=[email.id for email in emails], claim_token=emails[0].claim_token).update(
+        status=OutboundEmail.STATUS_PENDING,
+        next_attempt_at=timezone.now() + retry_delay(1),
+        claim_token=None,
+    )
+
+
+def deliver_batch(emails, connection, max_attempts):
+    """Sends claimed emails one by one over an already open connection. Returns (sent, failed)."""
+    sent = failed = 0
+    for email in emails:
+        message = EmailMessage(email.subject, email.body, email.from_email, email.to.split(','), connection=connection)
+        try:
+            connection.send_messages([message])
+        except smtplib.SMTPServerDisconnected as e:
+            mark_failed(email, e, max_attempts)
+            failed += 1
+            # Reconnect once; the next message gets a fresh session
+            connection.close()
+            connection.open()
+        except Exception as e:
+            logger.warning("Failed to send queued email %s: %s", email.id, e)
+            mark_failed(email, e, max_attempts)
+            failed += 1
+        else:
+            mark_sent(email)
+            sent += 1
+    return sent, failed
+
+
+def drain_outbox(batch_size=100, max_attempts=5, max_batches=None):
+    """
+    Delivers due emails until the queue is empty, reusing one SMTP connection.
+
+    The connection is only opened once there is something to send. If it
+    cannot be opened (or reopened), the rest of the batch goes back to the
+    queue and the error is raised. Returns (sent, failed) counts.
+    """
+    sent = failed = batches = 0
+    connection = None
+    try:
+        while max_batches is None or batches < max_batches:
+            emails = claim_batch(batch_size, max_attempts)
+            if not emails:
+                break
+            try:
+                if connection is None:
+                    connection = get_connection(fail_silently=False)
+                    connection.open()
+                batch_sent, batch_failed = deliver_batch(emails, connection, max_attempts)
+            except Exception:
+                release_batch(emails)
+                raise
+            sent += batch_sent
+            failed += batch_failed
+            batches += 1
+    finally:
+        if connection is not None:
+            connection.close()
+    return sent, failed
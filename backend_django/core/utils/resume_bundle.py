@@ -0,0 +1,69 @@
+import os
+
+from django.core.files.storage import default_storage
+from django.utils.text import get_valid_filename, slugify
+
+from .exports import iter_csv
+
+INDEX_HEADER = ['Register Number', 'Name', 'Email', 'Department', 'Year', 'Role', 'Status', 'Registered At', 'File']
+ROW_FIELDS = (
+    'student__register_number', 'student__name', 'student__email', 'student__department', 'student__year',
+    'role_name', 'status', 'registered_at', 'resume',
+)
+READ_SIZE = 64 * 1024
+
+
+def archive_names(rows):
+    """
+    Yields (row, arcname) with arcname None when no resume was uploaded.
+
+    Files are named by register number; rows must be ordered by register
+    number so a student applying for several roles can get the role appended.
+    """
+    previous = None
+    for row in rows:
+        register_number, role_name, resume = row[0], row[5], row[8]
+        arcname = None
+        if resume:
+            name = get_valid_filename(register_number) or 'unknown'
+            if register_number == previous:
+                name = f'{name}_{slugify(role_name)}'
+            arcname = f'resumes/{name}{os.path.splitext(resume)[1].lower()}'
+        previous = register_number
+        yield row, arcname
+
+
+def file_chunks(f):
+    with f:
+        yield from f.chunks(READ_SIZE)
+
+
+def bundle_entries(queryset, storage=default_storage):
+    """
+    ZIP entries (see iter_zip) for the resumes of `queryset`: index.csv first,
+    then one file per registration. Two passes over a server-side cursor
+    instead of keeping the rows in memory.
+    """
+    rows = queryset.order_by('student__register_number', 'role_name', 'id').values_list(*ROW_FIELDS)
+
+    def index_rows():
+        for row, arcname in archive_names(rows.iterator(chunk_size=2000)):
+            if arcname is None:
+                location = 'Not uploaded'
+            elif storage.exists(row[8]):
+                location = arcname
+            else:
+                location = 'Missing'
+            yield row[:8] + (location,)
+
+    yield 'index.csv', (text.encode('utf-8') for text in iter_csv(INDEX_HEADER, index_rows())), True
+
+    for row, arcname in archive_names(rows.iterator(chunk_size=2000)):
+        if arcname is None:
+            continue
+        try:
+            f = storage.open(row[8], 'rb')
+        except OSError:
+            continue
+        # Resumes are PDFs/images that are already compressed; store them as is
+        yield arcname, file_chunks(f), False
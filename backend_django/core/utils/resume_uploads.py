@@ -0,0 +1,158 @@
+import hashlib
+import os
+import tempfile
+
+from django.conf import settings
+from django.core.files import File
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from core.models import ResumeBlob, ResumeUpload
+
+# Chunks are copied from the request stream to the partial file in pieces of
+# this size, so no chunk (let alone the whole resume) is held in memory.
+COPY_BUFFER = 64 * 1024
+
+
+class UploadError(Exception):
+    """Rejected chunk or completion; `status` is the HTTP status to answer with."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def partial_path(upload):
+    return os.path.join(settings.RESUME_UPLOAD_DIR, f'{upload.pk}.part')
+
+
+def remove_partial(upload):
+    # A concurrent complete or delete may have removed it already
+    try:
+        os.remove(partial_path(upload))
+    except FileNotFoundError:
+        pass
+
+
+def start_upload(filename, size):
+    if size <= 0 or size > settings.RESUME_UPLOAD_MAX_SIZE:
+        raise UploadError(f'Size must be between 1 and {settings.RESUME_UPLOAD_MAX_SIZE} bytes.')
+    upload = ResumeUpload.objects.create(filename=os.path.basename(filename)[:255], size=size)
+    os.makedirs(settings.RESUME_UPLOAD_DIR, exist_ok=True)
+    open(partial_path(upload), 'wb').close()
+    return upload
+
+
+def check_chunk(upload, offset, length):
+    if upload.status != ResumeUpload.STATUS_UPLOADING:
+        raise UploadError('Upload is already complete.', status=409)
+    if offset != upload.received:
+        raise UploadError(f'Expected offset {upload.received}.', status=409)
+    if length <= 0 or length > settings.RESUME_UPLOAD_MAX_CHUNK:
+        raise UploadError(f'Chunks must be between 1 and {settings.RESUME_UPLOAD_MAX_CHUNK} bytes.')
+    if offset + length > upload.size:
+        raise UploadError('Chunk goes past the declared size.')
+
+
+def copy(source, target, length):
+    written = 0
+    while written < length:
+        data = source.read(min(COPY_BUFFER, length - written))
+        if not data:
+            break
+        target.write(data)
+        written += len(data)
+    return written
+
+
+def locked(upload):
+    """Re-reads the upload under a row lock (inside a transaction) and copies its state onto `upload`."""
+    current = ResumeUpload.objects.select_for_update().get(pk=upload.pk)
+    upload.status, upload.received, upload.blob_id = current.status, current.received, current.blob_id
+    return upload
+
+
+def write_chunk(upload, stream, offset, length):
+    """
+    Appends `length` bytes read from `stream` at `offset`.
+
+    The offset must equal what the server has (409 otherwise, with the client
+    expected to resume from `upload.received`). A chunk that arrives short
+    (dropped connection) is not counted and can simply be re-sent.
+
+    The body is spooled to a temporary file first, outside any lock, as a slow
+    client may take a while to send it. It is then copied into place under a
+    row lock on the upload, so two requests for the same offset never
+    interleave their bytes.
+    """
+    check_chunk(upload, offset, length)
+    with tempfile.SpooledTemporaryFile(max_size=COPY_BUFFER, dir=settings.RESUME_UPLOAD_DIR) as chunk:
+        if copy(stream, chunk, length) != length:
+            raise UploadError('Chunk was cut short; re-send it from the same offset.')
+        chunk.seek(0)
+        with transaction.atomic():
+            check_chunk(locked(upload), offset, length)
+            with open(partial_path(upload), 'r+b') as f:
+                f.seek(offset)
+                copy(chunk, f, length)
+            ResumeUpload.objects.filter(pk=upload.pk).update(received=offset + length, updated_at=timezone.now())
+    upload.received = offset + length
+    return upload
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(COPY_BUFFER), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def complete_upload(upload):
+    """
+    Hashes the assembled file and stores it once per content (identical resumes share a blob).
+
+    Runs under the upload's row lock: a concurrent complete waits, then finds it done.
+    """
+    with transaction.atomic():
+        if locked(upload).status == ResumeUpload.STATUS_COMPLETE:
+            return upload
+        if upload.received != upload.size:
+            raise UploadError(f'Only {upload.received} of {upload.size} bytes received.', status=409)
+        return store(upload)
+
+
+def store(upload):
+    path = partial_path(upload)
+    with open(path, 'r+b') as f:
+        f.truncate(upload.size)
+    sha256 = file_digest(path)
+
+    blob = ResumeBlob.objects.filter(sha256=sha256).first()
+    if blob is None:
+        extension = os.path.splitext(upload.filename)[1].lower()[:10]
+        with open(path, 'rb') as f:
+            blob = ResumeBlob(sha256=sha256, size=upload.size)
+            blob.file.save(f'{sha256}{extension}', File(f), save=False)
+        try:
+            with transaction.atomic():
+                blob.save()
+        except IntegrityError:
+            # Same content finished concurrently; keep theirs
+            blob.file.delete(save=False)
+            blob = ResumeBlob.objects.get(sha256=sha256)
+
+    upload.blob = blob
+    upload.status = ResumeUpload.STATUS_COMPLETE
+    upload.save(update_fields=['blob', 'status', 'updated_at'])
+    remove_partial(upload)
+    return upload
+
+
+def attach(upload, registration):
+    if upload.status != ResumeUpload.STATUS_COMPLETE or upload.blob is None:
+        raise UploadError('Upload is not complete.', status=409)
+    registration.resume = upload.blob.file.name
+    registration.resume_name = upload.filename
+    registration.save(update_fields=['resume', 'resume_name'])
+    return registration
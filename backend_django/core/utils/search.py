@@ -0,0 +1,135 @@
+import re
+
+from django.db import connection, transaction
+from django.db.models import Q
+
+from core.models import Competition, Event, Placement, SearchDocument
+
+# The index itself is created in migration 0008: an FTS5 table kept in sync by
+# triggers on SQLite, a GIN index over DOCUMENT_VECTOR on Postgres.
+FTS_TABLE = 'core_searchdocument_fts'
+DOCUMENT_VECTOR = "setweight(to_tsvector('english', title), 'A') || setweight(to_tsvector('english', body), 'B')"
+MAX_TERMS = 8
+MAX_LIMIT = 100
+BATCH_SIZE = 1000
+
+
+def join_text(*parts):
+    return '\n'.join(str(part) for part in parts if part)
+
+
+def placement_document(placement):
+    return {
+        'title': placement.company_name,
+        'body': join_text(placement.roles, placement.description, placement.eligibility, placement.venue, placement.package),
+        'date': placement.date,
+    }
+
+
+def event_document(event):
+    return {
+        'title': event.event_name,
+        'body': join_text(event.description, event.venue, event.rules, event.contact_person),
+        'date': event.date,
+    }
+
+
+def competition_document(competition):
+    return {
+        'title': competition.name,
+        'body': join_text(competition.event.event_name, competition.description, competition.prize, competition.type),
+        'date': competition.event.date,
+    }
+
+
+def index_object(kind, obj):
+    document = {
+        SearchDocument.KIND_PLACEMENT: placement_document,
+        SearchDocument.KIND_EVENT: event_document,
+        SearchDocument.KIND_COMPETITION: competition_document,
+    }[kind](obj)
+    SearchDocument.objects.update_or_create(kind=kind, object_id=obj.pk, defaults=document)
+
+
+def remove_object(kind, object_id):
+    SearchDocument.objects.filter(kind=kind, object_id=object_id).delete()
+
+
+def iter_documents():
+    """Every document, built from a few chunked queries."""
+    for placement in Placement.objects.iterator(chunk_size=1000):
+        yield SearchDocument(kind=SearchDocument.KIND_PLACEMENT, object_id=placement.pk, **placement_document(placement))
+    for event in Event.objects.iterator(chunk_size=1000):
+        yield SearchDocument(kind=SearchDocument.KIND_EVENT, object_id=event.pk, **event_document(event))
+    for competition in Competition.objects.select_related('event').iterator(chunk_size=1000):
+        yield SearchDocument(kind=SearchDocument.KIND_COMPETITION, object_id=competition.pk, **competition_document(competition))
+
+
+def rebuild_index():
+    """Replaces every document with one built from the current rows; returns how many."""
+    total = 0
+    with transaction.atomic():
+        SearchDocument.objects.all().delete()
+        batch = []
+        for document in iter_documents():
+            batch.append(document)
+            if len(batch) >= BATCH_SIZE:
+                SearchDocument.objects.bulk_create(batch)
+                total += len(batch)
+                batch = []
+        SearchDocument.objects.bulk_create(batch)
+        total += len(batch)
+
+    if connection.vendor == 'sqlite':
+        # The triggers already kept the FTS table in step; merge its segments for faster queries
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")
+    return total
+
+
+def search_terms(query):
+    return re.findall(r'[^\W_]+', query.lower())[:MAX_TERMS]
+
+
+def search(query, kinds=None, limit=20):
+    """
+    Ranked matches for `query`; every word must match, as a prefix.
+
+    Returns SearchDocuments with a `rank` attribute (higher is better),
+    title matches first.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return []
+    limit = max(1, min(limit, MAX_LIMIT))
+    kind_sql, kind_params = '', []
+    if kinds:
+        kind_sql = f" AND kind IN ({', '.join(['%s'] * len(kinds))})"
+        kind_params = list(kinds)
+    if connection.vendor == 'sqlite':
+        # bm25() is lower-is-better; titles weigh 5x the body
+        sql = (
+            f'SELECT d.id, d.kind, d.object_id, d.title, d.body, d.date, -bm25({FTS_TABLE}, 5.0, 1.0) AS rank FROM {FTS_TABLE} '
+            f'JOIN core_searchdocument d ON d.id = {FTS_TABLE}.rowid '
+            f'WHERE {FTS_TABLE} MATCH %s{kind_sql} ORDER BY rank DESC, d.date DESC LIMIT %s'
+        )
+        params = [' '.join(f'"{term}"*' for term in terms), *kind_params, limit]
+    elif connection.vendor == 'postgresql':
+        # Same expression as the GIN index so the planner can use it
+        sql = (
+            f"SELECT id, kind, object_id, title, body, date, ts_rank({DOCUMENT_VECTOR}, to_tsquery('english', %s)) AS rank "
+            f"FROM core_searchdocument WHERE ({DOCUMENT_VECTOR}) @@ to_tsquery('english', %s){kind_sql} "
+            f'ORDER BY rank DESC, date DESC LIMIT %s'
+        )
+        tsquery = ' & '.join(f'{term}:*' for term in terms)
+        params = [tsquery, tsquery, *kind_params, limit]
+    else:
+        # No index on other backends; plain substring matching
+        documents = SearchDocument.objects.all()
+        for term in terms:
+            documents = documents.filter(Q(title__icontains=term) | Q(body__icontains=term))
+        if kinds:
+            documents = documents.filter(kind__in=kinds)
+        return list(documents.order_by('-date')[:limit])
+
+    return list(SearchDocument.objects.raw(sql, params))
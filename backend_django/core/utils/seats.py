@@ -0,0 +1,144 @@
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+from core.models import Competition, EventRegistration, PlacementRegistration, PlacementRole
+from .emails import send_waitlist_promotion_email
+
+# Seats are counted in Competition.seats_taken / PlacementRole.seats_taken and
+# claimed with a conditional UPDATE, so allocating never runs COUNT(*) over the
+# registrations and concurrent requests cannot oversell: the UPDATE locks the
+# pool row until the registering transaction commits (on SQLite the IMMEDIATE
+# write transaction serialises them instead).
+
+
+def competition_pool(competition_id):
+    return Competition.objects.filter(pk=competition_id)
+
+
+def competition_waitlist(competition_id):
+    return EventRegistration.objects.filter(competition_id=competition_id)
+
+
+def role_pool(role_id):
+    return PlacementRole.objects.filter(pk=role_id)
+
+
+def role_waitlist(role_id):
+    return PlacementRegistration.objects.filter(role_id=role_id)
+
+
+def claim_seat(pool):
+    """Takes one seat if the pool has room (or no capacity). Returns False when full or missing."""
+    has_room = Q(capacity__isnull=True) | Q(seats_taken__lt=F('capacity'))
+    return pool.filter(has_room).update(seats_taken=F('seats_taken') + 1) == 1
+
+
+def allocate(pool):
+    """
+    Returns the `waitlisted` flag for a new registration in this pool.
+
+    Must run in the registering transaction, before the INSERT, so a rejected
+    duplicate rolls the seat back too. A pool that does not exist is unlimited
+    and not tracked.
+    """
+    if claim_seat(pool):
+        return False
+    return pool.exists()
+
+
+def fill_from_waitlist(pool, waitlist):
+    """Promotes waitlisted registrations, oldest first, while the pool has room."""
+    promoted = []
+    with transaction.atomic():
+        # Lock the pool row so concurrent releases cannot promote the same registration
+        if pool.select_for_update().values_list('pk', flat=True).first() is None:
+            return promoted
+        candidates = waitlist.filter(waitlisted=True).order_by('registered_at', 'id')
+        while True:
+            registration = candidates.first()
+            if registration is None or not claim_seat(pool):
+                break
+            waitlist.filter(pk=registration.pk).update(waitlisted=False)
+            promoted.append(registration)
+    return promoted
+
+
+def release(pool, waitlist):
+    """Frees the seat of a cancelled registration and hands it to the waitlist."""
+    with transaction.atomic():
+        pool.filter(seats_taken__gt=0).update(seats_taken=F('seats_taken') - 1)
+        promoted = fill_from_waitlist(pool, waitlist)
+        notify_promoted(promoted)
+    return promoted
+
+
+def notify_promoted(registrations):
+    for registration in registrations:
+        if isinstance(registration, EventRegistration):
+            title = f"{registration.event.event_name} - {registration.competition.name}"
+        else:
+            title = f"{registration.placement.company_name} - {registration.role_name}"
+        if registration.student.email:
+            send_waitlist_promotion_email(registration.student.email, title)
+
+
+def withdraw_applicant(role_id):
+    """Counterpart of the increment in PlacementRegistration.save()."""
+    PlacementRole.objects.filter(pk=role_id, applicant_count__gt=0).update(applicant_count=F('applicant_count') - 1)
+
+
+def recount():
+    """
+    Recomputes every seat and applicant counter from the registrations.
+
+    For repairs after writes that bypassed the model signals (bulk inserts,
+    raw deletes); two UPDATEs with correlated counts.
+    """
+    def count(model, pool_field, **filters):
+        registrations = model.objects.filter(**{pool_field: OuterRef('pk')}, **filters).order_by()
+        return Coalesce(Subquery(registrations.values(pool_field).annotate(n=Count('id')).values('n')), 0)
+    PlacementRole.objects.update(
+        applicant_count=count(PlacementRegistration, 'role_id'), seats_taken=count(PlacementRegistration, 'role_id', waitlisted=False),
+    )
+    Competition.objects.update(seats_taken=count(EventRegistration, 'competition_id', waitlisted=False))
+
+
+def sync_roles(placement):
+    """Adds a PlacementRole for every name in Placement.roles; removed names keep theirs."""
+    PlacementRole.objects.bulk_create(
+        [PlacementRole(placement=placement, name=name) for name in placement.role_names()],
+        ignore_conflicts=True,
+    )
+
+
+def fill_level(pool, waiting):
+    return {
+        'id': pool.pk,
+        'name': pool.name,
+        'capacity': pool.capacity,
+        'seats_taken': pool.seats_taken,
+        'seats_left': None if pool.capacity is None else max(pool.capacity - pool.seats_taken, 0),
+        'waitlisted': waiting,
+    }
+
+
+def competition_fill_levels(event):
+    """Live fill level of every competition of an event, in two queries."""
+    waiting = dict(
+        EventRegistration.objects.filter(event=event, waitlisted=True)
+        .values_list('competition_id').annotate(count=Count('id')).order_by()
+    )
+    return [fill_level(competition, waiting.get(competition.pk, 0)) for competition in event.competitions.order_by('id')]
+
+
+def role_fill_levels(placement):
+    """Live fill level and applicant count of every role of a placement, in two queries."""
+    waiting = dict(
+        PlacementRegistration.objects.filter(placement=placement, waitlisted=True)
+        .values_list('role_id').annotate(count=Count('id')).order_by()
+    )
+    return [
+        {**fill_level(role, waiting.get(role.pk, 0)), 'applicants': role.applicant_count}
+        for role in placement.role_pools.order_by('id')
+    ]
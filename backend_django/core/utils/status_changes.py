@@ -0,0 +1,75 @@
+import uuid
+from collections import Counter
+
+from django.db import transaction
+
+from core.models import PlacementRegistration, StatusChange
+from .analytics import bump, placement_key
+from .emails import build_status_email
+from .outbox import queue_emails
+
+# Error listings name at most this many registrations
+MAX_LISTED = 50
+# Ids per UPDATE ... WHERE id IN (...), well under SQLite's bound parameter limit
+UPDATE_CHUNK = 500
+
+
+class TransitionError(Exception):
+    """Rejected bulk transition; nothing was changed."""
+
+    def __init__(self, message, ids=()):
+        super().__init__(message)
+        self.ids = list(ids)[:MAX_LISTED]
+
+
+def check_status(status):
+    if status not in PlacementRegistration.STATUS_TRANSITIONS:
+        raise TransitionError(f"Unknown status '{status}'. Use one of: {', '.join(PlacementRegistration.STATUS_TRANSITIONS)}.")
+
+
+def allowed(from_status, to_status):
+    return to_status in PlacementRegistration.STATUS_TRANSITIONS.get(from_status, ())
+
+
+def bulk_transition(registrations, to_status, note='', notify=True):
+    """
+    Moves every registration in the queryset to `to_status` at once.
+
+    In one transaction: a locking read of the rows, a single UPDATE, the audit
+    rows in one bulk INSERT, the stats moved per group and the notices queued
+    in one INSERT. Rows already in `to_status` are left alone; if any other
+    row may not move there, the whole batch is rejected.
+    """
+    check_status(to_status)
+    with transaction.atomic():
+        # of=('self',): lock the registrations, not the joined student and placement rows
+        rows = list(registrations.select_for_update(of=('self',)).order_by('id').values_list(
+            'id', 'status', 'placement_id', 'role_name', 'student__department', 'student__email', 'placement__company_name',
+        ))
+        moving = [row for row in rows if row[1] != to_status]
+        refused = [row for row in moving if not allowed(row[1], to_status)]
+        if refused:
+            statuses = ', '.join(sorted({row[1] for row in refused}))
+            raise TransitionError(f'{len(refused)} registrations cannot move from {statuses} to {to_status}.', [row[0] for row in refused])
+        if not moving:
+            return {'updated': 0, 'unchanged': len(rows), 'batch': None}
+
+        batch = uuid.uuid4()
+        ids = [row[0] for row in moving]
+        for start in range(0, len(ids), UPDATE_CHUNK):
+            PlacementRegistration.objects.filter(pk__in=ids[start:start + UPDATE_CHUNK]).update(status=to_status)
+        StatusChange.objects.bulk_create([
+            StatusChange(registration_id=pk, from_status=status, to_status=to_status, batch=batch, note=note)
+            for pk, status, *_ in moving
+        ], batch_size=1000)
+        # queryset.update() skips the signals that keep the analytics counts
+        groups = Counter((placement_id, department, status) for _, status, placement_id, _, department, _, _ in moving)
+        for (placement_id, department, status), n in groups.items():
+            bump(placement_key(placement_id, department, status), -n)
+            bump(placement_key(placement_id, department, to_status), n)
+        if notify:
+            queue_emails([
+                build_status_email(email, f'{company_name} - {role_name}', to_status)
+                for _, _, _, role_name, _, email, company_name in moving if email
+            ])
+    return {'updated': len(moving), 'unchanged': len(rows) - len(moving), 'batch': batch}
@@ -0,0 +1,208 @@
+import csv
+import io
+import json
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+
+from core.hashers import hash_student_passwords
+from core.models import Student
+from .analytics import departments_changed
+from .emails import build_welcome_email
+from .outbox import queue_emails
+
+IMPORT_FIELDS = [
+    'register_number', 'name', 'email', 'phone', 'student_class', 'department', 'year', 'college',
+    'cgpa', 'backlogs', 'history_of_arrears', 'tenth_marks', 'twelfth_marks', 'password_hash',
+]
+# Column names the frontend/admin exports use for the same fields
+FIELD_ALIASES = {
+    'class': 'student_class',
+    'password': 'password_hash',
+}
+BOOLEAN_VALUES = {'yes': True, 'y': True, 'true': True, '1': True, 'no': False, 'n': False, 'false': False, '0': False}
+DEFAULT_CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 1000
+
+
+def detect_format(filename):
+    return 'jsonl' if filename and filename.lower().endswith(('.jsonl', '.ndjson')) else 'csv'
+
+
+def iter_rows(stream, fmt='csv'):
+    """
+    Yields (line_number, row_dict) from a binary or text stream without reading it all.
+
+    Malformed JSONL lines are yielded as (line_number, None).
+    """
+    if isinstance(stream.read(0), bytes):
+        stream = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+
+    if fmt == 'jsonl':
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                row = None
+            yield line_number, row if isinstance(row, dict) else None
+    else:
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+
+
+def normalize_row(row):
+    data = {}
+    for key, value in row.items():
+        if key is None:
+            continue
+        key = key.strip().lower()
+        key = FIELD_ALIASES.get(key, key)
+        if key in IMPORT_FIELDS:
+            value = value.strip() if isinstance(value, str) else value
+            if key == 'history_of_arrears' and isinstance(value, str):
+                value = BOOLEAN_VALUES.get(value.lower(), value)
+            elif key in ('cgpa', 'tenth_marks', 'twelfth_marks') and isinstance(value, str):
+                value = value.rstrip('%').strip()
+            data[key] = None if value == '' else value
+    return data
+
+
+class StudentImport:
+    """
+    Streams student rows into the database in chunks.
+
+    Each chunk is validated in Python (no per-row queries), checked against
+    existing emails with one query, then written with an
+    INSERT ... ON CONFLICT (register_number) DO UPDATE per set of columns
+    present. A row only updates the columns it has a value for: missing keys
+    and empty cells leave the stored value alone. Passwords are only set on
+    new students; an import never changes an existing student's password.
+    Bad rows are reported and skipped; they never abort the rest
+    of the batch. Welcome emails for
+    newly created students are queued in the outbox in the same transaction.
+    """
+
+    def __init__(self, chunk_size=DEFAULT_CHUNK_SIZE, send_welcome=True):
+        self.chunk_size = chunk_size
+        self.send_welcome = send_welcome
+        self.created = 0
+        self.updated = 0
+        self.failed = 0
+        self.errors = []
+
+    def run(self, rows):
+        chunk = []
+        for line_number, row in rows:
+            chunk.append((line_number, row))
+            if len(chunk) >= self.chunk_size:
+                self.import_chunk(chunk)
+                chunk = []
+        if chunk:
+            self.import_chunk(chunk)
+        return self.result()
+
+    def result(self):
+        return {
+            'created': self.created,
+            'updated': self.updated,
+            'failed': self.failed,
+            'errors': self.errors,
+            'errors_truncated': self.failed > len(self.errors),
+        }
+
+    def add_error(self, line_number, errors):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'line': line_number, 'errors': errors})
+
+    def validate(self, line_number, row):
+        if row is None:
+            self.add_error(line_number, {'row': ['Malformed row']})
+            return None
+        data = normalize_row(row)
+        student = Student(**data)
+        try:
+            # Uniqueness is enforced by the upsert and the email check below
+            student.clean_fields(exclude=['user'])
+        except ValidationError as e:
+            self.add_error(line_number, e.message_dict)
+            return None
+        # Blank cells and missing keys alike: nothing to write over the stored value
+        return student, {name for name, value in data.items() if value is not None}
+
+    def import_chunk(self, chunk):
+        # Later rows win when a register number repeats inside the chunk
+        valid = {}
+        for line_number, row in chunk:
+            validated = self.validate(line_number, row)
+            if validated:
+                valid[validated[0].register_number] = (line_number, *validated)
+
+        # An email may only move with its own register number
+        owners = dict(Student.objects.filter(email__in={student.email for _, student, _ in valid.values()}).values_list('email', 'register_number'))
+        seen_emails = set()
+        for register_number, (line_number, student, _) in list(valid.items()):
+            owner = owners.get(student.email)
+            if (owner and owner != register_number) or student.email in seen_emails:
+                self.add_error(line_number, {'email': ['A student with this email already exists.']})
+                del valid[register_number]
+            seen_emails.add(student.email)
+
+        if not valid:
+            return
+        for register_number in Student.objects.filter(register_number__in=valid).values_list('register_number', flat=True):
+            line_number, student, fields = valid[register_number]
+            student.password_hash = None
+            valid[register_number] = (line_number, student, fields - {'password_hash'})
+        # Plain text passwords in the file are hashed for the whole chunk at once
+        hash_student_passwords([student for _, student, _ in valid.values()])
+        try:
+            self.write(list(valid.values()))
+        except IntegrityError:
+            # Something slipped past the checks (e.g. a concurrent insert); isolate the offending rows
+            for entry in valid.values():
+                try:
+                    self.write([entry])
+                except IntegrityError as e:
+                    self.add_error(entry[0], {'row': [str(e)]})
+
+    def write(self, entries):
+        # One upsert per set of columns present, so no row overwrites a column it does not have
+        groups = {}
+        for entry in entries:
+            groups.setdefault(frozenset(entry[2] - {'register_number'}), []).append(entry)
+        created = updated = 0
+        with transaction.atomic():
+            for update_fields, group in groups.items():
+                new, existing = self.upsert([student for _, student, _ in group], sorted(update_fields))
+                created += new
+                updated += existing
+        # Only once committed: a rolled back batch is retried row by row
+        self.created += created
+        self.updated += updated
+
+    def upsert(self, students, update_fields):
+        """Returns (created, updated) row counts."""
+        with transaction.atomic():
+            existing = dict(Student.objects.filter(register_number__in=[s.register_number for s in students]).values_list('register_number', 'department'))
+            Student.objects.bulk_create(
+                students,
+                update_conflicts=bool(update_fields),
+                ignore_conflicts=not update_fields,
+                unique_fields=['register_number'] if update_fields else None,
+                update_fields=update_fields or None,
+            )
+            if 'department' in update_fields:
+                # bulk_create skips the signals that keep the registration stats per department
+                departments_changed(existing, {s.register_number: s.department for s in students})
+            new_students = [student for student in students if student.register_number not in existing]
+            if self.send_welcome:
+                queue_emails([build_welcome_email(student.email, student.name) for student in new_students if student.email])
+        return len(new_students), len(students) - len(new_students)
+
+
+def import_students(stream, fmt='csv', chunk_size=DEFAULT_CHUNK_SIZE, send_welcome=True):
+    return StudentImport(chunk_size=chunk_size, send_welcome=send_welcome).run(iter_rows(stream, fmt))
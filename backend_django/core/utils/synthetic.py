@@ -0,0 +1,311 @@
+import datetime
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import get_context
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+
+from core.cache import invalidate_catalog
+from core.models import Competition, Event, EventRegistration, Placement, PlacementRegistration, PlacementRole, SentReminder, StatusChange, Student
+from . import analytics, search, seats
+
+# Synthetic students, drives, events and registrations for load tests and
+# benchmarks. Students and registrations are generated in chunks, each from
+# its own seed, so the data depends on the seed and the counts only, not on
+# how many processes generated it. They go in with a plain executemany, as
+# bulk_create spends most of its time preparing each value; the few thousand
+# drives, roles, events and competitions use bulk_create. Neither sends
+# model signals (so no emails either): the data they maintain (seat and
+# applicant counters, registration stats, search index, catalog cache) is
+# rebuilt at the end. On SQLite the page cache is raised while loading or
+# clearing, as the registration tables' eight indexes outgrow the default.
+# Every synthetic student's password is PASSWORD.
+
+PREFIX = 'SYN'
+PASSWORD = 'password123'
+BATCH_SIZE = 2000
+# Students per generation task; a task makes them, or their registrations
+CHUNK_SIZE = 5000
+# Share of the registrations that go to placement drives; the rest to competitions
+PLACEMENT_SHARE = 0.7
+
+# SQLite page cache while loading or clearing, in KiB
+SQLITE_CACHE_KIB = 256 * 1024
+
+# seed_db --scale presets
+SCALES = {
+    'small': {'students': 1000, 'placements': 20, 'events': 5, 'registrations': 10000},
+    'medium': {'students': 10000, 'placements': 100, 'events': 20, 'registrations': 100000},
+    'large': {'students': 50000, 'placements': 500, 'events': 50, 'registrations': 500000},
+    'xlarge': {'students': 200000, 'placements': 1000, 'events': 100, 'registrations': 1000000},
+}
+
+DEPARTMENTS = ['CS', 'IT', 'ECE', 'EEE', 'MECH', 'CIVIL', 'CHEM', 'BIO']
+DEPARTMENT_WEIGHTS = [30, 20, 15, 10, 10, 7, 4, 4]
+FIRST_NAMES = ['Aarav', 'Aditi', 'Arjun', 'Divya', 'Farhan', 'Priya', 'Karthik', 'Meera', 'Rahul', 'Sneha', 'Vikram', 'Ananya', 'Rohan', 'Kavya', 'Nikhil', 'Pooja']
+LAST_NAMES = ['Sharma', 'Iyer', 'Reddy', 'Nair', 'Khan', 'Patel', 'Menon', 'Das', 'Singh', 'Rao', 'Gupta', 'Pillai']
+COMPANY_WORDS = ['Tech', 'Data', 'Cloud', 'Cyber', 'Quantum', 'Nova', 'Bright', 'Blue', 'Prime', 'Apex', 'Infinity', 'Green']
+COMPANY_SUFFIXES = ['Solutions', 'Systems', 'Labs', 'Analytics', 'Technologies', 'Networks', 'Works', 'Inc']
+ROLE_NAMES = [
+    'Software Engineer', 'Data Analyst', 'Cloud Architect', 'DevOps Engineer', 'Frontend Developer', 'Backend Developer',
+    'Data Scientist', 'Business Analyst', 'QA Engineer', 'Security Analyst', 'Product Manager', 'Site Reliability Engineer',
+]
+EVENT_THEMES = ['Cultural Fest', 'Tech Symposium', 'Sports Meet', 'Literary Fest', 'Entrepreneurship Summit', 'Robotics Expo']
+COMPETITION_NAMES = ['Hackathon', 'Coding Contest', 'Quiz', 'Debate', 'Dance', 'Singing', 'Photography', 'Pitch', 'Painting', 'Football', 'Chess', 'Web Design']
+VENUES = ['Main Auditorium', 'Conference Hall A', 'Seminar Hall B', 'Lab Complex', 'College Ground', 'Business School']
+STATUSES = [PlacementRegistration.STATUS_APPLIED, PlacementRegistration.STATUS_SHORTLISTED, PlacementRegistration.STATUS_REJECTED, PlacementRegistration.STATUS_SELECTED]
+STATUS_WEIGHTS = [70, 15, 10, 5]
+FIRST_DAY = datetime.date(2025, 7, 1)
+FIRST_REGISTRATION = datetime.datetime(2025, 6, 1, tzinfo=datetime.timezone.utc)
+
+STUDENT_FIELDS = [
+    'register_number', 'name', 'email', 'phone', 'student_class', 'department', 'year', 'college',
+    'cgpa', 'backlogs', 'history_of_arrears', 'tenth_marks', 'twelfth_marks', 'password_hash',
+]
+PLACEMENT_REGISTRATION_FIELDS = ['student', 'placement', 'role', 'role_name', 'status', 'registered_at', 'waitlisted']
+EVENT_REGISTRATION_FIELDS = ['student', 'event', 'competition', 'registered_at', 'waitlisted']
+
+
+def chunk_rng(seed, kind, index):
+    return random.Random(f'{seed}:{kind}:{index}')
+
+
+def in_batches(rows, size=BATCH_SIZE):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def student_rows(seed, index, start, end, password_hash):
+    """Rows of STUDENT_FIELDS for students number `start` to `end`."""
+    rng = chunk_rng(seed, 'students', index)
+    rows = []
+    for n in range(start, end):
+        rows.append((
+            f'{PREFIX}{n:07d}', f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}', f'syn{n}@example.com',
+            f'9{rng.randrange(10 ** 9):09d}', 'B.Tech', rng.choices(DEPARTMENTS, DEPARTMENT_WEIGHTS)[0], str(rng.randint(1, 4)),
+            'Synthetic College', round(min(10, max(5, rng.gauss(7.5, 1.0))), 2), rng.choices([0, 1, 2, 3], [80, 10, 6, 4])[0],
+            rng.random() < 0.15, round(rng.uniform(60, 100), 2), round(rng.uniform(60, 100), 2), password_hash,
+        ))
+    return rows
+
+
+def make_placements(rng, count):
+    for n in range(count):
+        company = f'{rng.choice(COMPANY_WORDS)}{rng.choice(COMPANY_WORDS).lower()} {rng.choice(COMPANY_SUFFIXES)} {n}'
+        roles = rng.sample(ROLE_NAMES, rng.randint(2, 5))
+        low = rng.randint(4, 12)
+        yield Placement(
+            company_name=company, description=f'{company} is hiring {", ".join(roles)}.',
+            date=FIRST_DAY + datetime.timedelta(days=rng.randrange(365)), time=datetime.time(rng.randint(9, 15)),
+            venue=rng.choice(VENUES), roles=','.join(roles), eligibility='B.E./B.Tech',
+            min_cgpa=rng.choice([None, 6, 7, 7.5, 8]), package=f'{low}-{low + rng.randint(2, 10)} LPA',
+        )
+
+
+def make_events(rng, count):
+    for n in range(count):
+        yield Event(
+            event_name=f'{rng.choice(EVENT_THEMES)} {n}', description='Synthetic event',
+            date=FIRST_DAY + datetime.timedelta(days=rng.randrange(365)), time=datetime.time(rng.randint(8, 18)),
+            venue=rng.choice(VENUES), rules='General rules apply.', contact_person='Organiser', contact_number='9876543210',
+        )
+
+
+def make_competitions(rng, event_ids):
+    for event_id in event_ids:
+        for name in rng.sample(COMPETITION_NAMES, rng.randint(3, 6)):
+            yield Competition(
+                event_id=event_id, name=name, description=f'{name} competition', prize=f'₹{rng.randint(5, 50)},000',
+                team_size=rng.choice(['1', '2-4', '5']), type=rng.choice(['Individual', 'Team']),
+            )
+
+
+def pick_pairs(rng, student_ids, targets, count):
+    """
+    `count` distinct (student_id, target) pairs; popular targets get more.
+
+    Popularity follows a Zipf-like curve, as a few drives and competitions
+    draw most of the applicants.
+    """
+    count = min(count, len(student_ids) * len(targets))
+    if not count:
+        return []
+    weights = [1 / (rank + 1) ** 0.8 for rank in range(len(targets))]
+    pairs = set()
+    while len(pairs) < count:
+        chosen = rng.choices(targets, weights, k=count - len(pairs))
+        pairs.update((rng.choice(student_ids), target) for target in chosen)
+    # Sorted first so the order only depends on the seed
+    pairs = sorted(pairs)
+    rng.shuffle(pairs)
+    return pairs
+
+
+def registered_at(rng):
+    moment = FIRST_REGISTRATION + datetime.timedelta(seconds=rng.randrange(365 * 86400), microseconds=rng.randrange(10 ** 6))
+    return connection.ops.adapt_datetimefield_value(moment)
+
+
+def placement_registration_rows(seed, index, student_ids, count, roles):
+    """Rows of PLACEMENT_REGISTRATION_FIELDS; `roles` are (id, placement_id, name)."""
+    rng = chunk_rng(seed, 'placement-registrations', index)
+    return [
+        (student_id, placement_id, role_id, name, rng.choices(STATUSES, STATUS_WEIGHTS)[0], registered_at(rng), False)
+        for student_id, (role_id, placement_id, name) in pick_pairs(rng, student_ids, roles, count)
+    ]
+
+
+def event_registration_rows(seed, index, student_ids, count, competitions):
+    """Rows of EVENT_REGISTRATION_FIELDS; `competitions` are (id, event_id)."""
+    rng = chunk_rng(seed, 'event-registrations', index)
+    return [
+        (student_id, event_id, competition_id, registered_at(rng), False)
+        for student_id, (competition_id, event_id) in pick_pairs(rng, student_ids, competitions, count)
+    ]
+
+
+def registration_tasks(seed, student_ids, count, targets):
+    """
+    Splits `count` registrations over the chunks of students, in proportion.
+
+    A student is in a single chunk, so pairs unique within each chunk are
+    unique overall.
+    """
+    total = len(student_ids)
+    for index, start in enumerate(range(0, total, CHUNK_SIZE)):
+        end = min(start + CHUNK_SIZE, total)
+        yield seed, index, student_ids[start:end], count * end // total - count * start // total, targets
+
+
+def produce(function, tasks, processes=1):
+    """function(*task) for each task, in order; in worker processes if more than one."""
+    if processes <= 1:
+        for task in tasks:
+            yield function(*task)
+        return
+    # Spawned, not forked, so a worker never shares this process's database connection
+    with ProcessPoolExecutor(processes, mp_context=get_context('spawn'), initializer=django.setup) as pool:
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.submit(function, *task))
+            # A bounded window, so generated rows do not pile up faster than they are inserted
+            if len(pending) >= processes * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def insert_rows(model, fields, rows):
+    """One executemany INSERT of rows already in the database's types."""
+    quote = connection.ops.quote_name
+    columns = ', '.join(quote(model._meta.get_field(name).column) for name in fields)
+    placeholders = ', '.join(['%s'] * len(fields))
+    with connection.cursor() as cursor:
+        cursor.executemany(f'INSERT INTO {quote(model._meta.db_table)} ({columns}) VALUES ({placeholders})', rows)
+
+
+@contextmanager
+def large_page_cache():
+    if connection.vendor != 'sqlite':
+        yield
+        return
+    with connection.cursor() as cursor:
+        cursor.execute('PRAGMA cache_size')
+        previous = cursor.fetchone()[0]
+        cursor.execute(f'PRAGMA cache_size=-{SQLITE_CACHE_KIB}')
+        try:
+            yield
+        finally:
+            cursor.execute(f'PRAGMA cache_size={previous}')
+
+
+def clear():
+    """
+    Deletes the synthetic students with everything that points at them.
+
+    One DELETE per table, leaves first: a plain delete() would load and
+    delete the registrations a hundred at a time, with signals and waitlist
+    promotion emails for each. The counters and stats are recomputed after.
+    """
+    students = Student.objects.filter(register_number__startswith=PREFIX)
+    with transaction.atomic(), large_page_cache():
+        for rows in [
+            StatusChange.objects.filter(registration__student__in=students),
+            PlacementRegistration.objects.filter(student__in=students),
+            EventRegistration.objects.filter(student__in=students),
+            SentReminder.objects.filter(student__in=students),
+            students,
+        ]:
+            # What Collector uses for its fast deletes: no signals, no cascade
+            rows._raw_delete(rows.db)
+        seats.recount()
+        analytics.rebuild()
+
+
+def generate(students=0, placements=0, events=0, registrations=0, seed=0, processes=1, log=None):
+    """Adds synthetic rows, using `processes` to generate them; returns the number of each created."""
+    rng = random.Random(seed)
+    log = log or (lambda message: None)
+
+    with transaction.atomic(), large_page_cache():
+        password_hash = make_password(PASSWORD)
+        tasks = ((seed, index, start, min(start + CHUNK_SIZE, students), password_hash) for index, start in enumerate(range(0, students, CHUNK_SIZE)))
+        for rows in produce(student_rows, tasks, processes):
+            insert_rows(Student, STUDENT_FIELDS, rows)
+        log(f'{students} students')
+
+        for batch in in_batches(make_placements(rng, placements)):
+            Placement.objects.bulk_create(batch)
+        new_placements = list(Placement.objects.order_by('-id')[:placements]) if placements else []
+        roles = [PlacementRole(placement=placement, name=name) for placement in new_placements for name in placement.role_names()]
+        PlacementRole.objects.bulk_create(roles, batch_size=BATCH_SIZE)
+        log(f'{placements} placements with {len(roles)} roles')
+
+        for batch in in_batches(make_events(rng, events)):
+            Event.objects.bulk_create(batch)
+        event_ids = list(Event.objects.order_by('-id').values_list('id', flat=True)[:events]) if events else []
+        for batch in in_batches(make_competitions(rng, sorted(event_ids))):
+            Competition.objects.bulk_create(batch)
+        log(f'{events} events')
+
+        student_ids = list(Student.objects.filter(register_number__startswith=PREFIX).order_by('id').values_list('id', flat=True))
+        role_targets = list(PlacementRole.objects.filter(placement__in=new_placements).order_by('id').values_list('id', 'placement_id', 'name'))
+        competition_targets = list(Competition.objects.filter(event_id__in=event_ids).order_by('id').values_list('id', 'event_id'))
+        rng.shuffle(role_targets)
+        rng.shuffle(competition_targets)
+        placement_count = round(registrations * PLACEMENT_SHARE) if competition_targets else registrations
+
+        created = {}
+        for model, fields, make_rows, count, targets in [
+            (PlacementRegistration, PLACEMENT_REGISTRATION_FIELDS, placement_registration_rows, placement_count, role_targets),
+            (EventRegistration, EVENT_REGISTRATION_FIELDS, event_registration_rows, registrations - placement_count, competition_targets),
+        ]:
+            created[model] = 0
+            if not targets:
+                continue
+            for rows in produce(make_rows, registration_tasks(seed, student_ids, count, targets), processes):
+                insert_rows(model, fields, rows)
+                created[model] += len(rows)
+        log(f'{created[PlacementRegistration]} placement and {created[EventRegistration]} event registrations')
+
+        # What the signals and seats.py would have counted
+        seats.recount()
+        analytics.rebuild()
+        log('counters and registration stats')
+    search.rebuild_index()
+    invalidate_catalog('placements', 'events', 'competitions')
+    log('search index')
+    return {
+        'students': students, 'placements': placements, 'roles': len(roles), 'events': events,
+        'placement_registrations': created[PlacementRegistration], 'event_registrations': created[EventRegistration],
+    }
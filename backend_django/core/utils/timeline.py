@@ -0,0 +1,125 @@
+import datetime
+
+from django.db import connection
+from django.db.models import CharField, F, Value
+from django.utils import timezone
+
+from core.models import Event, EventRegistration, Placement, PlacementRegistration
+
+# Placements and events in one date-ordered list, merged by the database: a
+# UNION ALL of two range scans over the (date, time) indexes, so a week's
+# window costs the same however many years of drives are archived. The
+# calendar feed does the same over one student's registrations.
+
+KIND_PLACEMENT = 'placement'
+KIND_EVENT = 'event'
+KINDS = (KIND_PLACEMENT, KIND_EVENT)
+DEFAULT_DAYS = 30
+MAX_LIMIT = 500
+# Drives and events have a start only; calendars show them this long
+DURATION = datetime.timedelta(hours=2)
+# The feed skips anything older; calendar apps keep what they already fetched
+FEED_HISTORY = datetime.timedelta(days=180)
+
+
+def entries(start, end, kinds=KINDS, student_id=None, descending=False, limit=100):
+    """
+    Placements and events dated from `start` to `end` (inclusive), as dicts
+    of kind, id, title, date, time and venue, ordered by date and time.
+
+    With `student_id`, only the ones the student registered for.
+    """
+    parts = []
+    if KIND_PLACEMENT in kinds:
+        placements = Placement.objects.filter(date__range=(start, end))
+        if student_id is not None:
+            placements = placements.filter(pk__in=PlacementRegistration.objects.filter(student_id=student_id).values('placement_id'))
+        parts.append(placements.values('id', 'date', 'time', 'venue', kind=Value(KIND_PLACEMENT, CharField()), title=F('company_name')))
+    if KIND_EVENT in kinds:
+        events = Event.objects.filter(date__range=(start, end))
+        if student_id is not None:
+            events = events.filter(pk__in=EventRegistration.objects.filter(student_id=student_id).values('event_id'))
+        parts.append(events.values('id', 'date', 'time', 'venue', kind=Value(KIND_EVENT, CharField()), title=F('event_name')))
+    if not parts:
+        return []
+
+    ordering = ['-date', '-time', 'kind', '-id'] if descending else ['date', 'time', 'kind', 'id']
+    if connection.features.supports_slicing_ordering_in_compound:
+        # Each side stops after `limit` index entries instead of reading the whole window
+        parts = [part.order_by(*ordering)[:limit] for part in parts]
+    else:
+        parts = [part.order_by() for part in parts]
+    return list(parts[0].union(*parts[1:], all=True).order_by(*ordering)[:limit])
+
+
+def registrations(student_id, since):
+    """
+    The student's placement and event registrations dated from `since`, for
+    the calendar feed: one UNION ALL of the student's rows (the indexes leading
+    with student), each joined to its drive or event for the date filter.
+    """
+    placements = PlacementRegistration.objects.filter(student_id=student_id, placement__date__gte=since).values(
+        'id', 'waitlisted', stage=F('status'), kind=Value(KIND_PLACEMENT, CharField()), title=F('placement__company_name'),
+        detail=F('role_name'), date=F('placement__date'), time=F('placement__time'), venue=F('placement__venue'),
+    )
+    events = EventRegistration.objects.filter(student_id=student_id, event__date__gte=since).values(
+        'id', 'waitlisted', stage=Value('', CharField()), kind=Value(KIND_EVENT, CharField()), title=F('event__event_name'),
+        detail=F('competition__name'), date=F('event__date'), time=F('event__time'), venue=F('event__venue'),
+    )
+    return list(placements.order_by().union(events.order_by(), all=True).order_by('date', 'time', 'kind', 'id'))
+
+
+def ics_text(value):
+    return str(value).replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,').replace('\r\n', '\\n').replace('\n', '\\n')
+
+
+def ics_time(moment):
+    return moment.astimezone(datetime.timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def ics_local_time(moment):
+    # Drive and event times are campus wall-clock times, not UTC: a floating
+    # time (no Z, no TZID) shows as written in any calendar
+    return moment.strftime('%Y%m%dT%H%M%S')
+
+
+def fold(line):
+    """Splits a content line into 75 octet pieces, as RFC 5545 asks."""
+    encoded = line.encode()
+    pieces = []
+    while len(encoded) > 75:
+        cut = 75 if not pieces else 74
+        # Never split a UTF-8 sequence
+        while cut and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        pieces.append(encoded[:cut].decode())
+        encoded = encoded[cut:]
+    pieces.append(encoded.decode())
+    return '\r\n '.join(pieces)
+
+
+def calendar(rows, name, host):
+    """An iCalendar (.ics) document with one VEVENT per registration row."""
+    stamp = ics_time(timezone.now())
+    lines = ['BEGIN:VCALENDAR', 'VERSION:2.0', 'PRODID:-//Campus Connect//Timeline//EN', 'CALSCALE:GREGORIAN', f'X-WR-CALNAME:{ics_text(name)}']
+    for row in rows:
+        starts = datetime.datetime.combine(row['date'], row['time'])
+        if row['kind'] == KIND_PLACEMENT:
+            description = f"Placement drive, {row['detail']}: {row['stage']}"
+        else:
+            description = f"Event, {row['detail']}"
+        if row['waitlisted']:
+            description += ' (waitlisted)'
+        lines += [
+            'BEGIN:VEVENT',
+            f"UID:{row['kind']}-registration-{row['id']}@{host}",
+            f'DTSTAMP:{stamp}',
+            f'DTSTART:{ics_local_time(starts)}',
+            f'DTEND:{ics_local_time(starts + DURATION)}',
+            f"SUMMARY:{ics_text(row['title'] + ' - ' + row['detail'])}",
+            f"LOCATION:{ics_text(row['venue'])}",
+            f'DESCRIPTION:{ics_text(description)}',
+            'END:VEVENT',
+        ]
+    lines.append('END:VCALENDAR')
+    return ''.join(fold(line) + '\r\n' for line in lines)
@@ -1,93 +1,573 @@
-from rest_framework import viewsets, status
+import datetime
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, RestrictedError, Sum
+from django.http import HttpResponse
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from django.utils.text import slugify
+from rest_framework import mixins, viewsets, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import Throttled
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
-from .models import Student, Placement, Event, Competition, PlacementRegistration, EventRegistration
-from .serializers import StudentSerializer, PlacementSerializer, EventSerializer, PlacementRegistrationSerializer, EventRegistrationSerializer, CompetitionSerializer
-from .utils.emails import send_welcome_email, send_event_registration_email, send_placement_registration_email
+from .models import Student, Placement, Event, Competition, PlacementRole, PlacementRegistration, EventRegistration, ResumeUpload, SearchDocument
+from .serializers import StudentSerializer, PlacementSerializer, EventSerializer, PlacementRegistrationSerializer, EventRegistrationSerializer, CompetitionSerializer, PlacementRoleSerializer, ResumeUploadSerializer, SearchResultSerializer, expanded_fields, parse_list_param
+from .serializers import StudentSummarySerializer, PlacementSummarySerializer, EventSummarySerializer, CompetitionSummarySerializer, PlacementRegistrationSummarySerializer, EventRegistrationSummarySerializer
+from .filters import RegistrationFilterMixin
+from .pagination import RegistrationCursorPagination
+from .auth import IsOwnStudent, LocalOnly, issue_feed_token, issue_token, read_feed_token
+from .cache import CachedCatalogMixin
+from .throttling import ClientIPRateThrottle, EndpointRateThrottle, StudentRateThrottle, registration_limiter
+from .utils.exports import IgnoreClientContentNegotiation, csv_response, zip_response
+from .utils.resume_bundle import bundle_entries
+from .utils.student_import import detect_format, import_students
+from . import metrics
+from .utils import analytics, resume_uploads, search, seats, status_changes, timeline
+from .utils.emails import send_welcome_email, send_event_registration_email, send_placement_registration_email, send_waitlisted_email
+
+class SummaryListMixin:
+    """
+    ?summary=true on a list returns `summary_serializer_class` rows: a few
+    columns per object from one .values() query, no nested blocks. Full
+    objects come from retrieve (and plain lists, for existing clients).
+    """
+    summary_serializer_class = None
+
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get('summary') != 'true':
+            return super().list(request, *args, **kwargs)
+        summary = self.summary_serializer_class
+        # A cursor is read from the ordering columns, whatever ?fields= asks for
+        ordering = getattr(self.paginator, 'ordering', ())
+        ordering = [name.lstrip('-') for name in ([ordering] if isinstance(ordering, str) else ordering)]
+        rows = summary.project(self.filter_queryset(self.get_queryset()), request, ordering)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(summary.represent(page, request))
+        return Response(summary.represent(rows, request))
+
+class UniqueRegistrationMixin:
+    """
+    Creates registrations with a plain INSERT guarded by the unique_together constraint.
+
+    No exists() pre-check: it costs a round trip and races when a drive opens
+    and many students click at once. A duplicate fails the insert inside a
+    savepoint and is answered with a 400. The seat (see core/utils/seats.py)
+    is claimed and the confirmation email queued in the same transaction, from
+    the related rows the serializer already loaded.
+
+    Creates go through the token bucket throttles and the concurrency limiter
+    of core/throttling.py first; refusals are fast 429s with a Retry-After.
+    Only the student being registered may create (their Bearer token).
+    """
+    duplicate_error = 'Already registered'
+    throttle_classes = [StudentRateThrottle, ClientIPRateThrottle, EndpointRateThrottle]
+
+    def get_permissions(self):
+        if self.action == 'create':
+            return [IsOwnStudent()]
+        return super().get_permissions()
+
+    def get_throttles(self):
+        if self.action != 'create':
+            return []
+        return super().get_throttles()
+
+    def check_throttles(self, request):
+        # Stop at the first refusal so it does not also use up tokens of the other buckets
+        for throttle in self.get_throttles():
+            if not throttle.allow_request(request, self):
+                metrics.inc('registration_admission', endpoint=self.basename, outcome='throttled', scope=throttle.scope)
+                self.throttled(request, throttle.wait())
 
-class StudentViewSet(viewsets.ModelViewSet):
+    def create(self, request, *args, **kwargs):
+        if not registration_limiter.acquire():
+            metrics.inc('registration_admission', endpoint=self.basename, outcome='overloaded')
+            raise Throttled(wait=settings.REGISTRATION_RETRY_AFTER, detail='Too many registrations in progress, retry shortly.')
+        metrics.inc('registration_admission', endpoint=self.basename, outcome='admitted')
+        try:
+            return self.register(request)
+        finally:
+            registration_limiter.release()
+
+    def register(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            with transaction.atomic():
+                registration = serializer.save(waitlisted=self.allocate_seat(serializer.validated_data))
+                self.queue_confirmation(registration)
+        except IntegrityError:
+            return Response({'error': self.duplicate_error}, status=status.HTTP_400_BAD_REQUEST)
+        headers = self.get_success_headers(serializer.data)
+        return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
+
+    def allocate_seat(self, data):
+        return False
+
+    def queue_confirmation(self, registration):
+        pass
+
+class StudentViewSet(SummaryListMixin, viewsets.ModelViewSet):
     queryset = Student.objects.all()
     serializer_class = StudentSerializer
+    summary_serializer_class = StudentSummarySerializer
 
+    def get_permissions(self):
+        # A profile is only edited by its own student; deletes stay with the admin screens
+        if self.action in ('update', 'partial_update'):
+            return [IsOwnStudent()]
+        return super().get_permissions()
+
+    @transaction.atomic
     def perform_create(self, serializer):
         student = serializer.save()
-        # Send welcome email
+        # Queue welcome email (committed together with the student)
         if student.email:
              send_welcome_email(student.email, student.name)
 
-    @action(detail=False, methods=['post'])
+    @action(detail=False, methods=['post'], url_path='bulk-import', permission_classes=[IsAdminUser])
+    def bulk_import(self, request):
+        """Imports a CSV/JSONL roster (multipart `file`), upserting on register_number. Staff only."""
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response({'error': 'Upload a CSV or JSONL file as `file`'}, status=status.HTTP_400_BAD_REQUEST)
+        fmt = request.data.get('file_format') or detect_format(upload.name)
+        if fmt not in ('csv', 'jsonl'):
+            return Response({'error': 'file_format must be csv or jsonl'}, status=status.HTTP_400_BAD_REQUEST)
+        result = import_students(upload.file, fmt=fmt, send_welcome=request.data.get('send_welcome', 'true') != 'false')
+        return Response(result)
+
+    @action(detail=False, methods=['post'], authentication_classes=[])
     def login(self, request):
+        """Checks the password and returns the student with a signed `token` for the Authorization header."""
         register_number = request.data.get('register_number')
-        password = request.data.get('password')
+        password = request.data.get('password') or ''
         try:
             student = Student.objects.get(register_number=register_number)
-            if student.password_hash == password: # Simple plain text for now
-                serializer = self.get_serializer(student)
-                return Response(serializer.data)
-            return Response({'error': 'Invalid credentials'}, status=status.HTTP_400_BAD_REQUEST)
         except Student.DoesNotExist:
+            # Hash anyway so response times do not reveal which register numbers exist
+            make_password(password)
             return Response({'error': 'User not found'}, status=status.HTTP_404_NOT_FOUND)
+        if not student.check_password(password):
+            return Response({'error': 'Invalid credentials'}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({**self.get_serializer(student).data, 'token': issue_token(student)})
+
+    @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated])
+    def me(self, request):
+        """The student the token belongs to."""
+        student = Student.objects.filter(pk=getattr(request.user, 'student_id', None)).first()
+        if student is None:
+            return Response({'error': 'Not signed in as a student'}, status=status.HTTP_403_FORBIDDEN)
+        return Response(self.get_serializer(student).data)
 
-class PlacementViewSet(viewsets.ModelViewSet):
+    @action(detail=False, methods=['get'], url_path='me/calendar', permission_classes=[IsAuthenticated])
+    def calendar(self, request):
+        """The subscription URL of the signed-in student's .ics feed."""
+        student = Student.objects.filter(pk=getattr(request.user, 'student_id', None)).first()
+        if student is None:
+            return Response({'error': 'Not signed in as a student'}, status=status.HTTP_403_FORBIDDEN)
+        url = request.build_absolute_uri(reverse('timeline-calendar'))
+        return Response({'url': f'{url}?token={issue_feed_token(student)}'})
+
+class PlacementViewSet(CachedCatalogMixin, SummaryListMixin, viewsets.ModelViewSet):
     queryset = Placement.objects.all()
     serializer_class = PlacementSerializer
+    summary_serializer_class = PlacementSummarySerializer
+    cache_catalog = 'placements'
+
+    @action(detail=True, methods=['get'], url_path='eligible-students')
+    def eligible_students(self, request, pk=None):
+        """Students matching the drive's min CGPA / max backlogs / departments / years."""
+        students = self.get_object().eligible_students()
+        if request.query_params.get('count_only') == 'true':
+            return Response({'count': students.count()})
+        page = self.paginate_queryset(students)
+        if page is not None:
+            return self.get_paginated_response(StudentSerializer(page, many=True, context=self.get_serializer_context()).data)
+        return Response(StudentSerializer(students, many=True, context=self.get_serializer_context()).data)
 
-class EventViewSet(viewsets.ModelViewSet):
+    @action(detail=True, methods=['get'])
+    def seats(self, request, pk=None):
+        """Live fill level and applicant count of each role (not cached)."""
+        return Response(seats.role_fill_levels(self.get_object()))
+
+class EventViewSet(CachedCatalogMixin, SummaryListMixin, viewsets.ModelViewSet):
     queryset = Event.objects.all()
     serializer_class = EventSerializer
+    summary_serializer_class = EventSummarySerializer
+    cache_catalog = 'events'
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'destroy':
+            return queryset
+        # EventSerializer nests every competition of the event
+        if 'competitions' in expanded_fields(self.request, EventSerializer.Meta.expandable_fields):
+            queryset = queryset.prefetch_related('competitions')
+        return queryset
 
-class CompetitionViewSet(viewsets.ModelViewSet):
+    @action(detail=True, methods=['get'])
+    def seats(self, request, pk=None):
+        """Live fill level of each competition (not cached)."""
+        return Response(seats.competition_fill_levels(self.get_object()))
+
+class CompetitionViewSet(CachedCatalogMixin, SummaryListMixin, viewsets.ModelViewSet):
     queryset = Competition.objects.all()
     serializer_class = CompetitionSerializer
+    summary_serializer_class = CompetitionSummarySerializer
+    cache_catalog = 'competitions'
+
+    def perform_update(self, serializer):
+        competition = serializer.save()
+        # A raised capacity lets waitlisted students in
+        with transaction.atomic():
+            seats.notify_promoted(seats.fill_from_waitlist(seats.competition_pool(competition.id), seats.competition_waitlist(competition.id)))
 
-class PlacementRegistrationViewSet(viewsets.ModelViewSet):
+class PlacementRoleViewSet(viewsets.ModelViewSet):
+    queryset = PlacementRole.objects.all()
+    serializer_class = PlacementRoleSerializer
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        placement_id = self.request.query_params.get('placement')
+        if placement_id:
+            queryset = queryset.filter(placement_id=placement_id)
+        return queryset
+
+    def perform_update(self, serializer):
+        role = serializer.save()
+        with transaction.atomic():
+            seats.notify_promoted(seats.fill_from_waitlist(seats.role_pool(role.id), seats.role_waitlist(role.id)))
+
+    def destroy(self, request, *args, **kwargs):
+        try:
+            return super().destroy(request, *args, **kwargs)
+        except RestrictedError:
+            return Response({'error': 'Role has registrations'}, status=status.HTTP_400_BAD_REQUEST)
+
+    @action(detail=False, methods=['get'])
+    def stats(self, request):
+        """
+        Most applied roles (?placement= narrows to one drive, ?limit= defaults to 10).
+
+        Reads the applicant counters, so the cost grows with the number of
+        roles, never with the number of registrations.
+        """
+        try:
+            limit = max(1, min(int(request.query_params.get('limit', 10)), 100))
+        except ValueError:
+            return Response({'limit': ['Expected a number.']}, status=status.HTTP_400_BAD_REQUEST)
+        roles = self.get_queryset()
+        top_roles = roles.annotate(company_name=F('placement__company_name')).order_by('-applicant_count', 'id').values(
+            'id', 'placement', 'company_name', 'name', 'applicant_count', 'seats_taken', 'capacity',
+        )[:limit]
+        # The same role name across drives, e.g. every "Software Engineer" opening
+        top_names = roles.values('name').annotate(applicants=Sum('applicant_count'), drives=Count('id')).order_by('-applicants', 'name')[:limit]
+        return Response({
+            'roles': list(top_roles),
+            'names': list(top_names),
+            'total_applicants': roles.aggregate(total=Sum('applicant_count'))['total'] or 0,
+        })
+
+class PlacementRegistrationViewSet(UniqueRegistrationMixin, RegistrationFilterMixin, SummaryListMixin, viewsets.ModelViewSet):
     queryset = PlacementRegistration.objects.all()
     serializer_class = PlacementRegistrationSerializer
+    summary_serializer_class = PlacementRegistrationSummarySerializer
+    pagination_class = RegistrationCursorPagination
+    filter_fields = {
+        'student': 'student_id',
+        'placement': 'placement_id',
+        'role': 'role_id',
+        'role_name': 'role_name',
+        'status': 'status',
+    }
+    id_filter_fields = ('student', 'placement', 'role')
 
-    def create(self, request, *args, **kwargs):
-        # Custom create to check duplicates
-        student_id = request.data.get('student')
-        placement_id = request.data.get('placement')
-        role_name = request.data.get('role_name')
-        
-        if PlacementRegistration.objects.filter(student_id=student_id, placement_id=placement_id, role_name=role_name).exists():
-             return Response({'error': 'Already registered'}, status=status.HTTP_400_BAD_REQUEST)
-        
-        response = super().create(request, *args, **kwargs)
-        
-        # Send confirmation email
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'destroy':
+            return queryset
+        # Only join the nested blocks the response will actually contain
+        expanded = expanded_fields(self.request, PlacementRegistrationSerializer.Meta.expandable_fields)
+        related = [name.removesuffix('_details') for name in expanded]
+        if related:
+            queryset = queryset.select_related(*related)
+        return queryset
+
+    @action(detail=False, methods=['get'], content_negotiation_class=IgnoreClientContentNegotiation)
+    def export(self, request):
+        """Streams the (filtered) registrations as CSV, one row at a time."""
+        queryset = self.filter_queryset(PlacementRegistration.objects.all()).order_by('placement_id', 'registered_at', 'id')
+        media_url = request.build_absolute_uri(settings.MEDIA_URL)
+        header = [
+            'Company', 'Role', 'Student Name', 'Register Number', 'Email', 'Phone', 'Class', 'Department', 'Year',
+            'CGPA', 'Backlogs', 'Arrears', '10th Marks', '12th Marks', 'Status', 'Registered At', 'Resume URL',
+        ]
+        rows = queryset.values_list(
+            'placement__company_name', 'role_name', 'student__name', 'student__register_number', 'student__email',
+            'student__phone', 'student__student_class', 'student__department', 'student__year', 'student__cgpa',
+            'student__backlogs', 'student__history_of_arrears', 'student__tenth_marks', 'student__twelfth_marks',
+            'status', 'registered_at', 'resume',
+        ).iterator(chunk_size=2000)
+        return csv_response(
+            'placement_registrations.csv',
+            header,
+            (row[:-1] + (media_url + row[-1] if row[-1] else 'Not uploaded',) for row in rows),
+        )
+
+    @action(detail=False, methods=['get'], content_negotiation_class=IgnoreClientContentNegotiation)
+    def resumes(self, request):
+        """Streams a ZIP of one drive's (filtered) resumes, named by register number, with an index.csv."""
+        queryset = self.filter_queryset(PlacementRegistration.objects.all())
+        placement = Placement.objects.filter(pk=request.query_params.get('placement') or None).first()
+        if placement is None:
+            return Response({'placement': ['An existing placement id is required.']}, status=status.HTTP_400_BAD_REQUEST)
+        filename = f"{slugify(placement.company_name) or 'placement'}-resumes.zip"
+        return zip_response(filename, bundle_entries(queryset))
+
+    @action(detail=False, methods=['post'], url_path='bulk-status')
+    def bulk_status(self, request):
+        """
+        Moves many registrations to one status, e.g. after a test round.
+
+        Body: {"status": "Shortlisted"} with "ids": [...] and/or "filters": {...}
+        (the list filters, e.g. {"placement": 3, "status": "Applied"}), plus an
+        optional "note" and "notify" (default true). All or nothing: one
+        disallowed transition rejects the batch.
+        """
+        ids = request.data.get('ids') or []
+        filters = request.data.get('filters') or {}
+        if not isinstance(ids, list) or not all(str(pk).isdigit() for pk in ids):
+            return Response({'ids': ['Expected a list of registration ids.']}, status=status.HTTP_400_BAD_REQUEST)
+        if not isinstance(filters, dict):
+            return Response({'filters': ['Expected an object of list filters.']}, status=status.HTTP_400_BAD_REQUEST)
+        lookups = self.registration_filters(filters)
+        if not ids and not lookups:
+            return Response({'error': 'Give ids or filters to select the registrations.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        registrations = PlacementRegistration.objects.filter(**lookups)
+        if ids:
+            registrations = registrations.filter(pk__in=ids)
         try:
-            student = Student.objects.get(id=student_id)
-            placement = Placement.objects.get(id=placement_id)
-            if student.email:
-                send_placement_registration_email(student.email, placement.company_name, placement.date)
-        except Exception as e:
-            print(f"Error sending placement email: {e}")
-            
-        return response
+            result = status_changes.bulk_transition(
+                registrations, str(request.data.get('status', '')),
+                note=str(request.data.get('note', ''))[:255], notify=request.data.get('notify', True) is not False,
+            )
+        except status_changes.TransitionError as e:
+            return Response({'error': str(e), 'ids': e.ids}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(result)
+
+    def allocate_seat(self, data):
+        return seats.allocate(seats.role_pool(data['role'].id))
 
-class EventRegistrationViewSet(viewsets.ModelViewSet):
+    def queue_confirmation(self, registration):
+        if registration.student.email:
+            if registration.waitlisted:
+                send_waitlisted_email(registration.student.email, f"{registration.placement.company_name} - {registration.role_name}")
+            else:
+                send_placement_registration_email(registration.student.email, registration.placement.company_name, registration.placement.date)
+
+class EventRegistrationViewSet(UniqueRegistrationMixin, RegistrationFilterMixin, SummaryListMixin, viewsets.ModelViewSet):
     queryset = EventRegistration.objects.all()
     serializer_class = EventRegistrationSerializer
+    summary_serializer_class = EventRegistrationSummarySerializer
+    pagination_class = RegistrationCursorPagination
+    filter_fields = {
+        'student': 'student_id',
+        'event': 'event_id',
+        'competition': 'competition_id',
+    }
+    id_filter_fields = ('student', 'event', 'competition')
+    duplicate_error = 'Already registered for this competition'
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'destroy':
+            return queryset
+        # Only join the nested blocks the response will actually contain
+        expanded = expanded_fields(self.request, EventRegistrationSerializer.Meta.expandable_fields)
+        related = [name.removesuffix('_details') for name in expanded]
+        if related:
+            queryset = queryset.select_related(*related)
+        if 'event_details' in expanded:
+            # event_details nests the event's competitions
+            queryset = queryset.prefetch_related('event__competitions')
+        return queryset
+
+    @action(detail=False, methods=['get'], content_negotiation_class=IgnoreClientContentNegotiation)
+    def export(self, request):
+        """Streams the (filtered) registrations as CSV, one row at a time."""
+        queryset = self.filter_queryset(EventRegistration.objects.all()).order_by('event_id', 'competition_id', 'registered_at', 'id')
+        header = ['Event', 'Competition', 'Student Name', 'Register Number', 'Email', 'Phone', 'Class', 'Department', 'Year', 'Registered At']
+        rows = queryset.values_list(
+            'event__event_name', 'competition__name', 'student__name', 'student__register_number', 'student__email',
+            'student__phone', 'student__student_class', 'student__department', 'student__year', 'registered_at',
+        ).iterator(chunk_size=2000)
+        return csv_response('event_registrations.csv', header, rows)
+
+    def allocate_seat(self, data):
+        return seats.allocate(seats.competition_pool(data['competition'].id))
+
+    def queue_confirmation(self, registration):
+        if registration.student.email:
+            event = registration.event
+            title = f"{event.event_name} - {registration.competition.name}"
+            if registration.waitlisted:
+                send_waitlisted_email(registration.student.email, title)
+            else:
+                send_event_registration_email(registration.student.email, title, event.date)
+
+class ResumeUploadViewSet(mixins.CreateModelMixin, mixins.RetrieveModelMixin, mixins.DestroyModelMixin, viewsets.GenericViewSet):
+    """
+    Chunked, resumable resume uploads, separate from the registration itself.
+
+    POST {filename, size} starts an upload; PUT <id>/chunk/?offset=N with the raw
+    bytes as the body appends one chunk (GET <id>/ tells where to resume);
+    POST <id>/complete/ stores the file, deduplicated by content; POST
+    <id>/attach/ {registration} sets it as a placement registration's resume.
+    """
+    queryset = ResumeUpload.objects.all()
+    serializer_class = ResumeUploadSerializer
+
+    def upload_error(self, error, upload=None):
+        body = {'error': str(error)}
+        if upload is not None:
+            body['received'] = upload.received
+        return Response(body, status=error.status)
 
     def create(self, request, *args, **kwargs):
-        # Custom create to check duplicates
-        student_id = request.data.get('student')
-        competition_id = request.data.get('competition')
-        
-        if EventRegistration.objects.filter(student_id=student_id, competition_id=competition_id).exists():
-             return Response({'error': 'Already registered for this competition'}, status=status.HTTP_400_BAD_REQUEST)
-        
-        response = super().create(request, *args, **kwargs)
-        
-        # Send confirmation email
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            upload = resume_uploads.start_upload(serializer.validated_data['filename'], serializer.validated_data['size'])
+        except resume_uploads.UploadError as e:
+            return self.upload_error(e)
+        return Response(self.get_serializer(upload).data, status=status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=['put'])
+    def chunk(self, request, pk=None):
+        upload = self.get_object()
+        try:
+            offset = int(request.query_params.get('offset', ''))
+            length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            return Response({'error': 'offset must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
         try:
-            student = Student.objects.get(id=student_id)
-            competition = Competition.objects.get(id=competition_id)
-            event = competition.event
-            if student.email:
-                send_event_registration_email(student.email, f"{event.event_name} - {competition.name}", event.date)
-        except Exception as e:
-            print(f"Error sending event email: {e}")
-            
+            # Read the raw body straight from the socket; request.data would buffer it
+            resume_uploads.write_chunk(upload, request.stream, offset, length)
+        except resume_uploads.UploadError as e:
+            return self.upload_error(e, upload)
+        return Response(self.get_serializer(upload).data)
+
+    @action(detail=True, methods=['post'])
+    def complete(self, request, pk=None):
+        upload = self.get_object()
+        try:
+            resume_uploads.complete_upload(upload)
+        except resume_uploads.UploadError as e:
+            return self.upload_error(e, upload)
+        return Response(self.get_serializer(upload).data)
+
+    @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated])
+    def attach(self, request, pk=None):
+        upload = self.get_object()
+        registration = PlacementRegistration.objects.filter(pk=request.data.get('registration')).first()
+        if registration is None:
+            return Response({'error': 'Registration not found'}, status=status.HTTP_404_NOT_FOUND)
+        if registration.student_id != getattr(request.user, 'student_id', None):
+            return Response({'error': 'Not your registration'}, status=status.HTTP_403_FORBIDDEN)
+        try:
+            resume_uploads.attach(upload, registration)
+        except resume_uploads.UploadError as e:
+            return self.upload_error(e, upload)
+        return Response(PlacementRegistrationSerializer(registration, context=self.get_serializer_context()).data)
+
+    def perform_destroy(self, instance):
+        instance.delete()
+        resume_uploads.remove_partial(instance)
+
+class SearchViewSet(viewsets.ViewSet):
+    """Ranked full-text search: ?q=soft eng (every word as a prefix), optional ?kind=placement,event and ?limit=."""
+
+    def list(self, request):
+        kinds = parse_list_param(request, 'kind') or set()
+        unknown = kinds - {kind for kind, _ in SearchDocument.KIND_CHOICES}
+        if unknown:
+            return Response({'kind': [f"Unknown kind: {', '.join(sorted(unknown))}"]}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            limit = int(request.query_params.get('limit', 20))
+        except ValueError:
+            return Response({'limit': ['Must be an integer.']}, status=status.HTTP_400_BAD_REQUEST)
+        results = search.search(request.query_params.get('q', ''), kinds=sorted(kinds), limit=limit)
+        return Response(SearchResultSerializer(results, many=True).data)
+
+class TimelineViewSet(viewsets.ViewSet):
+    """
+    Placements and events by date, merged: ?from= and ?to= (YYYY-MM-DD, default
+    the next 30 days), optional ?kind=placement,event, ?student= (only what they
+    registered for), ?order=desc (latest first, for past views) and ?limit=.
+    """
+
+    def list(self, request):
+        params = request.query_params
+        errors = {}
+        today = timezone.localdate()
+        start = parse_date(params['from']) if params.get('from') else today
+        if start is None:
+            errors['from'] = ['Expected a date, YYYY-MM-DD.']
+        end = parse_date(params['to']) if params.get('to') else (start or today) + datetime.timedelta(days=timeline.DEFAULT_DAYS)
+        if end is None:
+            errors['to'] = ['Expected a date, YYYY-MM-DD.']
+        kinds = parse_list_param(request, 'kind') or set(timeline.KINDS)
+        if kinds - set(timeline.KINDS):
+            errors['kind'] = [f"Unknown kind: {', '.join(sorted(kinds - set(timeline.KINDS)))}"]
+        student_id = params.get('student') or None
+        if student_id is not None and not student_id.isdigit():
+            errors['student'] = ['Expected a numeric id.']
+        try:
+            limit = max(1, min(int(params.get('limit', 100)), timeline.MAX_LIMIT))
+        except ValueError:
+            errors['limit'] = ['Must be an integer.']
+        if errors:
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+        entries = timeline.entries(start, end, kinds, student_id=student_id, descending=params.get('order') == 'desc', limit=limit)
+        return Response([{**entry, 'upcoming': entry['date'] >= today} for entry in entries])
+
+    @action(detail=False, methods=['get'], authentication_classes=[])
+    def calendar(self, request):
+        """A student's registrations as an iCalendar feed; ?token= from /api/students/me/calendar/."""
+        student = Student.objects.filter(pk=read_feed_token(request.query_params.get('token', ''))).first()
+        if student is None:
+            return Response({'error': 'Invalid calendar token'}, status=status.HTTP_403_FORBIDDEN)
+        rows = timeline.registrations(student.pk, timezone.localdate() - timeline.FEED_HISTORY)
+        response = HttpResponse(timeline.calendar(rows, f'Campus Connect - {student.name}', request.get_host()), content_type='text/calendar; charset=utf-8')
+        response['Content-Disposition'] = 'inline; filename="campcon.ics"'
         return response
+
+class AnalyticsViewSet(viewsets.ViewSet):
+    """Dashboard totals per drive, event, competition, department and status, from RegistrationStat."""
+
+    def list(self, request):
+        return Response(analytics.summary())
+
+class MetricsViewSet(viewsets.ViewSet):
+    """Counters and per-route timings of the worker process answering; local requests only."""
+    authentication_classes = []
+    permission_classes = [LocalOnly]
+
+    def list(self, request):
+        return Response({
+            **metrics.snapshot(),
+            'registration_concurrency': {'limit': registration_limiter.limit, 'in_flight': registration_limiter.in_flight},
+        })
+
+    @action(detail=False, methods=['get'])
+    def prometheus(self, request):
+        """The same in the Prometheus text format, for scraping."""
+        return HttpResponse(metrics.render_prometheus(), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -16,10 +16,21 @@ export function App() {
   const [currentUser, setCurrentUser] = useState<Student | null>(null);
 
   useEffect(() => {
+    apiClient.setUnauthorizedHandler(() => {
+      setCurrentUser(null);
+      setCurrentPage('login');
+    });
     const savedUser = storage.getCurrentUser();
     if (savedUser) {
       setCurrentUser(savedUser);
       setCurrentPage('student-dashboard');
+      // The token decides who is signed in: refresh the saved copy, or fall back to login on a 401
+      apiClient.getMe().then((student) => {
+        if (student) {
+          storage.setCurrentUser(student);
+          setCurrentUser(student);
+        }
+      });
     }
   }, []);
 
@@ -45,6 +56,7 @@ export function App() {
   };
 
   const handleLogout = () => {
+    apiClient.logout();
     storage.setCurrentUser(null);
     setCurrentUser(null);
     setCurrentPage('login');
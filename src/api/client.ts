@@ -1,5 +1,6 @@
 import axios from 'axios';
-import { Student, Placement, Event, PlacementRegistration, EventRegistration, AdminPlacement, AdminEvent } from '../types';
+import { Student, Placement, Event, PlacementRegistration, EventRegistration, AdminPlacement, AdminEvent, Analytics } from '../types';
+import { storage } from '../utils/storage';
 
 const API_URL = 'http://127.0.0.1:8000/api';
 
@@ -10,13 +11,51 @@ const api = axios.create({
     },
 });
 
+// Signed token returned by /students/login/, sent as a Bearer header
+const TOKEN_KEY = 'campcon_token';
+
+api.interceptors.request.use((config) => {
+    const token = localStorage.getItem(TOKEN_KEY);
+    if (token) {
+        config.headers.Authorization = `Bearer ${token}`;
+    }
+    return config;
+});
+
+// A 401 means the token expired (or SECRET_KEY was rotated): drop the session
+// so the app stops showing a signed-in user, and let it go back to the login page
+let onUnauthorized = () => {};
+
+api.interceptors.response.use(undefined, (error) => {
+    if (error.response?.status === 401) {
+        localStorage.removeItem(TOKEN_KEY);
+        storage.setCurrentUser(null);
+        onUnauthorized();
+    }
+    return Promise.reject(error);
+});
+
+// Registrations are answered with 429 and a Retry-After when the server is busy:
+// wait as told (with jitter, so clients do not come back in lockstep) and try a few more times
+const postWithRetry = async (url: string, data: any, config: any = {}, attempts = 3) => {
+    for (let attempt = 1; ; attempt++) {
+        try {
+            return await api.post(url, data, config);
+        } catch (error: any) {
+            if (error.response?.status !== 429 || attempt >= attempts) throw error;
+            const retryAfter = Number(error.response.headers['retry-after']) || 1;
+            await new Promise((resolve) => setTimeout(resolve, retryAfter * 1000 * (1 + Math.random())));
+        }
+    }
+};
+
 // Helpers to map Backend (snake_case) <-> Frontend (camelCase)
 const mapStudentFromBackend = (data: any): Student => {
     return {
         ...data,
         registerNumber: data.register_number || data.registerNumber,
         studentClass: data.student_class || data.class || data.studentClass,
-        historyOfArrears: data.history_of_arrears || data.historyOfArrears || 'No',
+        historyOfArrears: typeof data.history_of_arrears === 'boolean' ? (data.history_of_arrears ? 'Yes' : 'No') : (data.history_of_arrears || data.historyOfArrears || 'No'),
         tenthMarks: data.tenth_marks || data.tenthMarks || '',
         twelfthMarks: data.twelfth_marks || data.twelfthMarks || '',
         cgpa: data.cgpa || '',
@@ -50,6 +89,7 @@ export const apiClient = {
     login: async (registerNumber: string, password: string): Promise<Student | null> => {
         try {
             const response = await api.post('/students/login/', { register_number: registerNumber, password });
+            localStorage.setItem(TOKEN_KEY, response.data.token);
             return mapStudentFromBackend(response.data);
         } catch (error) {
             console.error('Login failed', error);
@@ -57,6 +97,24 @@ export const apiClient = {
         }
     },
 
+    logout: () => {
+        localStorage.removeItem(TOKEN_KEY);
+    },
+
+    // Called after a 401 has cleared the session
+    setUnauthorizedHandler: (handler: () => void) => {
+        onUnauthorized = handler;
+    },
+
+    getMe: async (): Promise<Student | null> => {
+        try {
+            const response = await api.get('/students/me/');
+            return mapStudentFromBackend(response.data);
+        } catch (error) {
+            return null;
+        }
+    },
+
     register: async (student: Student): Promise<Student | null> => {
         try {
             const data = mapStudentToBackend(student);
@@ -215,25 +273,84 @@ export const apiClient = {
             };
         }
 
-        const response = await api.post('/registrations/placements/', payload, { headers });
+        // Only the new registration's id is read (to attach the resume), skip its nested student/placement blocks
+        const response = await postWithRetry('/registrations/placements/', payload, { headers, params: { expand: '' } });
         return response.data;
     },
 
+    // Chunked, resumable resume upload; the stored file is then attached to the registration
+    uploadResume: async (registrationId: string, file: File): Promise<void> => {
+        const CHUNK_SIZE = 512 * 1024;
+        const upload = (await api.post('/resume-uploads/', { filename: file.name, size: file.size })).data;
+        let offset = 0;
+        let retries = 0;
+        while (offset < file.size) {
+            try {
+                const response = await api.put(`/resume-uploads/${upload.id}/chunk/`, file.slice(offset, offset + CHUNK_SIZE), {
+                    params: { offset },
+                    headers: { 'Content-Type': 'application/octet-stream' },
+                });
+                offset = response.data.received;
+                retries = 0;
+            } catch (error: any) {
+                if (retries >= 5) throw error;
+                retries += 1;
+                // Continue from whatever the server has stored
+                offset = error.response?.data?.received ?? (await api.get(`/resume-uploads/${upload.id}/`)).data.received;
+            }
+        }
+        await api.post(`/resume-uploads/${upload.id}/complete/`);
+        await api.post(`/resume-uploads/${upload.id}/attach/`, { registration: registrationId });
+    },
+
+    // Ranked full-text search over placements, events and competitions (every word matches as a prefix)
+    search: async (query: string, kinds?: Array<'placement' | 'event' | 'competition'>): Promise<Array<{ kind: string; id: number; title: string; date: string | null; excerpt: string; rank: number | null }>> => {
+        const params: Record<string, string> = { q: query };
+        if (kinds && kinds.length) params.kind = kinds.join(',');
+        const response = await api.get('/search/', { params });
+        return response.data;
+    },
+
+    // Placements and events dated within [from, to] (YYYY-MM-DD), merged and sorted server-side
+    getTimeline: async (from: string, to: string, studentId?: string): Promise<Array<{ kind: 'placement' | 'event'; id: number; title: string; date: string; time: string; venue: string; upcoming: boolean }>> => {
+        const params: Record<string, string> = { from, to };
+        if (studentId) params.student = studentId;
+        const response = await api.get('/timeline/', { params });
+        return response.data;
+    },
+
+    // Subscription URL of the signed-in student's .ics feed of their registrations
+    getCalendarUrl: async (): Promise<string> => {
+        const response = await api.get('/students/me/calendar/');
+        return response.data.url;
+    },
+
+    // Dashboard totals, aggregated server-side (one small response whatever the number of registrations)
+    getAnalytics: async (): Promise<Analytics> => {
+        const response = await api.get('/analytics/');
+        return response.data;
+    },
+
+    // Streamed ZIP of a drive's resumes with an index.csv; used as a plain link so the browser streams it to disk
+    getResumeBundleUrl: (placementId: string, roleName?: string): string => {
+        const params = new URLSearchParams({ placement: String(placementId) });
+        if (roleName) params.set('role_name', roleName);
+        return `${API_URL}/registrations/placements/resumes/?${params}`;
+    },
+
     registerEvent: async (registration: any): Promise<EventRegistration> => {
         const backendData = {
             student: registration.studentId,
             event: registration.eventId,
             competition: registration.competitionId
         };
-        const response = await api.post('/registrations/events/', backendData);
+        const response = await postWithRetry('/registrations/events/', backendData, { params: { expand: '' } });
         return response.data;
     },
 
     getStudentPlacementRegistrations: async (studentId: string): Promise<PlacementRegistration[]> => {
-        const response = await api.get('/registrations/placements/');
-        // Filter locally for now
+        const response = await api.get('/registrations/placements/', { params: { student: studentId } });
         return response.data
-            .filter((r: any) => r.student === parseInt(studentId) || r.student_details?.id === parseInt(studentId))
             .map((r: any) => ({
                 ...r,
                 studentId: r.student,
@@ -248,9 +365,8 @@ export const apiClient = {
     },
 
     getStudentEventRegistrations: async (studentId: string): Promise<EventRegistration[]> => {
-        const response = await api.get('/registrations/events/');
+        const response = await api.get('/registrations/events/', { params: { student: studentId } });
         return response.data
-            .filter((r: any) => r.student === parseInt(studentId) || r.student_details?.id === parseInt(studentId))
             .map((r: any) => ({
                 ...r,
                 studentId: r.student,
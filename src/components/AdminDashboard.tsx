@@ -1,5 +1,5 @@
 import { useState, useEffect } from 'react';
-import { Student, PlacementRegistration, EventRegistration, AdminPlacement, AdminEvent, AdminCompetition, Placement, Event } from '../types';
+import { Student, PlacementRegistration, EventRegistration, AdminPlacement, AdminEvent, AdminCompetition, Placement, Event, Analytics } from '../types';
 import { apiClient } from '../api/client';
 
 interface AdminDashboardProps {
@@ -9,7 +9,7 @@ interface AdminDashboardProps {
 const ADMIN_EMAIL = 'rajayanand54@gmail.com';
 
 export function AdminDashboard({ onLogout }: AdminDashboardProps) {
-  const [activeTab, setActiveTab] = useState<'students' | 'placements' | 'events' | 'add-placement' | 'add-event'>('students');
+  const [activeTab, setActiveTab] = useState<'students' | 'placements' | 'events' | 'analytics' | 'add-placement' | 'add-event'>('students');
   const [students, setStudents] = useState<Student[]>([]);
   const [placementRegistrations, setPlacementRegistrations] = useState<PlacementRegistration[]>([]);
   const [eventRegistrations, setEventRegistrations] = useState<EventRegistration[]>([]);
@@ -19,6 +19,7 @@ export function AdminDashboard({ onLogout }: AdminDashboardProps) {
   // Combined placements and events from API
   const [placements, setPlacements] = useState<Placement[]>([]);
   const [events, setEvents] = useState<Event[]>([]);
+  const [analytics, setAnalytics] = useState<Analytics | null>(null);
 
   // Add placement form
   const [newPlacement, setNewPlacement] = useState({
@@ -57,12 +58,13 @@ export function AdminDashboard({ onLogout }: AdminDashboardProps) {
 
   const fetchData = async () => {
     try {
-      const [studentsData, placementsData, eventsData, pRegs, eRegs] = await Promise.all([
+      const [studentsData, placementsData, eventsData, pRegs, eRegs, analyticsData] = await Promise.all([
         apiClient.getAllStudents(),
         apiClient.getPlacements(),
         apiClient.getEvents(),
         apiClient.getAllPlacementRegistrations(),
-        apiClient.getAllEventRegistrations()
+        apiClient.getAllEventRegistrations(),
+        apiClient.getAnalytics()
       ]);
 
       setStudents(studentsData);
@@ -70,6 +72,7 @@ export function AdminDashboard({ onLogout }: AdminDashboardProps) {
       setEvents(eventsData);
       setPlacementRegistrations(pRegs);
       setEventRegistrations(eRegs);
+      setAnalytics(analyticsData);
     } catch (error) {
       console.error("Error fetching admin data:", error);
     }
@@ -363,6 +366,7 @@ export function AdminDashboard({ onLogout }: AdminDashboardProps) {
               { id: 'students', label: '👥 Students', count: students.length },
               { id: 'placements', label: '🏢 Placements', count: placementRegistrations.length },
               { id: 'events', label: '🎉 Events', count: eventRegistrations.length },
+              { id: 'analytics', label: '📊 Analytics' },
               { id: 'add-placement', label: '➕ Add Placement', icon: '➕' },
               { id: 'add-event', label: '➕ Add Event', icon: '➕' }
             ].map(tab => (
@@ -524,6 +528,14 @@ export function AdminDashboard({ onLogout }: AdminDashboardProps) {
                             >
                               📊 Export List
                             </button>
+                            {data.placement && (
+                              <a
+                                href={apiClient.getResumeBundleUrl(data.placement.id, data.role)}
+                                className="px-3 py-1 bg-white/20 text-white rounded-lg text-sm font-semibold hover:bg-white/30 transition-all flex items-center gap-2"
+                              >
+                                📦 Resumes
+                              </a>
+                            )}
                             <div className="bg-white/20 px-4 py-2 rounded-xl">
                               <p className="text-2xl font-bold text-white">{data.count}</p>
                               <p className="text-xs text-white/80">Students</p>
@@ -722,6 +734,119 @@ export function AdminDashboard({ onLogout }: AdminDashboardProps) {
           </div>
         )}
 
+        {/* Analytics Tab */}
+        {activeTab === 'analytics' && (
+          <div>
+            <h2 className="text-3xl font-bold text-gray-800 mb-6">📊 Analytics</h2>
+            {!analytics ? (
+              <div className="bg-white rounded-2xl shadow-lg p-8 text-center">
+                <p className="text-gray-500 text-lg">Loading analytics...</p>
+              </div>
+            ) : (
+              <div className="space-y-6">
+                <div className="grid grid-cols-2 md:grid-cols-5 gap-4">
+                  {([
+                    ['Students', analytics.totals.students],
+                    ['Placement Drives', analytics.totals.placements],
+                    ['Placement Registrations', analytics.totals.placement_registrations],
+                    ['Events', analytics.totals.events],
+                    ['Event Registrations', analytics.totals.event_registrations]
+                  ] as Array<[string, number]>).map(([label, value]) => (
+                    <div key={label} className="bg-white rounded-2xl shadow-lg p-4 text-center">
+                      <p className="text-3xl font-bold text-gray-800">{value}</p>
+                      <p className="text-sm text-gray-500">{label}</p>
+                    </div>
+                  ))}
+                </div>
+
+                <div className="bg-white rounded-2xl shadow-lg p-6 overflow-x-auto">
+                  <h3 className="text-xl font-bold text-gray-800 mb-4">🏢 Registrations per Drive</h3>
+                  <table className="w-full">
+                    <thead>
+                      <tr className="border-b">
+                        <th className="text-left py-3 px-4 text-sm font-semibold text-gray-700">Company</th>
+                        <th className="text-left py-3 px-4 text-sm font-semibold text-gray-700">Registrations</th>
+                        {analytics.statuses.map(s => (
+                          <th key={s.status} className="text-left py-3 px-4 text-sm font-semibold text-gray-700">{s.status}</th>
+                        ))}
+                      </tr>
+                    </thead>
+                    <tbody>
+                      {analytics.placements.map(p => (
+                        <tr key={p.id} className="border-b hover:bg-gray-50">
+                          <td className="py-3 px-4 text-sm text-gray-800">{p.company_name}</td>
+                          <td className="py-3 px-4 text-sm font-semibold text-gray-800">{p.registrations}</td>
+                          {analytics.statuses.map(s => (
+                            <td key={s.status} className="py-3 px-4 text-sm text-gray-800">{p.by_status[s.status] || 0}</td>
+                          ))}
+                        </tr>
+                      ))}
+                    </tbody>
+                  </table>
+                </div>
+
+                <div className="grid md:grid-cols-2 gap-6">
+                  <div className="bg-white rounded-2xl shadow-lg p-6">
+                    <h3 className="text-xl font-bold text-gray-800 mb-4">🎯 Placement Status</h3>
+                    <table className="w-full">
+                      <tbody>
+                        {analytics.statuses.map(s => (
+                          <tr key={s.status} className="border-b">
+                            <td className="py-3 px-4 text-sm text-gray-800">{s.status}</td>
+                            <td className="py-3 px-4 text-sm font-semibold text-gray-800">{s.count}</td>
+                            <td className="py-3 px-4 text-sm text-gray-500">{(s.share * 100).toFixed(1)}%</td>
+                          </tr>
+                        ))}
+                      </tbody>
+                    </table>
+                  </div>
+                  <div className="bg-white rounded-2xl shadow-lg p-6">
+                    <h3 className="text-xl font-bold text-gray-800 mb-4">🎓 By Department</h3>
+                    <table className="w-full">
+                      <thead>
+                        <tr className="border-b">
+                          <th className="text-left py-3 px-4 text-sm font-semibold text-gray-700">Department</th>
+                          <th className="text-left py-3 px-4 text-sm font-semibold text-gray-700">Placements</th>
+                          <th className="text-left py-3 px-4 text-sm font-semibold text-gray-700">Events</th>
+                        </tr>
+                      </thead>
+                      <tbody>
+                        {analytics.departments.map(d => (
+                          <tr key={d.department} className="border-b">
+                            <td className="py-3 px-4 text-sm text-gray-800">{d.department}</td>
+                            <td className="py-3 px-4 text-sm text-gray-800">{d.placement_registrations}</td>
+                            <td className="py-3 px-4 text-sm text-gray-800">{d.event_registrations}</td>
+                          </tr>
+                        ))}
+                      </tbody>
+                    </table>
+                  </div>
+                </div>
+
+                <div className="bg-white rounded-2xl shadow-lg p-6">
+                  <h3 className="text-xl font-bold text-gray-800 mb-4">🎉 Registrations per Event</h3>
+                  <div className="space-y-4">
+                    {analytics.events.map(e => (
+                      <div key={e.id}>
+                        <div className="flex justify-between font-semibold text-gray-800">
+                          <span>{e.event_name}</span>
+                          <span>{e.registrations}</span>
+                        </div>
+                        {e.competitions.map(c => (
+                          <div key={c.id} className="flex justify-between text-sm text-gray-600 pl-4">
+                            <span>{c.name}</span>
+                            <span>{c.registrations}</span>
+                          </div>
+                        ))}
+                      </div>
+                    ))}
+                  </div>
+                </div>
+              </div>
+            )}
+          </div>
+        )}
+
         {/* Add Placement Tab */}
         {activeTab === 'add-placement' && (
           <div className="max-w-2xl mx-auto">
@@ -76,8 +76,10 @@ export function LoginPage({ onStudentLogin, onAdminLogin, onSwitchToRegister }:
       const existingStudent = allStudents.find(s => s.email === email);
 
       if (existingStudent) {
-        storage.setCurrentUser(existingStudent);
-        onStudentLogin(existingStudent);
+        // The backend cannot verify Google accounts yet, so it issues no token for them:
+        // registrations and profile edits need the register number and password sign-in
+        setRegisterNumber(existingStudent.registerNumber);
+        setError('Welcome back! Enter your password to sign in.');
       } else {
         // Redirect to register, pre-filling email
         // We can pass state to parent or alert user.
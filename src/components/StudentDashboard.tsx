@@ -73,29 +73,34 @@ export function StudentDashboard({ student, onLogout }: StudentDashboardProps) {
 
   useEffect(() => {
     checkUpcomingEvents();
-  }, [allPlacements, allEvents]);
+  }, [student.id]);
 
-  const checkUpcomingEvents = () => {
+  // Asks the server for the next three days only, rather than filtering every drive and event
+  const checkUpcomingEvents = async () => {
+    const isoDate = (date: Date) => `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}-${String(date.getDate()).padStart(2, '0')}`;
     const today = new Date();
+    const inThreeDays = new Date(today.getTime() + 3 * 24 * 60 * 60 * 1000);
+    try {
+      const upcoming = await apiClient.getTimeline(isoDate(today), isoDate(inThreeDays));
+      if (upcoming.length > 0) {
+        setNotification('🔔 Upcoming: ' + upcoming.map(entry => entry.title).join(', '));
+        setTimeout(() => setNotification(''), 8000);
+      }
+    } catch (error) {
+      console.error('Error fetching upcoming drives and events:', error);
+    }
+  };
 
-    const upcomingPlacements = allPlacements.filter(p => {
-      const eventDate = new Date(p.date);
-      const diffDays = Math.ceil((eventDate.getTime() - today.getTime()) / (1000 * 60 * 60 * 24));
-      return diffDays >= 0 && diffDays <= 3;
-    });
-
-    const upcomingEvents = allEvents.filter(e => {
-      const eventDate = new Date(e.date);
-      const diffDays = Math.ceil((eventDate.getTime() - today.getTime()) / (1000 * 60 * 60 * 24));
-      return diffDays >= 0 && diffDays <= 3;
-    });
-
-    if (upcomingPlacements.length > 0 || upcomingEvents.length > 0) {
-      let message = '🔔 Upcoming: ';
-      const items = [...upcomingPlacements.map(p => p.companyName), ...upcomingEvents.map(e => e.eventName)];
-      message += items.join(', ');
-      setNotification(message);
+  // Copies the student's .ics subscription URL, for Google Calendar / Outlook "add by URL"
+  const handleSubscribeCalendar = async () => {
+    try {
+      const url = await apiClient.getCalendarUrl();
+      await navigator.clipboard.writeText(url);
+      setNotification('📅 Calendar link copied! Add it to your calendar app by URL.');
       setTimeout(() => setNotification(''), 8000);
+    } catch (error) {
+      console.error('Error fetching the calendar link:', error);
+      alert('Could not get your calendar link. Please try again.');
     }
   };
 
@@ -159,18 +164,23 @@ export function StudentDashboard({ student, onLogout }: StudentDashboardProps) {
     }
 
     try {
-      const formData = new FormData();
-      formData.append('student', student.id.toString());
-      formData.append('placement', selectedPlacement.id.toString());
-      formData.append('role_name', selectedRole);
-      formData.append('resume_name', resumeFile?.name || '');
+      const registration = await apiClient.registerPlacement({
+        studentId: student.id,
+        placementId: selectedPlacement.id,
+        roleName: selectedRole,
+        resumeName: resumeFile?.name || '',
+      });
 
+      // Uploaded separately in chunks so a slow or dropped upload does not lose the registration
       if (resumeFile) {
-        formData.append('resume', resumeFile);
+        try {
+          await apiClient.uploadResume(registration.id, resumeFile);
+        } catch (uploadError) {
+          console.error(uploadError);
+          alert('Registered, but the resume upload failed.');
+        }
       }
 
-      await apiClient.registerPlacement(formData);
-
       setShowPlacementForm(false);
       setNotification('✅ Successfully applied for ' + selectedRole + ' at ' + selectedPlacement.companyName);
       setTimeout(() => setNotification(''), 5000);
@@ -320,6 +330,12 @@ export function StudentDashboard({ student, onLogout }: StudentDashboardProps) {
               >
                 My Profile
               </button>
+              <button
+                onClick={handleSubscribeCalendar}
+                className="px-4 py-2 bg-white border border-purple-500 text-purple-600 rounded-xl font-semibold hover:shadow-lg transition-all"
+              >
+                Calendar Link
+              </button>
               <button
                 onClick={onLogout}
                 className="px-4 py-2 bg-red-500 text-white rounded-xl font-semibold hover:bg-red-600 transition-all"
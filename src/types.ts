@@ -55,6 +55,7 @@ export interface AdminCompetition {
   prize: string;
   teamSize?: string;
   type?: 'Individual' | 'Team' | 'Individual/Team';
+  capacity?: number | null; // null = unlimited
 }
 
 export interface Admin {
@@ -107,6 +108,7 @@ export interface PlacementRegistration {
   resume?: string;
   resumeName?: string;
   registeredAt: string;
+  waitlisted?: boolean; // role was full when registering
   studentDetails: {
     name: string;
     registerNumber: string;
@@ -130,6 +132,7 @@ export interface EventRegistration {
   eventId: string;
   competitionId: string;
   registeredAt: string;
+  waitlisted?: boolean; // competition was full when registering
   studentDetails: {
     name: string;
     registerNumber: string;
@@ -147,4 +150,24 @@ export interface EventRegistration {
   };
 }
 
+// GET /api/analytics/ (server field names)
+export interface Analytics {
+  totals: {
+    students: number;
+    placements: number;
+    events: number;
+    placement_registrations: number;
+    event_registrations: number;
+  };
+  placements: Array<{ id: number; company_name: string; registrations: number; by_status: Record<string, number> }>;
+  events: Array<{
+    id: number;
+    event_name: string;
+    registrations: number;
+    competitions: Array<{ id: number; name: string; registrations: number }>;
+  }>;
+  departments: Array<{ department: string; placement_registrations: number; event_registrations: number }>;
+  statuses: Array<{ status: string; count: number; share: number }>;
+}
+
 export type UserRole = 'student' | 'admin' | null;